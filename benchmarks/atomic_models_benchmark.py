@@ -0,0 +1,260 @@
+"""
+Cost per event of each AtomicDEVS model versus its load
+
+Each model is driven directly, in a minimal coupled model:
+    Feeder (a fixed schedule of input events) -> model -> Drain (absorbs all output events)
+The load is set up in the initial state of the model, or kept up by the Feeder:
+    uni_waterway: N vessels in flight (the vessels enter evenly spaced over the travel time)
+    uni_canal:    a convoy of N vessels (idem)
+    lock:         a backlog of N waiting vessels at each water level (lock A of PortNetwork),
+                  replenished with about as many vessels as leave (so the backlog stays about the same)
+    control_tower: N full docks, then each operation releases a spot in a random dock and requests a spot again
+    confluence:   N ports (each leads to one dock), the vessels enter on a random port towards a random dock
+
+Only the methods of the model itself are timed (see Instrumentation), not the Feeder, Drain and simulator
+So, a cost per event that grows with the load points to a complexity regression in that model
+
+Usage:
+    python benchmarks/atomic_models_benchmark.py
+    python benchmarks/atomic_models_benchmark.py --models lock confluence --loads 10 1000
+"""
+from pypdevs.simulator import Simulator
+from pypdevs.DEVS import AtomicDEVS, CoupledDEVS
+from pypdevs.infinity import INFINITY
+
+from dataclasses import dataclass
+import argparse
+import random
+import time
+
+from models.confluence import Confluence
+from models.control_tower import ControlTower
+from models.lock import Lock
+from models.messages import PortDepartureRequest, PortEntryRequest
+from models.uni_canal import UniCanal
+from models.uni_waterway import UniWaterway
+from models.utils.instrumentation import Instrumentation
+from models.utils.math import get_time_in_seconds
+from models.vessels import ALL_VESSELS, VESSEL_WEIGHTS
+
+# The loads (N) per model
+LOADS = {
+    "uni_waterway": [10, 100, 1000, 10000],
+    "uni_canal": [10, 100, 1000, 10000],
+    "lock": [10, 100, 1000, 10000],
+    "control_tower": [8, 64, 512, 4096],
+    "confluence": [2, 8, 32, 128],
+}
+
+# The minimum number of input events per run
+NUM_INPUTS = 20000
+
+DISTANCE_IN_KM = 50
+NUM_LOCK_CYCLES = 1000
+# Lock A transfers about 12.7 vessels each lock shift interval (with the vessel type weights of the Generator)
+NUM_ARRIVALS_PER_LOCK_CYCLE = 12
+
+
+@dataclass
+class FeederState:
+    # The index of the next event in the schedule
+    index: int = 0
+    current_time: float = 0.0
+
+
+@dataclass
+class DrainState:
+    num_outputs: int = 0
+
+
+class Feeder(AtomicDEVS):
+    """
+    Sends a fixed schedule of input events
+    The schedule is a list of (time, port_name, message), sorted by time
+    Messages at the same time are sent one after the other (in zero time)
+    """
+    def __init__(self, name, port_names: list[str], schedule: list[tuple[float, str, object]]):
+        super(Feeder, self).__init__(name)
+        self.out_ports = {port_name: self.addOutPort(port_name) for port_name in port_names}
+        self.schedule = schedule
+        self.state = FeederState()
+
+    def timeAdvance(self):
+        if self.state.index == len(self.schedule):
+            return INFINITY
+        return self.schedule[self.state.index][0] - self.state.current_time
+
+    def outputFnc(self):
+        _, port_name, message = self.schedule[self.state.index]
+        return {self.out_ports[port_name]: message}
+
+    def intTransition(self):
+        self.state.current_time = self.schedule[self.state.index][0]
+        self.state.index += 1
+        return self.state
+
+
+class Drain(AtomicDEVS):
+    """
+    Absorbs the output events of the model
+    """
+    def __init__(self, name):
+        super(Drain, self).__init__(name)
+        self.in_port = self.addInPort("in")
+        self.state = DrainState()
+
+    def extTransition(self, inputs):
+        self.state.num_outputs += 1
+        return self.state
+
+
+class Harness(CoupledDEVS):
+    """
+    Feeder -> model -> Drain
+    in_ports and out_ports map the port names of the Feeder to the input ports of the model,
+    and list the output ports of the model
+    """
+    def __init__(self, name, model, in_ports: dict, out_ports: list, schedule):
+        CoupledDEVS.__init__(self, name)
+        self.model = self.addSubModel(model)
+        self.feeder = self.addSubModel(Feeder("feeder", list(in_ports), schedule))
+        self.drain = self.addSubModel(Drain("drain"))
+        for port_name, in_port in in_ports.items():
+            self.connectPorts(self.feeder.out_ports[port_name], in_port)
+        for out_port in out_ports:
+            self.connectPorts(out_port, self.drain.in_port)
+
+
+def random_vessel(rng: random.Random, uid: int, creation_time: float = 0.0, **kwargs):
+    return rng.choices(ALL_VESSELS, VESSEL_WEIGHTS)[0](uid=uid, creation_time=creation_time, **kwargs)
+
+
+def get_max_travel_time():
+    # The travel time of the slowest vessel type
+    slowest = min(vessel_ctor.spec.avg_velocity for vessel_ctor in ALL_VESSELS)
+    return get_time_in_seconds(distance_in_km=DISTANCE_IN_KM, velocity_in_knot=slowest)
+
+
+def make_flow_schedule(rng: random.Random, load: int):
+    # About load vessels in flight: one vessel enters every travel time / load seconds
+    num_vessels = max(NUM_INPUTS, 3 * load)
+    interval = get_max_travel_time() / load
+    return [(i * interval, "in", random_vessel(rng, i, i * interval)) for i in range(num_vessels)]
+
+
+def make_uni_waterway(rng: random.Random, load: int):
+    model = UniWaterway("uni_waterway", DISTANCE_IN_KM)
+    return Harness("system", model, {"in": model.in_vessel}, [model.out_vessel], make_flow_schedule(rng, load))
+
+
+def make_uni_canal(rng: random.Random, load: int):
+    model = UniCanal("uni_canal", DISTANCE_IN_KM)
+    return Harness("system", model, {"in": model.in_vessel}, [model.out_vessel], make_flow_schedule(rng, load))
+
+
+def make_lock(rng: random.Random, load: int):
+    model = Lock("lock", 20*60, 60*60, 7*60, 62500)
+
+    # The initial backlog
+    uid = 0
+    for vessels_waiting in [model.state.vessels_waiting_low, model.state.vessels_waiting_high]:
+        for _ in range(load):
+            vessels_waiting.append(random_vessel(rng, uid))
+            uid += 1
+
+    # The Lock receives one vessel per input event, so the arrivals are spread over each lock shift interval
+    # alternating between the water levels
+    schedule = []
+    interval = model.lock_shift_interval / NUM_ARRIVALS_PER_LOCK_CYCLE
+    for i in range(NUM_LOCK_CYCLES * NUM_ARRIVALS_PER_LOCK_CYCLE):
+        schedule.append((i * interval, "low" if i % 2 == 0 else "high", random_vessel(rng, uid, i * interval)))
+        uid += 1
+
+    return Harness("system", model, {"low": model.in_low, "high": model.in_high},
+                   [model.out_low, model.out_high], schedule)
+
+
+def make_control_tower(rng: random.Random, load: int):
+    docks = [f"dock_{i}" for i in range(load)]
+    model = ControlTower("control_tower", {dock: 1 for dock in docks})
+
+    # All the docks are full
+    for dock in docks:
+        model.state.dock_allocation_policy.reserve(dock)
+
+    # Release a spot in a random dock, and request a spot again (this gets the spot that was just released)
+    schedule = []
+    for i in range(NUM_INPUTS // 2):
+        schedule.append((i, "depart", PortDepartureRequest(dock=rng.choice(docks))))
+        schedule.append((i + 0.5, "entry", PortEntryRequest(vessel_uid=i)))
+
+    return Harness("system", model,
+                   {"entry": model.in_port_entry_request, "depart": model.in_port_depart_request},
+                   [model.out_port_entry_permission], schedule)
+
+
+def make_confluence(rng: random.Random, load: int):
+    port_names = [f"port_{i}" for i in range(load)]
+    model = Confluence("confluence", {port_name: [f"dock_{i}"] for i, port_name in enumerate(port_names)})
+
+    schedule = []
+    for i in range(NUM_INPUTS):
+        vessel = random_vessel(rng, i, i, destination_dock=f"dock_{rng.randrange(load)}")
+        schedule.append((i, rng.choice(port_names), vessel))
+
+    return Harness("system", model, model.in_vessel_ports, list(model.out_vessel_ports.values()), schedule)
+
+
+MAKE_HARNESS = {
+    "uni_waterway": make_uni_waterway,
+    "uni_canal": make_uni_canal,
+    "lock": make_lock,
+    "control_tower": make_control_tower,
+    "confluence": make_confluence,
+}
+
+
+def run(model_name: str, load: int, seed: int = 0) -> dict:
+    system = MAKE_HARNESS[model_name](random.Random(seed), load)
+    instrumentation = Instrumentation(system.model)
+
+    sim = Simulator(system)
+    sim.setTerminationTime(system.feeder.schedule[-1][0] + 2 * get_max_travel_time())
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+
+    start = time.perf_counter()
+    sim.simulate()
+    wall_time = time.perf_counter() - start
+
+    model_stats = instrumentation.stats[system.model]
+    events = model_stats.methods["intTransition"].calls + model_stats.methods["extTransition"].calls
+    return {
+        "model": model_name,
+        "load": load,
+        "events": events,
+        "model_time_per_event": model_stats.total_time / 1e9 / events,
+        "max_method_time": max(method_stats.max_time for method_stats in model_stats.methods.values()) / 1e9,
+        "wall_time_per_event": wall_time / events,
+        "outputs": system.drain.state.num_outputs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", nargs="+", choices=list(MAKE_HARNESS), default=list(MAKE_HARNESS))
+    parser.add_argument("--loads", type=int, nargs="+", help="the loads for all models (default: LOADS)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'model':<16}{'load':>8}{'events':>10}{'outputs':>10}{'us/event':>10}{'max us':>10}{'wall us/event':>15}")
+    for model_name in args.models:
+        for load in args.loads if args.loads is not None else LOADS[model_name]:
+            result = run(model_name, load, args.seed)
+            print(f"{model_name:<16}{load:>8}{result['events']:>10}{result['outputs']:>10}"
+                  f"{result['model_time_per_event'] * 1e6:>10.2f}{result['max_method_time'] * 1e6:>10.1f}"
+                  f"{result['wall_time_per_event'] * 1e6:>15.2f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Allocation cost of each DockAllocationPolicy versus the number of docks
+
+Each dock has a capacity of 50 vessels (as in PortNetwork)
+The port is filled to 90%, then each operation releases a spot in a random dock and allocates a spot again
+
+Usage:
+    python benchmarks/dock_allocation_benchmark.py
+"""
+import random
+import time
+
+from models.messages import PortEntryRequest
+from models.dock_allocation import (
+    FirstAvailablePolicy,
+    LeastLoadedPolicy,
+    RoundRobinPolicy,
+    ShortestRoutePolicy,
+    VesselTypeAwarePolicy,
+)
+from models.vessels import ALL_VESSELS
+
+DOCK_COUNTS = [8, 64, 512, 4096, 32768]
+CAPACITY = 50
+NUM_OPERATIONS = 20000
+
+
+def make_policies(docks_capacities):
+    docks = list(docks_capacities)
+    rng = random.Random(0)
+    route_lengths = {dock: rng.uniform(100, 150) for dock in docks}
+    # Each vessel type prefers a different quarter of the docks
+    quarter = max(len(docks) // 4, 1)
+    preferred_docks = {
+        vessel_ctor.vessel_type: docks[i * quarter:(i + 1) * quarter] for i, vessel_ctor in enumerate(ALL_VESSELS)
+    }
+    return {
+        "first_available": lambda: FirstAvailablePolicy(docks_capacities),
+        "least_loaded": lambda: LeastLoadedPolicy(docks_capacities),
+        "round_robin": lambda: RoundRobinPolicy(docks_capacities),
+        "shortest_route": lambda: ShortestRoutePolicy(docks_capacities, route_lengths),
+        "vessel_type_aware": lambda: VesselTypeAwarePolicy(docks_capacities, preferred_docks),
+    }
+
+
+def run(policy, num_docks):
+    rng = random.Random(1)
+    vessel_types = [vessel_ctor.vessel_type for vessel_ctor in ALL_VESSELS]
+    requests = [PortEntryRequest(vessel_uid=uid, vessel_type=rng.choice(vessel_types)) for uid in range(1000)]
+
+    # Fill the port to 90%, and remember where the vessels are
+    occupied = []
+    for uid in range(int(0.9 * num_docks * CAPACITY)):
+        dock = policy.select_dock(requests[uid % len(requests)])
+        policy.reserve(dock)
+        occupied.append(dock)
+
+    # Measure release + allocate
+    releases = [rng.randrange(len(occupied)) for _ in range(NUM_OPERATIONS)]
+    start = time.perf_counter()
+    for i, index in enumerate(releases):
+        policy.release(occupied[index])
+        dock = policy.select_dock(requests[i % len(requests)])
+        policy.reserve(dock)
+        occupied[index] = dock
+    return (time.perf_counter() - start) / NUM_OPERATIONS
+
+
+def main():
+    print(f"{'policy':<20}" + "".join(f"{num_docks:>12}" for num_docks in DOCK_COUNTS))
+    results = {}
+    for num_docks in DOCK_COUNTS:
+        docks_capacities = {str(i + 1): CAPACITY for i in range(num_docks)}
+        for name, make_policy in make_policies(docks_capacities).items():
+            results.setdefault(name, []).append(run(make_policy(), num_docks))
+
+    # Microseconds per release + allocate
+    for name, costs in results.items():
+        print(f"{name:<20}" + "".join(f"{cost * 1e6:>10.2f}us" for cost in costs))
+
+
+if __name__ == "__main__":
+    main()
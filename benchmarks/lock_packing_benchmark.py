@@ -0,0 +1,67 @@
+"""
+Lock utilization versus wall-clock cost per cycle of each ChamberPackingStrategy
+
+Each cycle, a random number of vessels arrive (with the vessel type weights of the Generator),
+and the strategy fills the chamber of lock A (62500 square metre) from the waiting vessels
+The arrivals (about 69000 square metre per cycle) exceed the surface area, so a backlog builds up
+
+Usage:
+    python benchmarks/lock_packing_benchmark.py
+"""
+import random
+import time
+
+from models.lock_packing import (
+    BestFitStrategy,
+    FirstFitDecreasingStrategy,
+    FirstFitStrategy,
+    KnapsackStrategy,
+)
+from models.utils.waiting_queue import WaitingQueue
+from models.vessels import ALL_VESSELS, VESSEL_WEIGHTS
+
+SURFACE_AREA = 62500
+NUM_CYCLES = 2000
+NUM_ARRIVALS_PER_CYCLE = 15
+
+
+def make_strategies():
+    return {
+        "first_fit": FirstFitStrategy(),
+        "first_fit_decreasing": FirstFitDecreasingStrategy(window=64),
+        "best_fit": BestFitStrategy(window=64),
+        "knapsack": KnapsackStrategy(window=32, time_limit=0.01),
+    }
+
+
+def run(strategy):
+    rng = random.Random(0)
+    queue = WaitingQueue()
+    uid = 0
+    used_surface_area = 0
+    select_time = 0.0
+    for _ in range(NUM_CYCLES):
+        for _ in range(rng.randrange(2 * NUM_ARRIVALS_PER_CYCLE + 1)):
+            queue.append(rng.choices(ALL_VESSELS, VESSEL_WEIGHTS)[0](uid=uid, creation_time=uid))
+            uid += 1
+
+        start = time.perf_counter()
+        positions = strategy.select(queue, SURFACE_AREA)
+        select_time += time.perf_counter() - start
+
+        for position in positions:
+            used_surface_area += queue.remove(position).surface_area
+
+    utilization = used_surface_area / (NUM_CYCLES * SURFACE_AREA)
+    return utilization, len(queue), select_time / NUM_CYCLES
+
+
+def main():
+    print(f"{'strategy':<24}{'utilization':>12}{'backlog':>10}{'cost/cycle':>14}")
+    for name, strategy in make_strategies().items():
+        utilization, backlog, cost = run(strategy)
+        print(f"{name:<24}{utilization:>12.3f}{backlog:>10}{cost * 1e6:>12.1f}us")
+
+
+if __name__ == "__main__":
+    main()
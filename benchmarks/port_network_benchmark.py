@@ -0,0 +1,132 @@
+"""
+Scaling of the full PortNetwork with the number of generated vessels
+
+Each run simulates until all vessels left the port (at the Sea), with fixed seeds for random and np.random
+The statistics are accumulated online (keep_vessels=False), so the memory does not grow with the vessels that left
+Each run is done in a fresh process, so that the peak RSS is of that run only
+
+Reported per run:
+    events: the number of transitions (internal + external) of all AtomicDEVS
+    wall time, events/s, wall time per vessel, and the peak RSS
+
+Usage:
+    python benchmarks/port_network_benchmark.py
+    python benchmarks/port_network_benchmark.py --sizes 1000 10000 --seeds 0 1 --output port_network.json
+"""
+from pypdevs.simulator import Simulator
+from pypdevs.DEVS import AtomicDEVS
+
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+import numpy as np
+
+from models.port_network import PortNetwork
+
+SIZES = [1000, 10000, 100000, 1000000]
+SEEDS = [0]
+
+
+def count_transitions(model, counter: list[int]):
+    # Count the transitions of all the AtomicDEVS in counter[0]
+    # The counting wrappers are on the instances, and cost about the same for every model
+    if isinstance(model, AtomicDEVS):
+        for method_name in ["intTransition", "extTransition"]:
+            method = getattr(model, method_name)
+
+            def wrapper(*args, method=method):
+                counter[0] += 1
+                return method(*args)
+            setattr(model, method_name, wrapper)
+    else:
+        for submodel in model.component_set:
+            count_transitions(submodel, counter)
+
+
+def all_vessels_left(clock, model):
+    return model.sea_collector.state.statistics.overall["time_in_system"].count == model.num_vessels
+
+
+def run(num_vessels: int, seed: int) -> dict:
+    random.seed(seed)
+    np.random.seed(seed)
+
+    system = PortNetwork(name="system", num_vessels=num_vessels, keep_vessels=False)
+    counter = [0]
+    count_transitions(system, counter)
+
+    sim = Simulator(system)
+    sim.setTerminationCondition(all_vessels_left)
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+
+    start = time.perf_counter()
+    sim.simulate()
+    wall_time = time.perf_counter() - start
+
+    statistics = system.sea_collector.state.statistics
+    return {
+        "num_vessels": num_vessels,
+        "seed": seed,
+        "events": counter[0],
+        "wall_time": wall_time,
+        "events_per_second": counter[0] / wall_time,
+        "wall_time_per_vessel": wall_time / num_vessels,
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "avg_time_in_system": statistics.overall["time_in_system"].mean,
+        "avg_waiting_time_in_anchor_point": statistics.overall["waiting_time_in_anchor_point"].mean,
+    }
+
+
+def run_in_fresh_process(num_vessels: int, seed: int) -> dict:
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run, num_vessels, seed).result()
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--seeds", type=int, nargs="+", default=SEEDS)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    print(f"{'vessels':>10}{'seed':>6}{'events':>12}{'wall s':>10}{'events/s':>12}{'us/vessel':>12}{'RSS MiB':>10}")
+    runs = []
+    for num_vessels in args.sizes:
+        for seed in args.seeds:
+            result = run_in_fresh_process(num_vessels, seed)
+            runs.append(result)
+            print(f"{num_vessels:>10}{seed:>6}{result['events']:>12}{result['wall_time']:>10.2f}"
+                  f"{result['events_per_second']:>12.0f}{result['wall_time_per_vessel'] * 1e6:>12.1f}"
+                  f"{result['peak_rss_mib']:>10.1f}", flush=True)
+
+    if args.output is not None:
+        with open(args.output, "w") as fh:
+            json.dump({
+                "commit": get_commit(),
+                "python": sys.version,
+                "platform": platform.platform(),
+                "runs": runs,
+            }, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Memory and attribute access cost of 1M live vessels
+
+Compares the slotted vessels with flyweight VesselSpec's (models.vessels)
+against the previous layout: a regular dataclass with a __dict__ and a copy of the type constants per vessel
+and against StoredVessel handles, whose data is in the columns of a VesselStore (counted in bytes/vessel)
+A StoredVessel only holds (store, handle), but each attribute access is a property over a column, so it is slower
+
+The type constants are class attributes, so they cost no memory per vessel
+This is a trade-off: on CPython 3.11, reading a class attribute of a slotted instance is not specialized,
+so the access below is about 35% slower than with the previous layout
+
+Usage:
+    python benchmarks/vessel_memory_benchmark.py
+"""
+from dataclasses import dataclass
+import time
+import tracemalloc
+
+from models.vessel_store import VesselStore
+from models.vessels import CrudeOilTanker
+
+NUM_VESSELS = 1_000_000
+NUM_REPEATS = 5
+
+
+@dataclass
+class DictCrudeOilTanker:
+    # The previous layout of CrudeOilTanker
+    uid: int
+    creation_time: float
+    time_in_system: float | None = None
+    destination_dock: str | None = None
+    vessel_type: str = "Crude Oil Tanker"
+    surface_area: int = 11007
+    avg_velocity: float = 10.7
+    max_velocity: float = 15.4
+    waiting_time_in_anchor_point: float | None = None
+
+
+def make_stored_vessel(store: VesselStore):
+    def vessel_ctor(uid: int, creation_time: float):
+        return store.add(CrudeOilTanker, uid=uid, creation_time=creation_time)
+    return vessel_ctor
+
+
+def run(make_vessel_ctor):
+    tracemalloc.start()
+    vessel_ctor = make_vessel_ctor()
+    vessels = [vessel_ctor(uid=uid, creation_time=float(uid)) for uid in range(NUM_VESSELS)]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Read a type constant and write a per-vessel field, as the models do (best of NUM_REPEATS)
+    access_time = float("inf")
+    for _ in range(NUM_REPEATS):
+        start = time.perf_counter()
+        for vessel in vessels:
+            vessel.time_in_system = vessel.surface_area / vessel.avg_velocity
+        access_time = min(access_time, time.perf_counter() - start)
+
+    return memory / NUM_VESSELS, access_time / NUM_VESSELS
+
+
+def main():
+    print(f"{'layout':<20}{'bytes/vessel':>15}{'access':>12}")
+    layouts = [
+        ("dict", lambda: DictCrudeOilTanker),
+        ("slots + flyweight", lambda: CrudeOilTanker),
+        # The store is created inside run, so its columns are counted
+        ("VesselStore", lambda: make_stored_vessel(VesselStore())),
+    ]
+    for name, make_vessel_ctor in layouts:
+        memory, access_time = run(make_vessel_ctor)
+        print(f"{name:<20}{memory:>15.1f}{access_time * 1e9:>10.1f}ns")
+
+
+if __name__ == "__main__":
+    main()
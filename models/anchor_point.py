@@ -3,8 +3,8 @@ from pypdevs.infinity import INFINITY
 
 from dataclasses import dataclass, field
 
-from models.vessels import Vessel
-from models.messages import PortEntryRequest, PortEntryPermission
+from models.vessels import Vessel, unpack_vessels
+from models.messages import PortEntryRequest, PortEntryPermission, pack_messages, unpack_messages
 
 
 @dataclass
@@ -14,15 +14,15 @@ class AnchorPointState:
     # Wait INDEFINITELY for the first input
     remaining_time: float = INFINITY
 
-    # The datastructure to queue the waiting Vessel's
-    vessels: list[Vessel] = field(default_factory=list)
+    # The datastructure to store the waiting Vessel's, by vessel_uid
+    # A Vessel is removed as soon as it is allowed to enter the port
+    vessels: dict[int, Vessel] = field(default_factory=dict)
 
     # We need to send output, in response to input
     # This is not directly supported in DEVS
-    # So, we use these variables
-    what_to_do: str = ""
-    stored_port_entry_request: PortEntryRequest | None = None
-    stored_vessel: Vessel | None = None
+    # So, we buffer the output in these queues, and send them all at once in the next output event
+    port_entry_requests_to_send: list[PortEntryRequest] = field(default_factory=list)
+    vessels_to_send: list[Vessel] = field(default_factory=list)
 
     current_time: float = 0.0
 
@@ -44,6 +44,11 @@ class AnchorPoint(AtomicDEVS):
 
     def intTransition(self):
         self.state.current_time += self.timeAdvance()
+
+        # The buffered output has been sent
+        self.state.port_entry_requests_to_send.clear()
+        self.state.vessels_to_send.clear()
+
         # After responding to an input, wait INDEFINITELY for a new input
         self.state.remaining_time = INFINITY
         return self.state
@@ -51,36 +56,38 @@ class AnchorPoint(AtomicDEVS):
     def extTransition(self, inputs):
         self.state.current_time += self.elapsed
         if self.in_vessel in inputs:
-            vessel = inputs[self.in_vessel]
-            assert isinstance(vessel, Vessel)
+            for vessel in unpack_vessels(inputs[self.in_vessel]):
+                assert isinstance(vessel, Vessel)
 
-            # Not the correct value, but used later
-            vessel.waiting_time_in_anchor_point = self.state.current_time
+                # Not the correct value, but used later
+                vessel.waiting_time_in_anchor_point = self.state.current_time
 
-            # Enqueue the vessel
-            self.state.vessels.append(inputs[self.in_vessel])
+                # Store the vessel
+                self.state.vessels[vessel.uid] = vessel
 
-            # Schedule to send a PortEntryRequest to out_port_entry_request IMMEDIATELY
-            self.state.remaining_time = 0
-            self.state.what_to_do = "send_port_entry_request"
-            self.state.stored_port_entry_request = PortEntryRequest(vessel_uid=vessel.uid)
+                # Schedule to send a PortEntryRequest to out_port_entry_request IMMEDIATELY
+                self.state.port_entry_requests_to_send.append(PortEntryRequest(
+                    vessel_uid=vessel.uid,
+                    vessel_type=vessel.vessel_type,
+                    destination_dock=vessel.destination_dock
+                ))
+                self.state.remaining_time = 0
 
-        elif self.in_port_entry_permission in inputs:
-            port_entry_permission = inputs[self.in_port_entry_permission]
-            assert isinstance(port_entry_permission, PortEntryPermission)
+        if self.in_port_entry_permission in inputs:
+            for port_entry_permission in unpack_messages(inputs[self.in_port_entry_permission]):
+                assert isinstance(port_entry_permission, PortEntryPermission)
 
-            # Schedule to send a Vessel to out_vessel IMMEDIATELY
-            self.state.remaining_time = 0
-            self.state.what_to_do = "send_vessel"
+                # Lookup Vessel (by vessel_uid in the PortEntryPermission), it no longer waits
+                vessel = self.state.vessels.pop(port_entry_permission.vessel_uid)
 
-            # Lookup Vessel in the queue (by vessel_uid in the PortEntryPermission)
-            vessel = next(
-                vessel for vessel in self.state.vessels if vessel.uid == port_entry_permission.vessel_uid
-            )
+                # Set the destination dock (and remember it as the served dock) and the correct waiting time
+                vessel.destination_dock = port_entry_permission.avl_dock
+                vessel.served_dock = port_entry_permission.avl_dock
+                vessel.waiting_time_in_anchor_point = self.state.current_time - vessel.waiting_time_in_anchor_point
 
-            # Set the destination dock
-            vessel.destination_dock = port_entry_permission.avl_dock
-            self.state.stored_vessel = vessel
+                # Schedule to send a Vessel to out_vessel IMMEDIATELY
+                self.state.vessels_to_send.append(vessel)
+                self.state.remaining_time = 0
 
         return self.state
 
@@ -88,18 +95,12 @@ class AnchorPoint(AtomicDEVS):
         return self.state.remaining_time
 
     def outputFnc(self):
-        if self.state.what_to_do == "send_port_entry_request":
-            assert self.state.stored_port_entry_request is not None
-            to_return = {self.out_port_entry_request: self.state.stored_port_entry_request}
-            self.state.stored_port_entry_request = None
-
-        elif self.state.what_to_do == "send_vessel":
-            assert self.state.stored_vessel is not None
-            self.state.stored_vessel.waiting_time_in_anchor_point = self.state.current_time - self.state.stored_vessel.waiting_time_in_anchor_point
-            to_return = {self.out_vessel: self.state.stored_vessel}
-            self.state.stored_vessel = None
-        else:
-            assert False
-
-        self.state.what_to_do = ""
+        # Send all the buffered output at once
+        to_return = {}
+        if len(self.state.port_entry_requests_to_send) != 0:
+            to_return[self.out_port_entry_request] = pack_messages(self.state.port_entry_requests_to_send)
+        if len(self.state.vessels_to_send) != 0:
+            to_return[self.out_vessel] = pack_messages(self.state.vessels_to_send)
+
+        assert len(to_return) != 0
         return to_return
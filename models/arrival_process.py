@@ -0,0 +1,58 @@
+import numpy as np
+
+from models.utils.constants import HOURS_PER_DAY, SECONDS_PER_HOUR
+
+SECONDS_PER_DAY = HOURS_PER_DAY * SECONDS_PER_HOUR
+
+
+class PiecewiseConstantPoissonProcess:
+    """
+    A non-homogeneous Poisson process, with a rate that is constant within each hour and repeats every day
+
+    The parameter num_vessels_per_hour is the average amount of vessels arriving in each hour of the day
+    (see NUM_VESSELS_ARRIVING_PER_HOUR in models.generator)
+
+    The arrival times are generated one day at a time, by time-rescaling a unit-rate Poisson process:
+    the cumulative intensity Lambda(t) is piecewise linear, so its inverse is found with np.searchsorted
+    Unlike sampling one exponential per vessel at the rate of the current hour, this is exact across hour boundaries
+
+    The process has its own random number generator, seeded with seed
+
+    The rates may not be negative, and at least one must be positive
+    Otherwise, every day would be empty, and the Generator would sample days forever
+    """
+    def __init__(self, num_vessels_per_hour: list[float], seed: int | None = None):
+        assert len(num_vessels_per_hour) == HOURS_PER_DAY
+        if min(num_vessels_per_hour) < 0 or sum(num_vessels_per_hour) <= 0:
+            raise ValueError(f"num_vessels_per_hour must be non-negative with a positive sum: {num_vessels_per_hour}")
+
+        # The rate in each hour (in vessels per second)
+        self.rates = np.asarray(num_vessels_per_hour, dtype=float) / SECONDS_PER_HOUR
+
+        # The cumulative intensity at the start of each hour (in vessels)
+        # That is, cumulative_intensity[h] = Lambda(h * SECONDS_PER_HOUR)
+        self.cumulative_intensity = np.concatenate(([0.0], np.cumsum(num_vessels_per_hour, dtype=float)))
+
+        self.rng = np.random.default_rng(seed)
+
+        # The next day to generate
+        self.day = 0
+
+    def sample_day(self) -> np.ndarray:
+        """
+        Returns the (sorted, absolute) arrival times of the next day
+        """
+        # A unit-rate Poisson process on [0, Lambda(1 day))
+        # Given the number of points, these are uniformly distributed
+        total_intensity = self.cumulative_intensity[-1]
+        num_arrivals = self.rng.poisson(total_intensity)
+        points = np.sort(self.rng.uniform(0.0, total_intensity, num_arrivals))
+
+        # Invert Lambda
+        # Hours with a rate of 0 have an empty interval, and are skipped by side="right"
+        hours = np.searchsorted(self.cumulative_intensity, points, side="right") - 1
+        times = hours * SECONDS_PER_HOUR + (points - self.cumulative_intensity[hours]) / self.rates[hours]
+
+        times += self.day * SECONDS_PER_DAY
+        self.day += 1
+        return times
@@ -1,9 +1,10 @@
 from pypdevs.DEVS import AtomicDEVS, Port
 from pypdevs.infinity import INFINITY
 
+from collections import deque
 from dataclasses import dataclass, field
 
-from models.vessels import Vessel
+from models.vessels import Vessel, unpack_vessels
 
 
 @dataclass
@@ -13,7 +14,7 @@ class ConfluenceState:
     remaining_time: float = INFINITY
 
     # Stores the vessels
-    vessels: list[Vessel] = field(default_factory=list)
+    vessels: deque[Vessel] = field(default_factory=deque)
 
     # Stores the output port for the next vessel (FCFS)
     output_port_for_next_vessel: Port | None = None
@@ -24,10 +25,14 @@ class Confluence(AtomicDEVS):
     The parameter confluence_info maps:
         port_name -> list of docks
     if the next-hop of the vessel is through port_name
+
+    If batch is True, all the vessels queued at the same simulation time are sent in one output event
+    The vessels are grouped per output port, and sent as a list of Vessel's (see unpack_vessels)
     """
-    def __init__(self, name: str, confluence_info: dict[str, list[str]]):
+    def __init__(self, name: str, confluence_info: dict[str, list[str]], batch: bool = False):
         super(Confluence, self).__init__(name)
         self.confluence_info = confluence_info
+        self.batch = batch
 
         # num IN ports = num OUT ports
 
@@ -36,27 +41,48 @@ class Confluence(AtomicDEVS):
         for port_name in self.confluence_info:
             self.in_vessel_ports[port_name] = self.addInPort(port_name)
 
+        # The reverse map of in_vessel_ports maps:
+        #   input port -> its position in confluence_info
+        # Vessels that arrive at the same time on several ports are enqueued in this order
+        self.in_vessel_port_positions = {
+            in_vessel_port: position for position, in_vessel_port in enumerate(self.in_vessel_ports.values())
+        }
+
         # Sends Vessel's on output ports
         self.out_vessel_ports = {}
         for port_name in self.confluence_info:
             self.out_vessel_ports[port_name] = self.addOutPort(port_name)
 
+        # The routing table maps:
+        #   dock -> output port for the next-hop on the route to this dock
+        # If a dock is listed for multiple ports, the first port wins
+        self.routing_table = {}
+        for port_name, docks in self.confluence_info.items():
+            for dock in docks:
+                self.routing_table.setdefault(dock, self.out_vessel_ports[port_name])
+
         self.state = ConfluenceState()
 
     def extTransition(self, inputs):
-        for in_vessel_port in self.in_vessel_ports.values():
-            if in_vessel_port in inputs:
-                # Get the vessel
-                vessel = inputs[in_vessel_port]
+        # Only visit the ports that have input, so the cost does not grow with the number of ports
+        in_vessel_ports = list(inputs)
+        if len(in_vessel_ports) > 1:
+            in_vessel_ports.sort(key=self.in_vessel_port_positions.__getitem__)
+
+        for in_vessel_port in in_vessel_ports:
+            assert in_vessel_port in self.in_vessel_port_positions
 
-                # Enqueue the vessel
+            # Get the vessel(s) and enqueue them
+            for vessel in unpack_vessels(inputs[in_vessel_port]):
+                assert isinstance(vessel, Vessel)
                 self.state.vessels.append(vessel)
 
-                # Schedule next event to run IMMEDIATELY
-                self.state.remaining_time = 0
+        if len(in_vessel_ports) != 0:
+            # Schedule next event to run IMMEDIATELY
+            self.state.remaining_time = 0
 
-                # Figure out the output port for the next vessel
-                self.set_output_port_for_next_vessel()
+            # Figure out the output port for the next vessel
+            self.set_output_port_for_next_vessel()
 
         return self.state
 
@@ -64,6 +90,15 @@ class Confluence(AtomicDEVS):
         return self.state.remaining_time
 
     def outputFnc(self):
+        if self.batch:
+            # Send all the vessels, grouped per output port (FCFS within each port)
+            to_return = {}
+            for vessel in self.state.vessels:
+                output_port = self.routing_table.get(vessel.destination_dock)
+                assert output_port is not None
+                to_return.setdefault(output_port, []).append(vessel)
+            return to_return
+
         # Check precondition
         assert self.state.output_port_for_next_vessel is not None
 
@@ -71,8 +106,11 @@ class Confluence(AtomicDEVS):
         return {self.state.output_port_for_next_vessel: self.state.vessels[0]}
 
     def intTransition(self):
-        # Remove the vessel we just sent
-        self.state.vessels.pop(0)
+        # Remove the vessel(s) we just sent
+        if self.batch:
+            self.state.vessels.clear()
+        else:
+            self.state.vessels.popleft()
 
         # If there are no more vessels in this confluence,
         #   wait INDEFINITELY for the next input event
@@ -92,7 +130,4 @@ class Confluence(AtomicDEVS):
         vessel = self.state.vessels[0]
 
         # Lookup the output port for the next-hop on the route to the vessels destination
-        for port_name, docks in self.confluence_info.items():
-            if vessel.destination_dock in docks:
-                self.state.output_port_for_next_vessel = self.out_vessel_ports[port_name]
-                break
+        self.state.output_port_for_next_vessel = self.routing_table.get(vessel.destination_dock)
@@ -1,15 +1,25 @@
 from pypdevs.DEVS import AtomicDEVS
 from pypdevs.infinity import INFINITY
 
+from collections import deque
 from dataclasses import dataclass, field
+from typing import Callable
 
-from models.messages import PortEntryRequest, PortEntryPermission, PortDepartureRequest
+from models.messages import (
+    PortEntryRequest,
+    PortEntryPermission,
+    PortDepartureRequest,
+    pack_messages,
+    unpack_messages,
+)
+from models.dock_allocation import DockAllocationPolicy, FirstAvailablePolicy
 
 
 @dataclass
 class ControlTowerState:
     # The datastructure that keeps track of the number of free spots in each dock
-    docks_free_spots: dict[str, int] = field(default_factory=dict)
+    # It also decides which dock a vessel may enter
+    dock_allocation_policy: DockAllocationPolicy
 
     # The remaining time until generation of a new event
     # We only react to external events
@@ -18,20 +28,25 @@ class ControlTowerState:
 
     # If all docks are occupied, we enqueue the requests
     # As soon as a dock becomes available, we send a permission to the first-come request
-    port_entry_requests: list[PortEntryRequest] = field(default_factory=list)
+    port_entry_requests: deque[PortEntryRequest] = field(default_factory=deque)
 
     # We need to send output, in response to input
     # This is not directly supported in DEVS
-    # So, we use these variables
-    stored_port_entry_permission: PortEntryPermission | None = None
+    # So, we buffer the output in this queue, and send it all at once in the next output event
+    port_entry_permissions_to_send: list[PortEntryPermission] = field(default_factory=list)
 
 
 class ControlTower(AtomicDEVS):
     """
     ControlTower is parameterized by docks_capacities
     This dictionary describes the names of the docks and their capacities.
+
+    The parameter dock_allocation_policy constructs the DockAllocationPolicy from docks_capacities
+    By default, a vessel may enter the first dock (in the order of docks_capacities) with a free spot
+    A PortEntryRequest with a destination_dock gets this dock if it has a free spot, regardless of the policy
     """
-    def __init__(self, name, docks_capacities: dict[str, int]):
+    def __init__(self, name, docks_capacities: dict[str, int],
+                 dock_allocation_policy: Callable[[dict[str, int]], DockAllocationPolicy] = FirstAvailablePolicy):
         super(ControlTower, self).__init__(name)
         self.control_tower_info = docks_capacities
 
@@ -48,76 +63,83 @@ class ControlTower(AtomicDEVS):
         #     self.in_port_departure_requests[port_name] = self.addInPort(port_name)
 
         # Initialize the state
-        self.state = ControlTowerState(docks_free_spots=docks_capacities)
+        self.state = ControlTowerState(dock_allocation_policy=dock_allocation_policy(docks_capacities))
 
     def intTransition(self):
+        # The buffered output has been sent
+        self.state.port_entry_permissions_to_send.clear()
+
         # After responding to an input, wait INDEFINITELY for a new input
         self.state.remaining_time = INFINITY
         return self.state
 
     def extTransition(self, inputs):
         if self.in_port_entry_request in inputs:
-            port_entry_request = inputs[self.in_port_entry_request]
-            assert isinstance(port_entry_request, PortEntryRequest)
+            for port_entry_request in unpack_messages(inputs[self.in_port_entry_request]):
+                assert isinstance(port_entry_request, PortEntryRequest)
+                self.handle_port_entry_request(port_entry_request)
 
-            # If all docks are occupied, we enqueue the requests
-            # Else, use the first available dock
-            if all(num_free_spots == 0 for num_free_spots in self.state.docks_free_spots.values()):
-                self.state.port_entry_requests.append(port_entry_request)
-            else:
-                first_avl_dock = next(
-                    (dock for dock in self.state.docks_free_spots if self.state.docks_free_spots[dock] != 0),
-                    None
-                )
-                assert first_avl_dock is not None
-                port_entry_permission = PortEntryPermission(
-                    vessel_uid=port_entry_request.vessel_uid,
-                    avl_dock=first_avl_dock
-                )
-
-                # Reserve the spot in the dock
-                self.state.docks_free_spots[first_avl_dock] -= 1
-                assert self.state.docks_free_spots[first_avl_dock] >= 0
-
-                # Schedule to send a PortEntryPermission to out_port_entry_permission IMMEDIATELY
-                self.state.remaining_time = 0
-                self.state.stored_port_entry_permission = port_entry_permission
-
-        elif self.in_port_depart_request in inputs:
-            # IF WE RECEIVE A RELEASE
-            # CHECK IF ANY REQUESTS ARE IN THE QUEUE WAITING
-            # IF SO, SERVE THE FIRST-COME REQUEST
-
-            port_depart_request = inputs[self.in_port_depart_request]
-            assert isinstance(port_depart_request, PortDepartureRequest)
-
-            # Check the validity of the message
-            # That is, it contains a valid dock string
-            assert port_depart_request.dock in self.state.docks_free_spots
-
-            # Update the capacity of the dock
-            self.state.docks_free_spots[port_depart_request.dock] += 1
-
-            # If any request are pending, serve the first-come request
-            # We for sure know we have a free spot (since we just released it)
-            if len(self.state.port_entry_requests) != 0:
-                port_entry_request = self.state.port_entry_requests.pop(0)
-                port_entry_permission = PortEntryPermission(
-                    vessel_uid=port_entry_request.vessel_uid,
-                    avl_dock=port_depart_request.dock
-                )
-                # Schedule to send a PortEntryPermission to out_port_entry_permission IMMEDIATELY
-                self.state.remaining_time = 0
-                self.state.stored_port_entry_permission = port_entry_permission
+        if self.in_port_depart_request in inputs:
+            for port_depart_request in unpack_messages(inputs[self.in_port_depart_request]):
+                assert isinstance(port_depart_request, PortDepartureRequest)
+                self.handle_port_depart_request(port_depart_request)
 
         return self.state
 
+    def handle_port_entry_request(self, port_entry_request: PortEntryRequest):
+        policy = self.state.dock_allocation_policy
+
+        # If all docks are occupied, we enqueue the requests
+        # Else, use the requested dock if it has a free spot, or the dock selected by the policy
+        if not policy.has_free_spot():
+            self.state.port_entry_requests.append(port_entry_request)
+        else:
+            if policy.docks_free_spots.get(port_entry_request.destination_dock, 0) != 0:
+                avl_dock = port_entry_request.destination_dock
+            else:
+                avl_dock = policy.select_dock(port_entry_request)
+            port_entry_permission = PortEntryPermission(
+                vessel_uid=port_entry_request.vessel_uid,
+                avl_dock=avl_dock
+            )
+
+            # Reserve the spot in the dock
+            policy.reserve(avl_dock)
+
+            # Schedule to send a PortEntryPermission to out_port_entry_permission IMMEDIATELY
+            self.state.remaining_time = 0
+            self.state.port_entry_permissions_to_send.append(port_entry_permission)
+
+    def handle_port_depart_request(self, port_depart_request: PortDepartureRequest):
+        # IF WE RECEIVE A RELEASE
+        # CHECK IF ANY REQUESTS ARE IN THE QUEUE WAITING
+        # IF SO, SERVE THE FIRST-COME REQUEST
+        policy = self.state.dock_allocation_policy
+
+        # Check the validity of the message
+        # That is, it contains a valid dock string
+        assert port_depart_request.dock in policy.docks_free_spots
+
+        # If any request are pending, serve the first-come request
+        # We for sure know we have a free spot (since we just released it)
+        # So, the spot is handed over to this request directly
+        # Else, update the capacity of the dock
+        if len(self.state.port_entry_requests) != 0:
+            port_entry_request = self.state.port_entry_requests.popleft()
+            port_entry_permission = PortEntryPermission(
+                vessel_uid=port_entry_request.vessel_uid,
+                avl_dock=port_depart_request.dock
+            )
+            # Schedule to send a PortEntryPermission to out_port_entry_permission IMMEDIATELY
+            self.state.remaining_time = 0
+            self.state.port_entry_permissions_to_send.append(port_entry_permission)
+        else:
+            policy.release(port_depart_request.dock)
+
     def timeAdvance(self):
         return self.state.remaining_time
 
     def outputFnc(self):
-        assert self.state.stored_port_entry_permission is not None
-        to_return = {self.out_port_entry_permission: self.state.stored_port_entry_permission}
-        self.state.stored_port_entry_permission = None
-
-        return to_return
+        # Send all the buffered PortEntryPermission's at once
+        assert len(self.state.port_entry_permissions_to_send) != 0
+        return {self.out_port_entry_permission: pack_messages(self.state.port_entry_permissions_to_send)}
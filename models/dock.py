@@ -7,6 +7,7 @@ import numpy as np
 from models.vessels import Vessel
 from models.messages import PortDepartureRequest
 from models.utils.constants import SECONDS_PER_HOUR
+from models.utils.timer_queue import TimerQueue
 
 
 @dataclass
@@ -16,15 +17,9 @@ class DockState:
     # Instead, we first wait for an input event
     remaining_time: float = INFINITY
 
-    # The list that stores the vessels in this dock
-    vessels: list[Vessel] = field(default_factory=list)
-
-    # The list that stores the timers associated with the vessels in vessels
-    # The association is by index
-    timers: list[float] = field(default_factory=list)
-
-    # The index into vessels for the vessel with the smallest timer
-    index_for_next_vessel: int | None = None
+    # The priority queue that stores the vessels in this dock, by service end time
+    # Ties on the service end time are broken by the vessel uid
+    vessels: TimerQueue = field(default_factory=TimerQueue)
 
 
 class Dock(AtomicDEVS):
@@ -54,66 +49,53 @@ class Dock(AtomicDEVS):
         self.out_port_departure_request = self.addOutPort("out_port_departure_request")
 
         # Initialize the state
-        self.state = DockState()
-
-        if vessels:
-            for vessel in vessels:
-                assert isinstance(vessel, Vessel)
-                # Get the timer
-                # Convert to correct unit = seconds
-                mu = 36 * SECONDS_PER_HOUR
-                sigma = 12 * SECONDS_PER_HOUR
-                # Sample from normal distribution
-                timer = np.random.normal(mu, sigma)
-                # Apply a lower bound of 6 hours
-                timer = max(timer, 6 * SECONDS_PER_HOUR)
-
-                # Enqueue the vessel and its timer
-                self.state.vessels.append(vessel)
-                self.state.timers.append(timer)
-            self.generate_at_smallest_timer()
+        # The given vessels are enqueued with their timers in one step
+        assert all(isinstance(vessel, Vessel) for vessel in vessels)
+        self.state = DockState(
+            vessels=TimerQueue((self.get_timer(), vessel.uid, vessel) for vessel in vessels)
+        )
+        self.state.remaining_time = self.state.vessels.remaining_time()
 
     def extTransition(self, inputs):
         # Apply the pattern: Ignore an Event (see MOSIS)
-        self.state.timers = [timer - self.elapsed for timer in self.state.timers]
+        self.state.vessels.advance(self.elapsed)
 
         if self.in_vessel in inputs:
             # Get the vessel
             vessel = inputs[self.in_vessel]
             assert isinstance(vessel, Vessel)
 
-            # Get the timer
-            # Convert to correct unit = seconds
-            mu = 36 * SECONDS_PER_HOUR
-            sigma = 12 * SECONDS_PER_HOUR
-            # Sample from normal distribution
-            timer = np.random.normal(mu, sigma)
-            # Apply a lower bound of 6 hours
-            timer = max(timer, 6 * SECONDS_PER_HOUR)
-
             # Enqueue the vessel and its timer
-            self.state.vessels.append(vessel)
-            self.state.timers.append(timer)
+            self.state.vessels.push(self.get_timer(), vessel.uid, vessel)
         else:
             assert False
 
         # Generate the next output event at the smallest timer
         # Necessary, since it could be that the new vessel leaves the dock first
-        self.generate_at_smallest_timer()
+        self.state.remaining_time = self.state.vessels.remaining_time()
 
         return self.state
 
+    def get_timer(self):
+        # Convert to correct unit = seconds
+        mu = 36 * SECONDS_PER_HOUR
+        sigma = 12 * SECONDS_PER_HOUR
+        # Sample from normal distribution
+        timer = np.random.normal(mu, sigma)
+        # Apply a lower bound of 6 hours
+        return max(timer, 6 * SECONDS_PER_HOUR)
+
     def timeAdvance(self):
         return self.state.remaining_time
 
     def outputFnc(self):
         # Check precondition
-        assert self.state.index_for_next_vessel is not None
+        assert len(self.state.vessels) != 0
 
         # Send the vessel for which the timer expired,
         # route this vessel to the Sea (by setting destination_dock) and
         # send a PortDepartureRequest
-        vessel = self.state.vessels[self.state.index_for_next_vessel]
+        vessel = self.state.vessels.peek()
         vessel.destination_dock = "9"
         return {
             self.out_vessel: vessel,
@@ -121,35 +103,12 @@ class Dock(AtomicDEVS):
         }
 
     def intTransition(self):
-        # Remove the vessel we just sent (and its timer)
-        self.state.vessels.pop(self.state.index_for_next_vessel)
-        self.state.timers.pop(self.state.index_for_next_vessel)
-
-        # If there are no more vessels in this waterway,
-        # wait INDEFINITELY for the next input event
-        if len(self.state.vessels) == 0:
-            self.state.remaining_time = INFINITY
-        else:
-            # Lower the timers
-            self.state.timers = [timer - self.state.remaining_time for timer in self.state.timers]
+        # Remove the vessel we just sent
+        self.state.vessels.advance(self.state.remaining_time)
+        self.state.vessels.pop()
 
-            # Generate the next output event at the smallest timer
-            self.generate_at_smallest_timer()
+        # If there are no more vessels in this dock, wait INDEFINITELY for the next input event
+        # Else, generate the next output event at the smallest timer
+        self.state.remaining_time = self.state.vessels.remaining_time()
 
         return self.state
-
-    def generate_at_smallest_timer(self):
-        # Assume that the dock contains at least one vessel
-        assert len(self.state.vessels) != 0
-
-        # Lookup the smallest timer
-        min_index, min_timer = min(
-            enumerate(self.state.timers),
-            key=lambda p: p[1]
-        )
-
-        # Generate the next output event at the smallest timer
-        self.state.remaining_time = min_timer
-
-        # Store the index of the vessel with the smallest timer
-        self.state.index_for_next_vessel = min_index
@@ -0,0 +1,246 @@
+import heapq
+
+from models.messages import PortEntryRequest
+
+
+class FreePositions:
+    """
+    The set of positions 0..n-1 of the docks that have at least one free spot
+
+    This is a segment tree that counts the members in each subtree, so that
+        add, remove: O(log n)
+        next:        O(log n)
+    """
+    def __init__(self, n: int, members=()):
+        self.n = n
+        self.size = 1
+        while self.size < max(n, 1):
+            self.size *= 2
+        self.tree = [0] * (2 * self.size)
+        for position in members:
+            self.tree[self.size + position] = 1
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = self.tree[2 * node] + self.tree[2 * node + 1]
+
+    def __len__(self):
+        return self.tree[1]
+
+    def __contains__(self, position: int):
+        return self.tree[self.size + position] == 1
+
+    def add(self, position: int):
+        self._update(position, 1)
+
+    def remove(self, position: int):
+        self._update(position, 0)
+
+    def _update(self, position: int, value: int):
+        node = self.size + position
+        delta = value - self.tree[node]
+        while node >= 1:
+            self.tree[node] += delta
+            node //= 2
+
+    def next(self, position: int = 0) -> int | None:
+        # The smallest member >= position, or None if there is no such member
+        if position >= self.n:
+            return None
+        node = self.size + position
+        if self.tree[node]:
+            return position
+
+        # Go up, until we can go right into a subtree with members
+        while node > 1:
+            if node % 2 == 0 and self.tree[node + 1]:
+                node += 1
+                break
+            node //= 2
+        else:
+            return None
+
+        # Go down, to the leftmost member of this subtree
+        while node < self.size:
+            node = 2 * node if self.tree[2 * node] else 2 * node + 1
+        return node - self.size
+
+
+class DockAllocationPolicy:
+    """
+    Decides which dock a vessel may enter (see ControlTower)
+
+    A policy keeps track of the number of free spots in each dock, and
+    implements select_dock() using incremental datastructures (no scan over all docks)
+    """
+    def __init__(self, docks_capacities: dict[str, int]):
+        # The names of the docks (in the order of docks_capacities)
+        self.docks = list(docks_capacities)
+
+        # The number of free spots in each dock
+        self.docks_free_spots = dict(docks_capacities)
+        self.num_free_spots = sum(self.docks_free_spots.values())
+
+    def has_free_spot(self) -> bool:
+        return self.num_free_spots != 0
+
+    def select_dock(self, port_entry_request: PortEntryRequest) -> str:
+        # Assume that there is at least one free spot
+        raise NotImplementedError
+
+    def reserve(self, dock: str):
+        self.docks_free_spots[dock] -= 1
+        assert self.docks_free_spots[dock] >= 0
+        self.num_free_spots -= 1
+        self.on_free_spots_changed(dock)
+
+    def release(self, dock: str):
+        self.docks_free_spots[dock] += 1
+        self.num_free_spots += 1
+        self.on_free_spots_changed(dock)
+
+    def on_free_spots_changed(self, dock: str):
+        pass
+
+
+class OrderedPolicy(DockAllocationPolicy):
+    """
+    Selects the first dock with a free spot, in a fixed order of the docks
+    The order is given by the names of the docks, and defaults to the order of docks_capacities
+    """
+    def __init__(self, docks_capacities: dict[str, int], order: list[str] | None = None):
+        super(OrderedPolicy, self).__init__(docks_capacities)
+        if order is None:
+            order = self.docks
+        assert sorted(order) == sorted(self.docks)
+
+        self.order = order
+        self.positions = {dock: position for position, dock in enumerate(self.order)}
+        self.free_positions = FreePositions(
+            len(self.order),
+            (position for position, dock in enumerate(self.order) if self.docks_free_spots[dock] != 0)
+        )
+
+    def select_dock(self, port_entry_request: PortEntryRequest) -> str:
+        position = self.free_positions.next(0)
+        assert position is not None
+        return self.order[position]
+
+    def on_free_spots_changed(self, dock: str):
+        if self.docks_free_spots[dock] == 0:
+            self.free_positions.remove(self.positions[dock])
+        else:
+            self.free_positions.add(self.positions[dock])
+
+
+class FirstAvailablePolicy(OrderedPolicy):
+    """
+    Selects the first dock (in the order of docks_capacities) with a free spot
+    """
+    def __init__(self, docks_capacities: dict[str, int]):
+        super(FirstAvailablePolicy, self).__init__(docks_capacities)
+
+
+class ShortestRoutePolicy(OrderedPolicy):
+    """
+    Selects the dock with a free spot that has the shortest route from the AnchorPoint
+    The parameter route_lengths maps:
+        dock -> length of the route from the AnchorPoint to this dock (in km)
+    """
+    def __init__(self, docks_capacities: dict[str, int], route_lengths: dict[str, float]):
+        # Sort by route length, ties are broken by the order of docks_capacities
+        order = sorted(docks_capacities, key=lambda dock: route_lengths[dock])
+        super(ShortestRoutePolicy, self).__init__(docks_capacities, order)
+
+
+class RoundRobinPolicy(OrderedPolicy):
+    """
+    Selects the docks in turn (in the order of docks_capacities), skipping the docks without a free spot
+    """
+    def __init__(self, docks_capacities: dict[str, int]):
+        super(RoundRobinPolicy, self).__init__(docks_capacities)
+
+        # The position to start looking for the next dock
+        self.next_position = 0
+
+    def select_dock(self, port_entry_request: PortEntryRequest) -> str:
+        position = self.free_positions.next(self.next_position)
+        if position is None:
+            # Wrap around
+            position = self.free_positions.next(0)
+        assert position is not None
+        self.next_position = (position + 1) % len(self.order)
+        return self.order[position]
+
+
+class VesselTypeAwarePolicy(DockAllocationPolicy):
+    """
+    Selects the first dock with a free spot, in an order that depends on the vessel type
+    The parameter preferred_docks maps:
+        vessel_type -> list of docks that are tried first (in this order)
+    The other docks are tried afterwards (in the order of docks_capacities)
+    Vessel types without preferred docks use the order of docks_capacities
+    """
+    def __init__(self, docks_capacities: dict[str, int], preferred_docks: dict[str, list[str]]):
+        super(VesselTypeAwarePolicy, self).__init__(docks_capacities)
+
+        # One OrderedPolicy per vessel type, these share docks_free_spots
+        self.default_policy = OrderedPolicy(docks_capacities)
+        self.policies = {}
+        for vessel_type, docks in preferred_docks.items():
+            order = list(docks) + [dock for dock in self.docks if dock not in docks]
+            self.policies[vessel_type] = OrderedPolicy(docks_capacities, order)
+        for policy in [self.default_policy, *self.policies.values()]:
+            policy.docks_free_spots = self.docks_free_spots
+
+    def select_dock(self, port_entry_request: PortEntryRequest) -> str:
+        policy = self.policies.get(port_entry_request.vessel_type, self.default_policy)
+        return policy.select_dock(port_entry_request)
+
+    def on_free_spots_changed(self, dock: str):
+        # O(#vessel types * log #docks)
+        self.default_policy.on_free_spots_changed(dock)
+        for policy in self.policies.values():
+            policy.on_free_spots_changed(dock)
+
+
+class LeastLoadedPolicy(DockAllocationPolicy):
+    """
+    Selects the dock with the lowest fraction of occupied spots
+    Ties are broken by the order of docks_capacities
+    """
+    def __init__(self, docks_capacities: dict[str, int]):
+        super(LeastLoadedPolicy, self).__init__(docks_capacities)
+        self.capacities = dict(docks_capacities)
+        self.positions = {dock: position for position, dock in enumerate(self.docks)}
+
+        # A binary heap of entries (load, position)
+        # Entries are not removed when the load of a dock changes, instead a new entry is pushed
+        # An entry is outdated if its load differs from the current load of the dock (lazy deletion)
+        self.heap = []
+        self.rebuild_heap()
+
+    def load(self, dock: str) -> float:
+        return 1 - self.docks_free_spots[dock] / self.capacities[dock]
+
+    def rebuild_heap(self):
+        self.heap = [
+            (self.load(dock), position) for position, dock in enumerate(self.docks)
+            if self.docks_free_spots[dock] != 0
+        ]
+        heapq.heapify(self.heap)
+
+    def select_dock(self, port_entry_request: PortEntryRequest) -> str:
+        # Discard the outdated entries at the top of the heap
+        while True:
+            load, position = self.heap[0]
+            dock = self.docks[position]
+            if self.docks_free_spots[dock] != 0 and load == self.load(dock):
+                return dock
+            heapq.heappop(self.heap)
+
+    def on_free_spots_changed(self, dock: str):
+        if self.docks_free_spots[dock] != 0:
+            heapq.heappush(self.heap, (self.load(dock), self.positions[dock]))
+
+        # Keep the number of outdated entries bounded (amortized O(1))
+        if len(self.heap) > 2 * len(self.docks) + 16:
+            self.rebuild_heap()
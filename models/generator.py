@@ -1,16 +1,24 @@
 from pypdevs.DEVS import AtomicDEVS
 from pypdevs.infinity import INFINITY
 
+from dataclasses import dataclass, field
 import random
 import numpy as np
+from itertools import accumulate
 
 from models.vessels import *
 from models.utils.constants import HOURS_PER_DAY, SECONDS_PER_HOUR
+from models.arrival_process import PiecewiseConstantPoissonProcess
+from models.vessel_store import VesselStore
 
 # Average amount of vessels arriving at the port on an hourly basis
 NUM_VESSELS_ARRIVING_PER_HOUR = [100, 120, 150, 175, 125, 50, 42, 68, 200, 220, 250, 245, 253, 236, 227, 246, 203, 43,
                                  51, 33, 143, 187, 164, 123]
 
+# The cumulative weights of the vessel types
+# Passing these to random.choices avoids recomputing them on every call
+VESSEL_CUM_WEIGHTS = list(accumulate(VESSEL_WEIGHTS))
+
 
 @dataclass
 class GeneratorState:
@@ -21,14 +29,51 @@ class GeneratorState:
     # The number of vessels generated
     num_vessels_generated: int = 0
 
+    # Only used in batched mode (see Generator)
+    # The pre-sampled inter-arrival times for a rate of 1 vessel per second
+    unit_iats: list[float] = field(default_factory=list)
+    unit_iats_position: int = 0
+    # The pre-sampled indices into ALL_VESSELS
+    vessel_type_indices: list[int] = field(default_factory=list)
+    vessel_type_indices_position: int = 0
+
+    # Only used with an arrival_process (see Generator)
+    # The pre-sampled (absolute) arrival times
+    arrival_times: list[float] = field(default_factory=list)
+    arrival_times_position: int = 0
+
 
 class Generator(AtomicDEVS):
-    def __init__(self, name, num_vessels_to_generate):
+    """
+    If batch_size is given, the inter-arrival times and vessel types are sampled with numpy,
+    batch_size at a time, instead of once per vessel
+    The output is then reproducible with np.random.seed alone (for a given batch_size)
+    The first batch of vessel types is sampled in __init__, so np.random.seed must be called before that
+
+    If arrival_process is given, the arrival times are taken from it, one day at a time
+    Else, the inter-arrival time is sampled at the rate of the hour of the previous arrival
+
+    If vessel_store is given, the vessels are added to it, and StoredVessel's are sent (see VesselStore)
+    """
+    def __init__(self, name, num_vessels_to_generate, batch_size: int | None = None,
+                 arrival_process: PiecewiseConstantPoissonProcess | None = None,
+                 vessel_store: VesselStore | None = None):
         super(Generator, self).__init__(name)
         self.num_vessels_to_generate = num_vessels_to_generate
+        self.batch_size = batch_size
+        self.arrival_process = arrival_process
+        self.vessel_store = vessel_store
         self.out = self.addOutPort("out")
         self.state = GeneratorState()
 
+        # The first vessel arrives at the first arrival time (instead of at t=0)
+        if self.arrival_process is not None:
+            self.state.remaining_time = self.next_arrival_time()
+
+        # The type of the first vessel is sampled here, so outputFnc only has to read it
+        if self.batch_size is not None and self.num_vessels_to_generate > 0:
+            self.sample_vessel_type_indices()
+
     def intTransition(self):
         # Update simulation time
         self.state.current_time += self.timeAdvance()
@@ -36,19 +81,30 @@ class Generator(AtomicDEVS):
         # Register that we generated a vessel
         self.state.num_vessels_generated += 1
 
-        # Find the index of the bar chart
-        hour = int(self.state.current_time) // SECONDS_PER_HOUR
-
-        # Index the bar chart
-        num_vessels_per_hour_mean = NUM_VESSELS_ARRIVING_PER_HOUR[hour % HOURS_PER_DAY]
-
         # If more vessels should be generated
         #   Schedule next event at some Inter-Arrival-Time
         # Else
         #   Do nothing anymore
         if self.state.num_vessels_generated < self.num_vessels_to_generate:
-            iat = np.random.exponential(SECONDS_PER_HOUR/num_vessels_per_hour_mean)
+            if self.arrival_process is not None:
+                iat = self.next_arrival_time() - self.state.current_time
+            else:
+                # Index the bar chart at the hour of the previous arrival
+                hour = int(self.state.current_time) // SECONDS_PER_HOUR
+                num_vessels_per_hour_mean = NUM_VESSELS_ARRIVING_PER_HOUR[hour % HOURS_PER_DAY]
+
+                if self.batch_size is None:
+                    iat = np.random.exponential(SECONDS_PER_HOUR/num_vessels_per_hour_mean)
+                else:
+                    # Scale the pre-sampled inter-arrival time to the current rate
+                    iat = self.next_unit_iat() * (SECONDS_PER_HOUR/num_vessels_per_hour_mean)
             self.state.remaining_time = iat
+
+            # Move on to the type of the next vessel
+            if self.batch_size is not None:
+                self.state.vessel_type_indices_position += 1
+                if self.state.vessel_type_indices_position == len(self.state.vessel_type_indices):
+                    self.sample_vessel_type_indices()
         else:
             self.state.remaining_time = INFINITY
 
@@ -61,10 +117,50 @@ class Generator(AtomicDEVS):
     def outputFnc(self):
 
         # Sample vessel type
-        vessel_ctor = random.choices(ALL_VESSELS, VESSEL_WEIGHTS)[0]
-        vessel = vessel_ctor(
-            uid=self.state.num_vessels_generated,
-            # Important addition
-            creation_time=self.state.current_time + self.state.remaining_time
-        )
+        if self.batch_size is None:
+            vessel_ctor = random.choices(ALL_VESSELS, cum_weights=VESSEL_CUM_WEIGHTS)[0]
+        else:
+            # Sampled in intTransition (or __init__), outputFnc has no side effects
+            vessel_ctor = ALL_VESSELS[self.state.vessel_type_indices[self.state.vessel_type_indices_position]]
+        if self.vessel_store is not None:
+            vessel = self.vessel_store.add(
+                vessel_ctor,
+                uid=self.state.num_vessels_generated,
+                creation_time=self.state.current_time + self.state.remaining_time
+            )
+        else:
+            vessel = vessel_ctor(
+                uid=self.state.num_vessels_generated,
+                # Important addition
+                creation_time=self.state.current_time + self.state.remaining_time
+            )
         return {self.out: vessel}
+
+    def next_arrival_time(self) -> float:
+        # Sample the next day if the current one is used up
+        while self.state.arrival_times_position == len(self.state.arrival_times):
+            self.state.arrival_times = self.arrival_process.sample_day().tolist()
+            self.state.arrival_times_position = 0
+
+        arrival_time = self.state.arrival_times[self.state.arrival_times_position]
+        self.state.arrival_times_position += 1
+        return arrival_time
+
+    def next_unit_iat(self) -> float:
+        # Sample the next batch if the current one is used up
+        if self.state.unit_iats_position == len(self.state.unit_iats):
+            self.state.unit_iats = np.random.exponential(1.0, self.batch_size).tolist()
+            self.state.unit_iats_position = 0
+
+        iat = self.state.unit_iats[self.state.unit_iats_position]
+        self.state.unit_iats_position += 1
+        return iat
+
+    def sample_vessel_type_indices(self):
+        # Sample the next batch of vessel types, starting at its first index
+        self.state.vessel_type_indices = np.searchsorted(
+            VESSEL_CUM_WEIGHTS,
+            np.random.random(self.batch_size) * VESSEL_CUM_WEIGHTS[-1],
+            side="right"
+        ).tolist()
+        self.state.vessel_type_indices_position = 0
@@ -1,9 +1,13 @@
 from pypdevs.DEVS import AtomicDEVS
+from pypdevs.infinity import INFINITY
 
 from models.vessels import Vessel
+from models.utils.waiting_queue import WaitingQueue
+from models.lock_packing import ChamberPackingStrategy, FirstFitStrategy
 
 from dataclasses import dataclass, field
 from enum import Enum
+import math
 
 
 class IntervalState(Enum):
@@ -31,20 +35,44 @@ class LockState:
 
     vessels_in_lock: list[Vessel] = field(default_factory=list)
 
-    vessels_waiting_low: list[Vessel] = field(default_factory=list)
+    # The vessels waiting at each water level (FCFS, with first-fit by surface area)
+    vessels_waiting_low: WaitingQueue = field(default_factory=WaitingQueue)
 
-    vessels_waiting_high: list[Vessel] = field(default_factory=list)
+    vessels_waiting_high: WaitingQueue = field(default_factory=WaitingQueue)
 
     sum_remaining_surface_area: float = 0.0
     number_of_washings: int = 0
     number_lock_state_changes_with_no_vessels: int = 0
     idle_time: int = 0
 
+    # The current simulation time
+    current_time: float = 0.0
+
+    # Only used with fast_forward (see Lock)
+    # If True, the lock is empty and no events are scheduled
+    # The interval states are caught up on the next input event (or with settle)
+    dormant: bool = False
+
 
 class Lock(AtomicDEVS):
+    """
+    If fast_forward is True, the lock does not schedule its interval states while it is empty
+    (no vessels in the lock and no vessels waiting)
+    Instead, it becomes dormant, and catches up with all the interval states it skipped on the next input event
+    Whole lock shift intervals are skipped in O(1), and the statistics are updated in bulk
+    The observable output is the same
+
+    While the lock is dormant, its statistics lag behind
+    So, call settle(termination_time) after the simulation, before reading the statistics
+
+    The parameter packing_strategy decides which waiting vessels enter the chamber (see models.lock_packing)
+    By default, the vessels enter in FCFS order, skipping the vessels that do not fit (FirstFitStrategy)
+    """
     def __init__(self, name: str, washing_duration: int, lock_shift_interval: int, gate_duration: int,
                  surface_area: int,
-                 time_between_departures: int = 30):
+                 time_between_departures: int = 30,
+                 fast_forward: bool = False,
+                 packing_strategy: ChamberPackingStrategy | None = None):
         AtomicDEVS.__init__(self, name)
 
         # Lock attributes
@@ -54,6 +82,8 @@ class Lock(AtomicDEVS):
         self.gate_duration = gate_duration
         self.surface_area = surface_area
         self.time_between_departures = time_between_departures
+        self.fast_forward = fast_forward
+        self.packing_strategy = packing_strategy if packing_strategy is not None else FirstFitStrategy()
 
         # Receive vessels on low and high level
         self.in_low = self.addInPort('in_vessel_low')
@@ -67,8 +97,16 @@ class Lock(AtomicDEVS):
         self.state = LockState(current_surface_area=self.surface_area)
 
     def extTransition(self, inputs):
-        # Pattern: Ignore an Event
-        self.state.remaining_time -= self.elapsed
+        if self.state.dormant:
+            # Catch up with the interval states we skipped while dormant
+            self.catch_up(self.elapsed)
+            self.state.dormant = False
+        else:
+            # Pattern: Ignore an Event
+            self.state.remaining_time -= self.elapsed
+
+        # Update simulation time
+        self.state.current_time += self.elapsed
 
         if self.in_high in inputs:
             vessel = inputs[self.in_high]
@@ -103,9 +141,23 @@ class Lock(AtomicDEVS):
             assert False
 
     def timeAdvance(self):
+        if self.state.dormant:
+            return INFINITY
         return self.state.remaining_time
 
     def intTransition(self):
+        # Update simulation time
+        self.state.current_time += self.state.remaining_time
+
+        self.next_interval_state()
+
+        # If the lock is empty, there is nothing to observe until the next input event
+        if self.fast_forward and self.is_empty():
+            self.state.dormant = True
+
+        return self.state
+
+    def next_interval_state(self):
         # ASSUMPTION: we do not care about the number of time_between_departures before
         self.state.remaining_time = self.normal_transition_time()
 
@@ -119,7 +171,7 @@ class Lock(AtomicDEVS):
 
         elif self.state.interval_state == IntervalState.WASHING:
             self.swap_water_levels()
-            self.state.sum_remaining_surface_area += self.surface_area - self.state.current_surface_area
+            self.state.sum_remaining_surface_area += self.state.current_surface_area
             self.state.number_of_washings += 1
             if len(self.state.vessels_in_lock) == 0:
                 self.state.number_lock_state_changes_with_no_vessels += 1
@@ -137,7 +189,56 @@ class Lock(AtomicDEVS):
         else:
             assert False
 
-        return self.state
+    def is_empty(self) -> bool:
+        return (len(self.state.vessels_in_lock) == 0 and
+                len(self.state.vessels_waiting_low) == 0 and
+                len(self.state.vessels_waiting_high) == 0)
+
+    def catch_up(self, duration: float, inclusive: bool = False):
+        """
+        Performs the interval states of an empty lock for the given duration, without scheduling them
+        The interval states that end exactly at the end of the duration are only performed if inclusive
+        (then they come before an input event at the same time)
+        """
+        assert self.is_empty()
+
+        num_interval_states = 0
+        while (self.state.remaining_time < duration or
+               (inclusive and self.state.remaining_time == duration)):
+            duration -= self.state.remaining_time
+            self.next_interval_state()
+            num_interval_states += 1
+
+            # From the first interval state on, each cycle of 4 interval states
+            # takes exactly lock_shift_interval and washes once, with no vessels
+            if num_interval_states == 1:
+                if inclusive:
+                    num_cycles = int(duration // self.lock_shift_interval)
+                else:
+                    num_cycles = max(math.ceil(duration / self.lock_shift_interval) - 1, 0)
+                self.skip_cycles(num_cycles)
+                duration -= num_cycles * self.lock_shift_interval
+
+        self.state.remaining_time -= duration
+
+    def skip_cycles(self, num_cycles: int):
+        # The statistics of num_cycles cycles of an empty lock (see WASHING in next_interval_state)
+        # The whole surface area remains, since no vessels are transferred
+        self.state.sum_remaining_surface_area += num_cycles * self.surface_area
+        self.state.number_of_washings += num_cycles
+        self.state.number_lock_state_changes_with_no_vessels += num_cycles
+        self.state.idle_time += num_cycles * self.lock_shift_interval
+        if num_cycles % 2 == 1:
+            self.swap_water_levels()
+
+    def settle(self, time: float):
+        """
+        Catches up with the interval states until the given simulation time (including those at this time)
+        Call this after the simulation, with the termination time, to update the statistics of a dormant lock
+        """
+        if self.state.dormant:
+            self.catch_up(time - self.state.current_time, inclusive=True)
+            self.state.current_time = time
 
     def handle_gate_is_open(self):
         if len(self.state.vessels_in_lock) == 0:
@@ -173,21 +274,19 @@ class Lock(AtomicDEVS):
     def transfer_vessels_waiting_to_lock(self, vessels_waiting):
         assert len(self.state.vessels_in_lock) == 0
 
-        still_vessels_waiting = []
-        for idx, vessel in enumerate(vessels_waiting):
-            if self.can_fit_capacity(vessel):
-                self.state.vessels_in_lock.append(vessel)
-                # Update the current surface area
-                self.state.current_surface_area -= vessel.surface_area
-            else:
-                still_vessels_waiting.append(vessel)
-
-        # Reset the surface area
+        # The lock is empty
         self.state.current_surface_area = self.surface_area
-        return still_vessels_waiting
 
-    def can_fit_capacity(self, vessel):
-        return self.state.current_surface_area - vessel.surface_area >= 0
+        # Transfer the vessels selected by the packing strategy (in FCFS order)
+        for position in self.packing_strategy.select(vessels_waiting, self.state.current_surface_area):
+            vessel = vessels_waiting.remove(position)
+            self.state.vessels_in_lock.append(vessel)
+            # Update the current surface area
+            self.state.current_surface_area -= vessel.surface_area
+        assert self.state.current_surface_area >= 0
+
+        # The current surface area is the remaining surface area, until the next transfer
+        return vessels_waiting
 
     def swap_water_levels(self):
         if self.state.current_water_level == WaterLevel.HIGH:
@@ -0,0 +1,115 @@
+import time
+
+from models.utils.waiting_queue import WaitingQueue
+
+
+class ChamberPackingStrategy:
+    """
+    Decides which waiting vessels enter the chamber of a Lock (see Lock)
+
+    select() returns the positions (in the WaitingQueue) of the vessels to transfer, in FCFS order
+    Their total surface area fits in the given surface area
+    """
+    def select(self, vessels_waiting: WaitingQueue, surface_area: int) -> list[int]:
+        raise NotImplementedError
+
+
+class FirstFitStrategy(ChamberPackingStrategy):
+    """
+    Transfers the waiting vessels in FCFS order, skipping the vessels that do not fit (anymore)
+    The surface area only decreases, so the next vessel that fits is looked up after the previous one
+    O(log n) per transferred vessel
+    """
+    def select(self, vessels_waiting: WaitingQueue, surface_area: int) -> list[int]:
+        positions = []
+        position = vessels_waiting.first_fit(surface_area)
+        while position is not None:
+            positions.append(position)
+            surface_area -= vessels_waiting.vessels[position].surface_area
+            position = vessels_waiting.first_fit(surface_area, position + 1)
+        return positions
+
+
+class FirstFitDecreasingStrategy(ChamberPackingStrategy):
+    """
+    Considers the first window waiting vessels, from large to small surface area (ties in FCFS order)
+    Transfers each vessel that still fits
+    O(window log window)
+    """
+    def __init__(self, window: int = 64):
+        self.window = window
+
+    def select(self, vessels_waiting: WaitingQueue, surface_area: int) -> list[int]:
+        candidates = vessels_waiting.first(self.window)
+        candidates.sort(key=lambda candidate: -candidate[1].surface_area)
+        positions = []
+        for position, vessel in candidates:
+            if vessel.surface_area <= surface_area:
+                positions.append(position)
+                surface_area -= vessel.surface_area
+        return sorted(positions)
+
+
+class BestFitStrategy(ChamberPackingStrategy):
+    """
+    Considers the first window waiting vessels
+    Repeatedly transfers the vessel that leaves the least surface area (ties in FCFS order)
+    O(window * transferred vessels)
+    """
+    def __init__(self, window: int = 64):
+        self.window = window
+
+    def select(self, vessels_waiting: WaitingQueue, surface_area: int) -> list[int]:
+        candidates = vessels_waiting.first(self.window)
+        positions = []
+        while True:
+            best = None
+            for index, (position, vessel) in enumerate(candidates):
+                if vessel.surface_area <= surface_area and (
+                        best is None or vessel.surface_area > candidates[best][1].surface_area):
+                    best = index
+            if best is None:
+                return sorted(positions)
+            position, vessel = candidates.pop(best)
+            positions.append(position)
+            surface_area -= vessel.surface_area
+
+
+class KnapsackStrategy(ChamberPackingStrategy):
+    """
+    Considers the first window waiting vessels
+    Transfers the subset with the largest total surface area that fits (an exact 0/1 knapsack)
+
+    The reachable total surface areas are computed with a bitset (one Python int per vessel)
+    O(window * surface area / word size)
+    If this takes longer than time_limit seconds, the FirstFitDecreasingStrategy is used instead
+    (then the result depends on the speed of the machine)
+    """
+    def __init__(self, window: int = 32, time_limit: float = 0.01):
+        self.window = window
+        self.time_limit = time_limit
+        self.fallback = FirstFitDecreasingStrategy(window)
+
+    def select(self, vessels_waiting: WaitingQueue, surface_area: int) -> list[int]:
+        deadline = time.perf_counter() + self.time_limit
+        candidates = vessels_waiting.first(self.window)
+        mask = (1 << (surface_area + 1)) - 1
+
+        # Bit s of reachable[i] is set if a subset of the first i candidates has a total surface area of s
+        reachable = [1]
+        for _, vessel in candidates:
+            reachable.append((reachable[-1] | (reachable[-1] << vessel.surface_area)) & mask)
+            if time.perf_counter() > deadline:
+                return self.fallback.select(vessels_waiting, surface_area)
+
+        # Walk back from the largest reachable total surface area
+        # A candidate is taken if the total is not reachable without it
+        total = reachable[-1].bit_length() - 1
+        positions = []
+        for i in range(len(candidates) - 1, -1, -1):
+            if not (reachable[i] >> total) & 1:
+                position, vessel = candidates[i]
+                positions.append(position)
+                total -= vessel.surface_area
+        assert total == 0
+        return sorted(positions)
@@ -4,6 +4,10 @@ from dataclasses import dataclass
 @dataclass
 class PortEntryRequest:
     vessel_uid: int
+    # Used by the VesselTypeAwarePolicy of the ControlTower
+    vessel_type: str | None = None
+    # If set, the ControlTower uses this dock if it has a free spot (see TraceGenerator)
+    destination_dock: str | None = None
 
 
 @dataclass
@@ -15,3 +19,23 @@ class PortEntryPermission:
 @dataclass
 class PortDepartureRequest:
     dock: str
+
+
+def pack_messages(messages: list):
+    """
+    A model that sends several messages at once on the same port, sends them as a list
+    A single message is sent as is
+    """
+    assert len(messages) != 0
+    if len(messages) == 1:
+        return messages[0]
+    return list(messages)
+
+
+def unpack_messages(payload) -> list:
+    """
+    The inverse of pack_messages
+    """
+    if isinstance(payload, list):
+        return payload
+    return [payload]
@@ -1,8 +1,11 @@
 from pypdevs.DEVS import CoupledDEVS
 
 from models.generator import Generator
+from models.trace_generator import TraceGenerator
 from models.anchor_point import AnchorPoint
 from models.sea import Sea
+from models.vessel_store import VesselStore
+from models.vessel_sink import VesselSink
 from models.dock import Dock
 from models.lock import Lock
 from models.canal import Canal
@@ -10,24 +13,69 @@ from models.waterway import Waterway
 from models.uni_waterway import UniWaterway
 from models.confluence import Confluence
 from models.control_tower import ControlTower
+from models.dock_allocation import FirstAvailablePolicy, ShortestRoutePolicy
+
+import functools
+
+# The length of the route from the anchor point K to each dock (in km)
+# That is, K_to_node + node_to_CP + the waterways and canals after the confluence CP
+DOCK_ROUTE_LENGTHS = {
+    "1": 47.52 + 68.54 + 2.10 + 0.8 + 1.89,
+    "2": 47.52 + 68.54 + 2.10 + 0.8 + 2.39 + 1.13,
+    "3": 47.52 + 68.54 + 4.70 + 5.16 + 1.08 + 1.86,
+    "4": 47.52 + 68.54 + 4.70 + 5.16 + 1.08 + 1.30,
+    "5": 47.52 + 68.54 + 4.70 + 5.16 + 1.08 + 1.68,
+    "6": 47.52 + 68.54 + 4.70 + 3.14 + 0.89 + 1.24 + 1.37,
+    "7": 47.52 + 68.54 + 4.70 + 3.14 + 0.89 + 1.24 + 1.07,
+    "8": 47.52 + 68.54 + 4.70 + 3.14 + 0.89 + 2.40,
+}
 
 
 class PortNetwork(CoupledDEVS):
     """
     This is a CoupledDEVS of the full port network
+
+    The Generator generates num_vessels vessels
+
+    If batch_confluences is True, the Confluence's forward all vessels queued at the same time in one output event
+    The parameter dock_allocation_policy is passed to the ControlTower (see models.dock_allocation)
+    If it is "shortest_route", a ShortestRoutePolicy with the route lengths of this network is used (DOCK_ROUTE_LENGTHS)
+    The parameters generator_batch_size and arrival_process are passed to the Generator (see Generator)
+    If trace_path is given, the arrivals are replayed from this trace instead (see TraceGenerator)
+    If vessel_store is given, the Generator and the Sea use it (see VesselStore)
+    The parameters sea_statistics, keep_vessels and sea_sink are passed to the Sea (see Sea)
+    If fast_forward_locks is True, the Lock's skip their interval states while empty
+    Then, call settle_locks(termination_time) after the simulation, before reading their statistics (see Lock)
+    The parameter lock_packing_strategy is passed to the Lock's (see models.lock_packing)
     """
-    def __init__(self, name: str):
+    def __init__(self, name: str, batch_confluences: bool = False, dock_allocation_policy=FirstAvailablePolicy,
+                 generator_batch_size: int | None = None, arrival_process=None, trace_path: str | None = None,
+                 vessel_store: VesselStore | None = None, sea_statistics=None, keep_vessels: bool = True,
+                 sea_sink: VesselSink | None = None, fast_forward_locks: bool = False,
+                 lock_packing_strategy=None, num_vessels: int = 1000):
         CoupledDEVS.__init__(self, name)
+        self.num_vessels = num_vessels
+
+        if dock_allocation_policy == "shortest_route":
+            dock_allocation_policy = functools.partial(ShortestRoutePolicy, route_lengths=DOCK_ROUTE_LENGTHS)
 
         # CREATE ALL SUBMODELS
         # The vessel generator
-        self.generator = self.addSubModel(Generator('Generator', 1000))
+        if trace_path is None:
+            self.generator = self.addSubModel(
+                Generator('Generator', num_vessels, batch_size=generator_batch_size, arrival_process=arrival_process,
+                          vessel_store=vessel_store)
+            )
+        else:
+            self.generator = self.addSubModel(TraceGenerator('Generator', trace_path, vessel_store=vessel_store))
 
         # The anchor point K
         self.anchor_point = self.addSubModel(AnchorPoint('K'))
 
         # The sea S (which is a collector)
-        self.sea_collector = self.addSubModel(Sea('S'))
+        self.sea_collector = self.addSubModel(
+            Sea('S', vessel_store=vessel_store, statistics=sea_statistics, keep_vessels=keep_vessels, sink=sea_sink)
+        )
 
         # The Docks 1-8
         self.dock_1 = self.addSubModel(Dock('1'))
@@ -40,9 +88,12 @@ class PortNetwork(CoupledDEVS):
         self.dock_8 = self.addSubModel(Dock('8'))
 
         # The Locks A, B and C
-        self.lock_a = self.addSubModel(Lock('A', 20*60, 60*60, 7*60, 62500))
-        self.lock_b = self.addSubModel(Lock('B', 12*60, 45*60, 5*60, 34000))
-        self.lock_c = self.addSubModel(Lock('C', 8*60, 30*60, 5*60, 25650))
+        self.lock_a = self.addSubModel(Lock('A', 20*60, 60*60, 7*60, 62500, fast_forward=fast_forward_locks,
+                                                packing_strategy=lock_packing_strategy))
+        self.lock_b = self.addSubModel(Lock('B', 12*60, 45*60, 5*60, 34000, fast_forward=fast_forward_locks,
+                                                packing_strategy=lock_packing_strategy))
+        self.lock_c = self.addSubModel(Lock('C', 8*60, 30*60, 5*60, 25650, fast_forward=fast_forward_locks,
+                                                packing_strategy=lock_packing_strategy))
 
         # Uni waterways (K to first node, first node to S)
         self.uniwaterway1 = self.addSubModel(UniWaterway('K_to_node', 47.52))
@@ -76,25 +127,25 @@ class PortNetwork(CoupledDEVS):
             "sea_port": ["9"],
             "A_port": ["1", "2"],
             "B_C_port": ["3", "4", "5", "6", "7", "8"],
-        }))
+        }, batch=batch_confluences))
 
         self.confluence2 = self.addSubModel(Confluence('CP_B_C', {
             "sea_port": ["9"],
             "C_port": ["3", "4", "5"],
             "B_port": ["6", "7", "8"],
-        }))
+        }, batch=batch_confluences))
 
         self.confluence3 = self.addSubModel(Confluence('A_1_2', {
             "sea_port": ["9"],
             "1_port": ["1"],
             "2_port": ["2"],
-        }))
+        }, batch=batch_confluences))
 
         self.confluence4 = self.addSubModel(Confluence('A_2_C', {
             "sea_port": ["9"],
             "2_port": ["2"],
             "3_4_5_port": ["3", "4", "5"],
-        }))
+        }, batch=batch_confluences))
 
         self.confluence5 = self.addSubModel(Confluence('C_3_4_5', {
             "sea_port": ["9"],
@@ -102,19 +153,19 @@ class PortNetwork(CoupledDEVS):
             "4_port": ["4"],
             "5_port": ["5"],
             "1_2_port": ["1", "2"]
-        }))
+        }, batch=batch_confluences))
 
         self.confluence6 = self.addSubModel(Confluence('B_6_7_8', {
             "sea_port": ["9"],
             "8_port": ["8"],
             "6_7_port": ["6", "7"],
-        }))
+        }, batch=batch_confluences))
 
         self.confluence7 = self.addSubModel(Confluence('B_6_7', {
             "sea_port": ["9"],
             "6_port": ["6"],
             "7_port": ["7"],
-        }))
+        }, batch=batch_confluences))
 
         # The control tower
         self.control_tower = self.addSubModel(ControlTower("Control_tower", {
@@ -126,7 +177,7 @@ class PortNetwork(CoupledDEVS):
             "6": 50,
             "7": 50,
             "8": 50
-        }))
+        }, dock_allocation_policy=dock_allocation_policy))
 
         # CONNECT PORTS
         # Connect generator, anchorpoint, sea, uniwaterway1, uniwaterway2, waterway 1 and CP confluence1
@@ -260,4 +311,7 @@ class PortNetwork(CoupledDEVS):
         self.connectPorts(self.dock_7.out_port_departure_request, self.control_tower.in_port_depart_request)
         self.connectPorts(self.dock_8.out_port_departure_request, self.control_tower.in_port_depart_request)
 
-
+    def settle_locks(self, time: float):
+        # Only needed with fast_forward_locks (see Lock.settle)
+        for lock in [self.lock_a, self.lock_b, self.lock_c]:
+            lock.settle(time)
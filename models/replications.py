@@ -0,0 +1,214 @@
+"""
+Independent replications of the PortNetwork on a process pool
+
+    results = run_replications(32, base_seed=0, termination_time=1000000.0)
+    for metric, summary in summarize(results).items():
+        print(metric, summary.mean, summary.low, summary.high)
+
+Each replication builds its own PortNetwork in a worker process, with its own seed for random and np.random
+The seeds are spawned from base_seed (see np.random.SeedSequence), so the replications are independent
+and the same base_seed gives the same results, regardless of the number of workers
+A worker only returns the summary statistics of its replication (see run_replication), not the vessels
+
+Usage:
+    python -m models.replications --replications 32 --termination-time 1000000
+"""
+from pypdevs.simulator import Simulator
+
+import argparse
+import concurrent.futures
+import functools
+import math
+import multiprocessing
+import os
+import random
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from models.port_network import PortNetwork
+
+DEFAULT_TERMINATION_TIME = 1000000.0
+
+
+@dataclass
+class MetricSummary:
+    # The number of replications with a value for this metric
+    count: int
+    mean: float
+    # The sample standard deviation over the replications
+    std: float
+    # The confidence interval of the mean is [low, high] = mean -/+ half_width
+    half_width: float
+
+    @property
+    def low(self) -> float:
+        return self.mean - self.half_width
+
+    @property
+    def high(self) -> float:
+        return self.mean + self.half_width
+
+
+def get_seeds(num_replications: int, base_seed: int = 0) -> list[int]:
+    # One 32-bit seed per replication (np.random.seed only takes seeds below 2**32)
+    return [int(seed_sequence.generate_state(1)[0])
+            for seed_sequence in np.random.SeedSequence(base_seed).spawn(num_replications)]
+
+
+def run_replication(seed: int, termination_time: float = DEFAULT_TERMINATION_TIME,
+                    port_network_kwargs: dict | None = None) -> dict[str, float]:
+    """
+    Simulates one PortNetwork until termination_time, and returns its summary statistics:
+        metric -> value (NaN if there is no value, e.g. no vessels left the port)
+    The statistics of the Sea are accumulated online, so the vessels are not kept
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    kwargs = {"keep_vessels": False}
+    kwargs.update(port_network_kwargs or {})
+    system = PortNetwork(name="system", **kwargs)
+
+    sim = Simulator(system)
+    sim.setTerminationTime(termination_time)
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+
+    start = time.perf_counter()
+    sim.simulate()
+    wall_time = time.perf_counter() - start
+
+    system.settle_locks(termination_time)
+
+    statistics = system.sea_collector.state.statistics
+    time_in_system = statistics.overall["time_in_system"]
+    waiting_time_in_anchor_point = statistics.overall["waiting_time_in_anchor_point"]
+
+    result = {
+        "num_vessels_left": time_in_system.count,
+        "avg_time_in_system": time_in_system.mean if time_in_system.count != 0 else math.nan,
+        "p95_time_in_system": time_in_system.quantile(0.95) if time_in_system.count != 0 else math.nan,
+        "avg_waiting_time_in_anchor_point":
+            waiting_time_in_anchor_point.mean if waiting_time_in_anchor_point.count != 0 else math.nan,
+    }
+    for lock_name, lock in [("lock_a", system.lock_a), ("lock_b", system.lock_b), ("lock_c", system.lock_c)]:
+        result[f"{lock_name}_idle_time"] = lock.state.idle_time
+        result[f"{lock_name}_number_lock_state_changes_with_no_vessels"] = \
+            lock.state.number_lock_state_changes_with_no_vessels
+        result[f"{lock_name}_avg_remaining_surface_area"] = \
+            lock.state.sum_remaining_surface_area / lock.state.number_of_washings \
+            if lock.state.number_of_washings != 0 else math.nan
+    result["wall_time"] = wall_time
+    return result
+
+
+def run_replications(num_replications: int, base_seed: int = 0, max_workers: int | None = None,
+                     termination_time: float = DEFAULT_TERMINATION_TIME,
+                     port_network_kwargs: dict | None = None) -> list[dict[str, float]]:
+    """
+    Runs num_replications replications (see run_replication) on max_workers processes (default: all CPUs)
+    Returns the results in the order of the seeds (see get_seeds), each with its seed
+    """
+    seeds = get_seeds(num_replications, base_seed)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, num_replications)
+
+    # A fresh interpreter per worker, so the workers do not inherit the state of this process (e.g. the random state)
+    context = multiprocessing.get_context("spawn")
+    run = functools.partial(run_replication, termination_time=termination_time,
+                            port_network_kwargs=port_network_kwargs)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        results = list(executor.map(run, seeds))
+
+    return [{"seed": seed, **result} for seed, result in zip(seeds, results)]
+
+
+def student_t_cdf(t: float, df: int) -> float:
+    # The CDF of the Student's t-distribution with an integer number of degrees of freedom
+    # (the finite series of Abramowitz and Stegun 26.7.3 and 26.7.4)
+    theta = math.atan(abs(t) / math.sqrt(df))
+    cos2 = math.cos(theta) ** 2
+    if df % 2 == 1:
+        term = 0.0 if df == 1 else math.cos(theta)
+        total = term
+        for k in range(3, df - 1, 2):
+            term *= cos2 * (k - 1) / k
+            total += term
+        a = 2 / math.pi * (theta + math.sin(theta) * total)
+    else:
+        term = 1.0
+        total = term
+        for k in range(2, df - 1, 2):
+            term *= cos2 * (k - 1) / k
+            total += term
+        a = math.sin(theta) * total
+    return 0.5 + math.copysign(a / 2, t)
+
+
+def student_t_quantile(p: float, df: int) -> float:
+    # The inverse of student_t_cdf, for 0.5 <= p < 1 (by bisection)
+    low, high = 0.0, 1.0
+    while student_t_cdf(high, df) < p:
+        high *= 2
+    for _ in range(100):
+        mid = (low + high) / 2
+        if student_t_cdf(mid, df) < p:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+def summarize(results: list[dict[str, float]], confidence: float = 0.95) -> dict[str, MetricSummary]:
+    """
+    Aggregates the results of the replications, per metric:
+        the mean, and the confidence interval of the mean (Student's t, the replications are independent)
+    The NaN values are skipped, and with fewer than 2 values the half width is NaN
+    """
+    summaries = {}
+    for metric in results[0]:
+        if metric == "seed":
+            continue
+        values = [result[metric] for result in results if not math.isnan(result[metric])]
+        count = len(values)
+        if count == 0:
+            summaries[metric] = MetricSummary(count=0, mean=math.nan, std=math.nan, half_width=math.nan)
+            continue
+
+        mean = sum(values) / count
+        if count < 2:
+            std = half_width = math.nan
+        else:
+            std = math.sqrt(sum((value - mean) ** 2 for value in values) / (count - 1))
+            half_width = student_t_quantile((1 + confidence) / 2, count - 1) * std / math.sqrt(count)
+        summaries[metric] = MetricSummary(count=count, mean=mean, std=std, half_width=half_width)
+    return summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--replications", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--workers", type=int, help="the number of worker processes (default: all CPUs)")
+    parser.add_argument("--base-seed", type=int, default=0)
+    parser.add_argument("--termination-time", type=float, default=DEFAULT_TERMINATION_TIME)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_replications(args.replications, base_seed=args.base_seed, max_workers=args.workers,
+                               termination_time=args.termination_time)
+    wall_time = time.perf_counter() - start
+
+    print(f"{args.replications} replications in {wall_time:.1f}s, "
+          f"{args.confidence:.0%} confidence intervals of the mean")
+    print(f"{'metric':<55}{'mean':>14}{'half width':>14}{'low':>14}{'high':>14}")
+    for metric, summary in summarize(results, args.confidence).items():
+        print(f"{metric:<55}{summary.mean:>14.2f}{summary.half_width:>14.2f}"
+              f"{summary.low:>14.2f}{summary.high:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,10 @@ from pypdevs.DEVS import AtomicDEVS
 from dataclasses import dataclass, field
 
 from models.vessels import Vessel
+from models.vessel_store import VesselStore
+from models.vessel_sink import VesselSink
+from models.utils.online_stats import VesselStatistics
+from models.utils import my_log
 
 
 @dataclass
@@ -10,16 +14,36 @@ class SeaState:
     vessels: list[Vessel] = field(default_factory=list)
     current_time: float = 0.0
 
+    # Accumulates the statistics of the vessels, see VesselStatistics
+    statistics: VesselStatistics | None = None
+
 
 class Sea(AtomicDEVS):
     """
     A simple collector the collects Vessel's
+
+    If vessel_store is given, the vessels are StoredVessel's of this VesselStore
+    These are not collected in vessels, since the VesselStore already holds their data
+    Instead, use the statistics of the VesselStore
+
+    If statistics is given, each vessel is added to this accumulator (e.g. a VesselStatistics)
+    If keep_vessels is False, the vessels are not collected, so the memory use does not grow with the run
+    Then, a VesselStatistics is used by default (otherwise, no statistics are accumulated by default)
+
+    If sink is given, the record of each vessel is written to it (see VesselSink)
+    Close the sink after the simulation
     """
 
-    def __init__(self, name):
+    def __init__(self, name, vessel_store: VesselStore | None = None, statistics=None, keep_vessels: bool = True,
+                 sink: VesselSink | None = None):
         super(Sea, self).__init__(name)
+        self.vessel_store = vessel_store
+        self.sink = sink
+        self.keep_vessels = keep_vessels
         self.in_vessel = self.addInPort("in_vessel")
-        self.state = SeaState()
+        if statistics is None and not keep_vessels:
+            statistics = VesselStatistics()
+        self.state = SeaState(statistics=statistics)
 
     def extTransition(self, inputs):
         self.state.current_time += self.elapsed
@@ -30,6 +54,17 @@ class Sea(AtomicDEVS):
         assert isinstance(vessel, Vessel)
         vessel.time_in_system = self.state.current_time - vessel.creation_time
 
-        self.state.vessels.append(vessel)
+        if self.state.statistics is not None:
+            self.state.statistics.add(vessel)
+
+        if my_log.ENABLED:
+            my_log.log(self.state.current_time, self.name, "vessel_departed",
+                       uid=vessel.uid, vessel_type=vessel.vessel_type, time_in_system=vessel.time_in_system)
+
+        if self.sink is not None:
+            self.sink.add(vessel)
+
+        if self.keep_vessels and self.vessel_store is None:
+            self.state.vessels.append(vessel)
 
         return self.state
@@ -0,0 +1,146 @@
+from pypdevs.DEVS import AtomicDEVS
+from pypdevs.infinity import INFINITY
+
+from dataclasses import dataclass, field
+import os
+import numpy as np
+
+from models.vessels import ALL_VESSELS
+from models.vessel_store import VesselStore
+
+# A trace is a directory with one .npy file per column
+# All columns have one row per vessel, sorted by arrival time
+ARRIVAL_TIME_COLUMN = "arrival_time.npy"  # float64, in seconds
+VESSEL_TYPE_COLUMN = "vessel_type.npy"  # integer index into ALL_VESSELS
+DESTINATION_DOCK_COLUMN = "destination_dock.npy"  # optional, integer dock name, -1 if not fixed
+
+
+def write_trace(path: str, arrival_times, vessel_types, destination_docks=None):
+    """
+    Writes a trace that can be replayed by a TraceGenerator
+    """
+    arrival_times = np.asarray(arrival_times, dtype=np.float64)
+    vessel_types = np.asarray(vessel_types, dtype=np.int8)
+    assert arrival_times.shape == vessel_types.shape
+    assert np.all(np.diff(arrival_times) >= 0)
+    assert np.all((0 <= vessel_types) & (vessel_types < len(ALL_VESSELS)))
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, ARRIVAL_TIME_COLUMN), arrival_times)
+    np.save(os.path.join(path, VESSEL_TYPE_COLUMN), vessel_types)
+    if destination_docks is not None:
+        destination_docks = np.asarray(destination_docks, dtype=np.int16)
+        assert destination_docks.shape == arrival_times.shape
+        np.save(os.path.join(path, DESTINATION_DOCK_COLUMN), destination_docks)
+
+
+@dataclass
+class TraceGeneratorState:
+    # The remaining time until generation of new event
+    remaining_time: float = INFINITY
+    # The current simulation time
+    current_time: float = 0.0
+    # The number of vessels generated
+    num_vessels_generated: int = 0
+
+    # The rows of the trace that are currently loaded (one chunk)
+    # The row with index num_vessels_generated is at chunk_start + position
+    chunk_start: int = 0
+    arrival_times: list[float] = field(default_factory=list)
+    vessel_types: list[int] = field(default_factory=list)
+    destination_docks: list[int] | None = None
+
+
+class TraceGenerator(AtomicDEVS):
+    """
+    Replays a recorded trace of arrivals (see write_trace), instead of sampling them as the Generator does
+
+    The columns are memory-mapped, and read chunk_size rows at a time
+    So, the trace is never held in memory as a whole
+    If num_vessels_to_generate is given, only the first num_vessels_to_generate rows are replayed
+
+    If the trace has a destination_dock column, the vessels request that dock (see ControlTower)
+    If vessel_store is given, the vessels are added to it, and StoredVessel's are sent (see VesselStore)
+    """
+    def __init__(self, name, path: str, chunk_size: int = 65536, num_vessels_to_generate: int | None = None,
+                 vessel_store: VesselStore | None = None):
+        super(TraceGenerator, self).__init__(name)
+        self.vessel_store = vessel_store
+
+        # Memory-map the columns
+        self.arrival_times = np.load(os.path.join(path, ARRIVAL_TIME_COLUMN), mmap_mode="r")
+        self.vessel_types = np.load(os.path.join(path, VESSEL_TYPE_COLUMN), mmap_mode="r")
+        destination_dock_path = os.path.join(path, DESTINATION_DOCK_COLUMN)
+        if os.path.exists(destination_dock_path):
+            self.destination_docks = np.load(destination_dock_path, mmap_mode="r")
+        else:
+            self.destination_docks = None
+
+        self.chunk_size = chunk_size
+        self.num_vessels_to_generate = len(self.arrival_times)
+        if num_vessels_to_generate is not None:
+            self.num_vessels_to_generate = min(num_vessels_to_generate, self.num_vessels_to_generate)
+
+        # Sends Vessel's (the same as the Generator)
+        self.out = self.addOutPort("out")
+
+        self.state = TraceGeneratorState()
+
+        # Schedule the first vessel
+        if self.num_vessels_to_generate != 0:
+            self.load_chunk(0)
+            self.state.remaining_time = self.state.arrival_times[0]
+
+    def load_chunk(self, start: int):
+        # Only the rows [start, start + chunk_size) are read from disk
+        end = min(start + self.chunk_size, self.num_vessels_to_generate)
+        self.state.chunk_start = start
+        self.state.arrival_times = self.arrival_times[start:end].tolist()
+        self.state.vessel_types = self.vessel_types[start:end].tolist()
+        if self.destination_docks is not None:
+            self.state.destination_docks = self.destination_docks[start:end].tolist()
+
+    def intTransition(self):
+        # Update simulation time
+        self.state.current_time += self.timeAdvance()
+
+        # Register that we generated a vessel
+        self.state.num_vessels_generated += 1
+
+        # If more vessels should be generated
+        #   Schedule next event at the next arrival time
+        # Else
+        #   Do nothing anymore
+        if self.state.num_vessels_generated < self.num_vessels_to_generate:
+            position = self.state.num_vessels_generated - self.state.chunk_start
+            if position == len(self.state.arrival_times):
+                self.load_chunk(self.state.num_vessels_generated)
+                position = 0
+            self.state.remaining_time = max(self.state.arrival_times[position] - self.state.current_time, 0.0)
+        else:
+            self.state.remaining_time = INFINITY
+
+        return self.state
+
+    def timeAdvance(self):
+        # Return remaining time
+        return self.state.remaining_time
+
+    def outputFnc(self):
+        position = self.state.num_vessels_generated - self.state.chunk_start
+
+        vessel_ctor = ALL_VESSELS[self.state.vessel_types[position]]
+        if self.vessel_store is not None:
+            vessel = self.vessel_store.add(
+                vessel_ctor,
+                uid=self.state.num_vessels_generated,
+                creation_time=self.state.arrival_times[position]
+            )
+        else:
+            vessel = vessel_ctor(
+                uid=self.state.num_vessels_generated,
+                creation_time=self.state.arrival_times[position]
+            )
+        if self.state.destination_docks is not None and self.state.destination_docks[position] >= 0:
+            vessel.destination_dock = str(self.state.destination_docks[position])
+        return {self.out: vessel}
@@ -1,9 +1,10 @@
 from pypdevs.DEVS import AtomicDEVS
 from pypdevs.infinity import INFINITY
 
+from collections import deque
 from dataclasses import dataclass, field
 
-from models.vessels import Vessel
+from models.vessels import Vessel, unpack_vessels
 from models.utils.math import get_time_in_seconds
 
 
@@ -14,17 +15,24 @@ class UniCanalState:
     # Instead, we first wait for an input event
     remaining_time: float = INFINITY
 
-    # The list that stores the vessels in this canal
-    vessels: list[Vessel] = field(default_factory=list)
+    # The current simulation time
+    current_time: float = 0.0
 
-    # The list that stores the timers associated with the vessels in vessel_queue
-    # The association is by index
-    timers: list[float] = field(default_factory=list)
+    # The queue that stores the vessels in this canal
+    # Vessels cannot overtake each other, so the next vessel to leave is ALWAYS at the head of the queue
+    vessels: deque[Vessel] = field(default_factory=deque)
 
-    real_velocities: list[float] = field(default_factory=list)
+    # The queue that stores the (absolute) exit times associated with the vessels in vessels
+    # The association is by index
+    # The exit times are absolute, so they do not have to be lowered on every event
+    exit_times: deque[float] = field(default_factory=deque)
 
-    # Note that there is no need for index_for_next_vessel as in UniWaterwayState
-    # In this case, the next-index is always 0
+    # The queue that stores the real velocities associated with the vessels in vessels
+    # The association is by index
+    # A vessel sails at the lowest velocity of itself and the vessels ahead of it,
+    # so the real velocities are non-increasing from head to tail (a monotonic queue)
+    # That is, the lowest velocity in the canal is ALWAYS at the tail of the queue
+    real_velocities: deque[float] = field(default_factory=deque)
 
 
 class UniCanal(AtomicDEVS):
@@ -43,26 +51,26 @@ class UniCanal(AtomicDEVS):
         self.state = UniCanalState()
 
     def extTransition(self, inputs):
-        # Apply the pattern: Ignore an Event (see MOSIS)
-        self.state.timers = [timer - self.elapsed for timer in self.state.timers]
+        # Update simulation time
+        self.state.current_time += self.elapsed
 
         if self.in_vessel in inputs:
-            # Get the vessel
-            vessel = inputs[self.in_vessel]
-            assert isinstance(vessel, Vessel)
+            # Get the vessel(s), in the order they enter the canal
+            for vessel in unpack_vessels(inputs[self.in_vessel]):
+                assert isinstance(vessel, Vessel)
 
-            # Get the timer
-            timer = self.get_timer(vessel)
+                # Get the timer
+                timer = self.get_timer(vessel)
 
-            # Enqueue the vessel and its timer
-            self.state.vessels.append(vessel)
-            self.state.timers.append(timer)
+                # Enqueue the vessel and its exit time
+                self.state.vessels.append(vessel)
+                self.state.exit_times.append(self.state.current_time + timer)
         else:
             assert False
 
         # The next vessel to leave, is ALWAYS the vessel at the head of the queue
-        # Use the timer of this vessel to schedule the next output event
-        self.state.remaining_time = self.state.timers[0]
+        # Use the exit time of this vessel to schedule the next output event
+        self.generate_at_head_exit_time()
 
         return self.state
 
@@ -71,29 +79,22 @@ class UniCanal(AtomicDEVS):
             # The vessel is alone in its direction
 
             # The vessel does not need to consider other vessels
-            timer = get_time_in_seconds(
-                distance_in_km=self.distance_in_km,
-                velocity_in_knot=vessel.avg_velocity
-            )
-            self.state.real_velocities.append(vessel.avg_velocity)
+            lowest_v = vessel.avg_velocity
         else:
             # The vessel is NOT alone in its directions
 
-            # Get the lowest velocity of the entire canal
-            lowest_v = min(self.state.real_velocities)
-            lowest_v = min(vessel.avg_velocity, lowest_v)
-            self.state.real_velocities.append(lowest_v)
+            # Get the lowest velocity of the entire canal (at the tail of the monotonic queue)
+            lowest_v = min(vessel.avg_velocity, self.state.real_velocities[-1])
+
+        self.state.real_velocities.append(lowest_v)
 
-            # Compute the timer with this velocity
-            timer = get_time_in_seconds(
-                distance_in_km=self.distance_in_km,
-                velocity_in_knot=lowest_v
-            )
-        return timer
+        # Compute the timer with this velocity
+        return get_time_in_seconds(
+            distance_in_km=self.distance_in_km,
+            velocity_in_knot=lowest_v
+        )
 
     def timeAdvance(self):
-        if self.state.remaining_time < 0:
-            pass
         return self.state.remaining_time
 
     def outputFnc(self):
@@ -101,22 +102,28 @@ class UniCanal(AtomicDEVS):
         return {self.out_vessel: self.state.vessels[0]}
 
     def intTransition(self):
-        # Remove the vessel we just sent (and its timer)
+        # Update simulation time
+        self.state.current_time += self.state.remaining_time
+
+        # Remove the vessel we just sent (and its exit time and real velocity)
         # This is ALWAYS the vessel at the head of the queue
-        self.state.vessels.pop(0)
-        self.state.timers.pop(0)
-        self.state.real_velocities.pop(0)
+        self.state.vessels.popleft()
+        self.state.exit_times.popleft()
+        self.state.real_velocities.popleft()
 
-        # If there are no more vessels in this waterway,
+        # If there are no more vessels in this canal,
         # wait INDEFINITELY for the next input event
         if len(self.state.vessels) == 0:
             self.state.remaining_time = INFINITY
         else:
-            # Lower the timers
-            self.state.timers = [timer - self.state.remaining_time for timer in self.state.timers]
-
             # The next vessel to leave, is ALWAYS the vessel at the head of the queue
-            # Use the timer of this vessel to schedule the next output event
-            self.state.remaining_time = self.state.timers[0]
+            # Use the exit time of this vessel to schedule the next output event
+            self.generate_at_head_exit_time()
 
         return self.state
+
+    def generate_at_head_exit_time(self):
+        # Assume that the canal contains at least one vessel
+        assert len(self.state.vessels) != 0
+
+        self.state.remaining_time = max(self.state.exit_times[0] - self.state.current_time, 0.0)
@@ -3,8 +3,9 @@ from pypdevs.infinity import INFINITY
 
 from dataclasses import dataclass, field
 
-from models.vessels import Vessel
+from models.vessels import Vessel, unpack_vessels
 from models.utils.math import get_time_in_seconds
+from models.utils.timer_queue import TimerQueue
 
 
 @dataclass
@@ -14,15 +15,9 @@ class UniWaterwayState:
     # Instead, we first wait for an input event
     remaining_time: float = INFINITY
 
-    # The list that stores the vessels in this waterway
-    vessels: list[Vessel] = field(default_factory=list)
-
-    # The list that stores the timers associated with the vessels in vessels
-    # The association is by index
-    timers: list[float] = field(default_factory=list)
-
-    # The index into vessels for the vessel with the smallest timer
-    index_for_next_vessel: int | None = None
+    # The priority queue that stores the vessels in this waterway, by departure time
+    # Ties on the departure time are broken by the vessel uid
+    vessels: TimerQueue = field(default_factory=TimerQueue)
 
 
 class UniWaterway(AtomicDEVS):
@@ -42,28 +37,27 @@ class UniWaterway(AtomicDEVS):
 
     def extTransition(self, inputs):
         # Apply the pattern: Ignore an Event (see MOSIS)
-        self.state.timers = [timer - self.elapsed for timer in self.state.timers]
+        self.state.vessels.advance(self.elapsed)
 
         if self.in_vessel in inputs:
-            # Get the vessel
-            vessel = inputs[self.in_vessel]
-            assert isinstance(vessel, Vessel)
-
-            # Get the timer
-            timer = get_time_in_seconds(
-                distance_in_km=self.distance_in_km,
-                velocity_in_knot=vessel.avg_velocity
-            )
-
-            # Enqueue the vessel and its timer
-            self.state.vessels.append(vessel)
-            self.state.timers.append(timer)
+            # Get the vessel(s)
+            for vessel in unpack_vessels(inputs[self.in_vessel]):
+                assert isinstance(vessel, Vessel)
+
+                # Get the timer
+                timer = get_time_in_seconds(
+                    distance_in_km=self.distance_in_km,
+                    velocity_in_knot=vessel.avg_velocity
+                )
+
+                # Enqueue the vessel and its timer
+                self.state.vessels.push(timer, vessel.uid, vessel)
         else:
             assert False
 
         # Generate the next output event at the smallest timer
         # Necessary, since it could be that the new vessel leaves the waterway first
-        self.generate_at_smallest_timer()
+        self.state.remaining_time = self.state.vessels.remaining_time()
 
         return self.state
 
@@ -72,41 +66,18 @@ class UniWaterway(AtomicDEVS):
 
     def outputFnc(self):
         # Check precondition
-        assert self.state.index_for_next_vessel is not None
+        assert len(self.state.vessels) != 0
 
         # Send the vessel for which the timer expired
-        return {self.out_vessel: self.state.vessels[self.state.index_for_next_vessel]}
+        return {self.out_vessel: self.state.vessels.peek()}
 
     def intTransition(self):
-        # Remove the vessel we just sent (and its timer)
-        self.state.vessels.pop(self.state.index_for_next_vessel)
-        self.state.timers.pop(self.state.index_for_next_vessel)
-
-        # If there are no more vessels in this waterway,
-        # wait INDEFINITELY for the next input event
-        if len(self.state.vessels) == 0:
-            self.state.remaining_time = INFINITY
-        else:
-            # Lower the timers
-            self.state.timers = [timer - self.state.remaining_time for timer in self.state.timers]
+        # Remove the vessel we just sent
+        self.state.vessels.advance(self.state.remaining_time)
+        self.state.vessels.pop()
 
-            # Generate the next output event at the smallest timer
-            self.generate_at_smallest_timer()
+        # If there are no more vessels in this waterway, wait INDEFINITELY for the next input event
+        # Else, generate the next output event at the smallest timer
+        self.state.remaining_time = self.state.vessels.remaining_time()
 
         return self.state
-
-    def generate_at_smallest_timer(self):
-        # Assume that the waterway contains at least one vessel
-        assert len(self.state.vessels) != 0
-
-        # Lookup the smallest timer
-        min_index, min_timer = min(
-            enumerate(self.state.timers),
-            key=lambda p: p[1]
-        )
-
-        # Generate the next output event at the smallest timer
-        self.state.remaining_time = min_timer
-
-        # Store the index of the vessel with the smallest timer
-        self.state.index_for_next_vessel = min_index
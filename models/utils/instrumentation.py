@@ -0,0 +1,146 @@
+"""
+Opt-in instrumentation of the AtomicDEVS models in a coupled model
+
+    instrumentation = Instrumentation(system)
+    instrumentation.attach(sim)  # the report is printed at the end of sim.simulate()
+    sim.simulate()
+
+The methods of each AtomicDEVS are wrapped on the instance (pypdevs itself is not changed)
+Without an Instrumentation (or after remove()), the models run their own methods, so there is no overhead
+"""
+from pypdevs.DEVS import AtomicDEVS
+
+from dataclasses import dataclass, field
+import sys
+import time
+
+INSTRUMENTED_METHODS = ["extTransition", "intTransition", "outputFnc", "timeAdvance"]
+
+
+@dataclass
+class MethodStats:
+    calls: int = 0
+    # In nanoseconds
+    total_time: int = 0
+    max_time: int = 0
+
+
+@dataclass
+class ModelStats:
+    # The full name of the model, e.g. system.Lock_A
+    name: str
+    # Maps: method name -> MethodStats
+    methods: dict[str, MethodStats] = field(default_factory=lambda: {
+        method_name: MethodStats() for method_name in INSTRUMENTED_METHODS
+    })
+    # The number of transitions without simulated time since the previous transition of this model
+    zero_time_transitions: int = 0
+    # The last time advance of this model
+    last_time_advance: float | None = None
+
+    @property
+    def total_time(self) -> int:
+        return sum(method_stats.total_time for method_stats in self.methods.values())
+
+
+class Instrumentation:
+    """
+    Records, per AtomicDEVS:
+        the number of calls, the cumulative and the max wall time of each method
+        the number of zero-time transitions
+    """
+    def __init__(self, model):
+        # Maps: AtomicDEVS -> ModelStats
+        self.stats: dict[AtomicDEVS, ModelStats] = {}
+        self.simulator = None
+        self._add(model, "")
+
+    def _add(self, model, prefix: str):
+        name = prefix + model.name
+        if isinstance(model, AtomicDEVS):
+            self.stats[model] = ModelStats(name)
+            for method_name in INSTRUMENTED_METHODS:
+                setattr(model, method_name, self._wrap(model, method_name))
+        else:
+            for submodel in model.component_set:
+                self._add(submodel, name + ".")
+
+    def _wrap(self, model, method_name: str):
+        # The bound method of the class (not a wrapper of a previous Instrumentation)
+        method = getattr(type(model), method_name).__get__(model)
+        model_stats = self.stats[model]
+        method_stats = model_stats.methods[method_name]
+        perf_counter_ns = time.perf_counter_ns
+
+        if method_name == "timeAdvance":
+            def wrapper():
+                start = perf_counter_ns()
+                result = method()
+                duration = perf_counter_ns() - start
+                method_stats.calls += 1
+                method_stats.total_time += duration
+                if duration > method_stats.max_time:
+                    method_stats.max_time = duration
+                model_stats.last_time_advance = result
+                return result
+        else:
+            def wrapper(*args):
+                start = perf_counter_ns()
+                result = method(*args)
+                duration = perf_counter_ns() - start
+                method_stats.calls += 1
+                method_stats.total_time += duration
+                if duration > method_stats.max_time:
+                    method_stats.max_time = duration
+                if method_name == "intTransition":
+                    if model_stats.last_time_advance == 0:
+                        model_stats.zero_time_transitions += 1
+                elif method_name == "extTransition":
+                    if model.elapsed == 0:
+                        model_stats.zero_time_transitions += 1
+                return result
+        return wrapper
+
+    def attach(self, simulator):
+        """
+        Prints the report at the end of simulator.simulate()
+        """
+        self.simulator = simulator
+        simulate = type(simulator).simulate.__get__(simulator)
+
+        def wrapper(*args, **kwargs):
+            result = simulate(*args, **kwargs)
+            self.report()
+            return result
+        simulator.simulate = wrapper
+
+    def remove(self):
+        """
+        Restores the methods of the models (and of the simulator)
+        """
+        for model in self.stats:
+            for method_name in INSTRUMENTED_METHODS:
+                model.__dict__.pop(method_name, None)
+        if self.simulator is not None:
+            self.simulator.__dict__.pop("simulate", None)
+            self.simulator = None
+
+    def sorted_stats(self) -> list[ModelStats]:
+        # The most expensive models first
+        return sorted(self.stats.values(), key=lambda model_stats: model_stats.total_time, reverse=True)
+
+    def report(self, file=None):
+        file = file if file is not None else sys.stdout
+        header = f"{'model':<40}{'total ms':>10}"
+        for method_name in INSTRUMENTED_METHODS:
+            header += f"{method_name + ' calls':>20}{'max us':>10}"
+        header += f"{'zero-time':>11}"
+        print(header, file=file)
+
+        for model_stats in self.sorted_stats():
+            line = f"{model_stats.name:<40}{model_stats.total_time / 1e6:>10.2f}"
+            for method_name in INSTRUMENTED_METHODS:
+                method_stats = model_stats.methods[method_name]
+                line += f"{method_stats.calls:>20}{method_stats.max_time / 1e3:>10.1f}"
+            line += f"{model_stats.zero_time_transitions:>11}"
+            print(line, file=file)
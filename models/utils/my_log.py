@@ -1,3 +1,173 @@
+"""
+A buffered, level-gated log of simulation events
+
+Logging of events is off by default, and then a log call costs one module attribute lookup, if guarded like this:
+
+    from models.utils import my_log
+
+    if my_log.ENABLED:
+        my_log.log(sim_time, self.name, "vessel_departed", uid=vessel.uid)
+
+When logging is on (see configure), each event is one JSON line with the fields
+    sim_time, level, model, event, and any extra fields
+The lines are buffered, and written when the buffer is full, when flush_interval seconds have passed, and at exit
+Without a background thread, the flush_interval is only checked on each log call
+With background=True, a thread does the writing, and also flushes the buffer every flush_interval seconds
+
+Free-form lines (see my_log) are always written: buffered when logging is on, else directly to log.txt
+"""
+import atexit
+import json
+import queue
+import threading
+import time
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+
+LEVEL_NAMES = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    WARNING: "WARNING",
+}
+
+# True if logging is on (at any level), check this before calling log
+ENABLED = False
+
+# The minimum level that is logged
+LEVEL = INFO
+
+# The current LogWriter (or None if logging is off)
+_writer = None
+
+
+class LogWriter:
+    """
+    Buffers lines, and appends them to a file in batches
+
+    If background is True, the lines are passed to a thread that does the writing,
+    so the simulation never waits for the file
+    The thread also wakes up every flush_interval seconds, to flush lines that were buffered since
+    """
+    def __init__(self, path: str, buffer_size: int = 1024, flush_interval: float = 1.0, background: bool = False):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.file = open(path, "a")
+
+        self.buffer: list[str] = []
+        self.last_flush_time = time.monotonic()
+        # Guards buffer, which the background thread also flushes
+        self.lock = threading.Lock()
+
+        self.queue = None
+        self.thread = None
+        if background:
+            # Each item is a list of lines, or None to stop
+            self.queue = queue.SimpleQueue()
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def write(self, line: str):
+        with self.lock:
+            self.buffer.append(line)
+            if len(self.buffer) >= self.buffer_size or time.monotonic() - self.last_flush_time >= self.flush_interval:
+                self.flush_locked()
+
+    def flush(self):
+        with self.lock:
+            self.flush_locked()
+
+    def flush_locked(self):
+        self.last_flush_time = time.monotonic()
+        if len(self.buffer) == 0:
+            return
+        lines, self.buffer = self.buffer, []
+        if self.queue is not None:
+            self.queue.put(lines)
+        else:
+            self.write_lines(lines)
+
+    def write_lines(self, lines: list[str]):
+        self.file.write("\n".join(lines) + "\n")
+        self.file.flush()
+
+    def run(self):
+        while True:
+            try:
+                lines = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # No lines were passed for flush_interval seconds, flush the buffered lines (if any)
+                if time.monotonic() - self.last_flush_time >= self.flush_interval:
+                    self.flush()
+                continue
+            if lines is None:
+                return
+            self.write_lines(lines)
+
+    def close(self):
+        self.flush()
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+        self.file.close()
+
+
+def configure(path: str = "log.txt", level: int = INFO, buffer_size: int = 1024, flush_interval: float = 1.0,
+              background: bool = False):
+    """
+    Turns logging on, appending to path
+    """
+    global ENABLED, LEVEL, _writer
+    disable()
+    _writer = LogWriter(path, buffer_size=buffer_size, flush_interval=flush_interval, background=background)
+    LEVEL = level
+    ENABLED = True
+
+
+def disable():
+    """
+    Turns logging off, after writing the buffered lines
+    """
+    global ENABLED, _writer
+    ENABLED = False
+    if _writer is not None:
+        _writer.close()
+        _writer = None
+
+
+def flush():
+    if _writer is not None:
+        _writer.flush()
+
+
+def is_enabled_for(level: int) -> bool:
+    return ENABLED and level >= LEVEL
+
+
+def log(sim_time: float | None, model: str | None, event: str, level: int = INFO, **fields):
+    """
+    Logs an event of a model at simulation time sim_time, with extra fields (JSON serializable)
+    """
+    if not ENABLED or level < LEVEL:
+        return
+    record = {"sim_time": sim_time, "level": LEVEL_NAMES.get(level, level), "model": model, "event": event}
+    record.update(fields)
+    _writer.write(json.dumps(record))
+
+
 def my_log(string):
-    with open('log.txt', 'a') as fh:
-        fh.write(string + '\n')
+    """
+    Logs a free-form line
+    When logging is on, the line is buffered with the events (see configure)
+    Else, it is appended to log.txt right away, so callers do not have to call configure first
+    """
+    if ENABLED:
+        _writer.write(string)
+    else:
+        with open('log.txt', 'a') as fh:
+            fh.write(string + '\n')
+
+
+atexit.register(disable)
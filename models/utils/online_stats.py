@@ -0,0 +1,149 @@
+import bisect
+import math
+
+
+class P2Quantile:
+    """
+    Estimates the p-quantile of a stream in O(1) memory, with the P² algorithm
+    (Jain and Chlamtac, 1985)
+
+    Five markers track the minimum, the p/2-, p-, (1+p)/2-quantile and the maximum
+    Their heights are adjusted with a piecewise-parabolic interpolation on every observation
+    """
+    def __init__(self, p: float):
+        assert 0 < p < 1
+        self.p = p
+        # The marker heights (the first 5 observations, until there are 5)
+        self.heights: list[float] = []
+        # The actual and desired marker positions (1-based)
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired_positions = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: float):
+        heights = self.heights
+        if len(heights) < 5:
+            bisect.insort(heights, x)
+            return
+
+        # Find the cell k, such that heights[k] <= x < heights[k + 1]
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = bisect.bisect_right(heights, x, 1, 4) - 1
+
+        # Shift the markers above the cell
+        for i in range(k + 1, 5):
+            self.positions[i] += 1
+        for i in range(5):
+            self.desired_positions[i] += self.increments[i]
+
+        # Adjust the middle markers, if they are off from their desired position
+        positions = self.positions
+        for i in range(1, 4):
+            d = self.desired_positions[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                d = 1 if d > 0 else -1
+                height = self.parabolic(i, d)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self.linear(i, d)
+                heights[i] = height
+                positions[i] += d
+
+    def parabolic(self, i: int, d: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def linear(self, i: int, d: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+    @property
+    def value(self) -> float:
+        if len(self.heights) == 0:
+            return math.nan
+        if len(self.heights) < 5:
+            # Exact, with the nearest rank
+            rank = max(math.ceil(self.p * len(self.heights)), 1)
+            return self.heights[rank - 1]
+        return self.heights[2]
+
+
+class OnlineStatistics:
+    """
+    The count, mean, variance (Welford), min, max and quantiles (P²) of a stream, in O(1) memory
+    """
+    def __init__(self, quantiles: tuple[float, ...] = (0.5, 0.95)):
+        self.count = 0
+        self.mean = 0.0
+        # The sum of squared differences from the mean
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.quantiles = {p: P2Quantile(p) for p in quantiles}
+
+    def add(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        for quantile in self.quantiles.values():
+            quantile.add(x)
+
+    @property
+    def variance(self) -> float:
+        # The sample variance
+        if self.count < 2:
+            return math.nan
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, p: float) -> float:
+        return self.quantiles[p].value
+
+
+class VesselStatistics:
+    """
+    Accumulates OnlineStatistics of attributes of Vessel's (metrics), overall and per vessel_type
+    Attributes that are None (not set for this vessel) are skipped
+
+    This is the default accumulator of the Sea
+    Any object with a method add(vessel) can be used instead
+    """
+    def __init__(self, metrics: tuple[str, ...] = ("time_in_system", "waiting_time_in_anchor_point"),
+                 quantiles: tuple[float, ...] = (0.5, 0.95)):
+        self.metrics = metrics
+        self.quantiles = quantiles
+
+        # The statistics maps:
+        #   metric -> OnlineStatistics
+        self.overall = {metric: OnlineStatistics(quantiles) for metric in metrics}
+        # The statistics per vessel type maps:
+        #   vessel_type -> metric -> OnlineStatistics
+        self.per_vessel_type: dict[str, dict[str, OnlineStatistics]] = {}
+
+    def add(self, vessel):
+        per_vessel_type = self.per_vessel_type.get(vessel.vessel_type)
+        if per_vessel_type is None:
+            per_vessel_type = {metric: OnlineStatistics(self.quantiles) for metric in self.metrics}
+            self.per_vessel_type[vessel.vessel_type] = per_vessel_type
+
+        for metric in self.metrics:
+            x = getattr(vessel, metric)
+            if x is not None:
+                self.overall[metric].add(x)
+                per_vessel_type[metric].add(x)
@@ -0,0 +1,67 @@
+from pypdevs.infinity import INFINITY
+
+import heapq
+import itertools
+
+
+class TimerQueue:
+    """
+    A priority queue of items that each expire after some timer
+
+    The timers are stored as absolute deadlines in a binary heap,
+    so they do not have to be lowered on every event (see the pattern: Ignore an Event in MOSIS).
+    Instead, the clock of the queue is advanced with advance().
+
+    Ties on the deadline are broken by the uid of the item, and then by insertion order.
+
+    push, pop: O(log n)
+    peek, advance, remaining_time, len: O(1)
+    """
+    def __init__(self, entries=None):
+        # The current simulation time of this queue
+        self.current_time = 0.0
+
+        # Breaks ties between entries with an equal deadline and uid (FIFO)
+        # This way, the items themselves are never compared
+        self._counter = itertools.count()
+
+        # The binary heap, each entry is a tuple (deadline, uid, count, item)
+        self._heap = []
+        if entries is not None:
+            # The entries are tuples (timer, uid, item), relative to current_time
+            # Build the heap in one step
+            self._heap = [
+                (self.current_time + timer, uid, next(self._counter), item) for timer, uid, item in entries
+            ]
+            heapq.heapify(self._heap)
+
+    def advance(self, elapsed: float):
+        # Advance the clock, the deadlines stay as they are
+        self.current_time += elapsed
+
+    def push(self, timer: float, uid: int, item):
+        # Enqueue the item at its (absolute) deadline
+        heapq.heappush(self._heap, (self.current_time + timer, uid, next(self._counter), item))
+
+    def peek(self):
+        # Return the item with the smallest deadline
+        return self._heap[0][3]
+
+    def pop(self):
+        # Remove and return the item with the smallest deadline
+        return heapq.heappop(self._heap)[3]
+
+    def remaining_time(self) -> float:
+        # The time until the smallest deadline expires
+        # If the queue is empty, wait INDEFINITELY
+        if len(self._heap) == 0:
+            return INFINITY
+        return max(self._heap[0][0] - self.current_time, 0.0)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        # Iterate over the items in deadline order
+        for _, _, _, item in sorted(self._heap):
+            yield item
@@ -0,0 +1,110 @@
+import math
+
+from models.vessels import Vessel
+
+
+class WaitingQueue:
+    """
+    A FCFS queue of waiting Vessel's, that supports first-fit by surface area (see Lock)
+
+    The vessels are stored in arrival order, in slots
+    A segment tree over the slots stores the minimum surface area of each subtree
+    (an empty slot, of a vessel that left, has an infinite surface area)
+    This way, the first vessel that fits in a remaining surface area is found without a scan
+
+    append: amortized O(1), the slots are compacted when full
+    first_fit, remove: O(log n)
+    first: O(n + number of empty slots in between)
+    len: O(1)
+    """
+    def __init__(self, vessels=()):
+        self.vessels: list[Vessel | None] = []
+        self.num_vessels = 0
+        # All the slots before start are empty
+        self.start = 0
+        self.rebuild(list(vessels))
+
+    def __len__(self):
+        return self.num_vessels
+
+    def __iter__(self):
+        # In arrival order
+        return (vessel for vessel in self.vessels[self.start:] if vessel is not None)
+
+    def first(self, n: int) -> list[tuple[int, Vessel]]:
+        # The first n vessels in arrival order, with their positions
+        candidates = []
+        for position in range(self.start, len(self.vessels)):
+            if len(candidates) == n:
+                break
+            vessel = self.vessels[position]
+            if vessel is not None:
+                candidates.append((position, vessel))
+        return candidates
+
+    def rebuild(self, vessels: list[Vessel]):
+        # Leave room for as many vessels again, before the next rebuild
+        self.size = 16
+        while self.size < 2 * len(vessels):
+            self.size *= 2
+
+        self.vessels = vessels
+        self.num_vessels = len(vessels)
+        self.start = 0
+
+        self.tree = [math.inf] * (2 * self.size)
+        for position, vessel in enumerate(vessels):
+            self.tree[self.size + position] = vessel.surface_area
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = min(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def append(self, vessel: Vessel):
+        if len(self.vessels) == self.size:
+            # Compact the slots
+            self.rebuild(list(self))
+
+        self.vessels.append(vessel)
+        self.num_vessels += 1
+        self._update(len(self.vessels) - 1, vessel.surface_area)
+
+    def remove(self, position: int) -> Vessel:
+        vessel = self.vessels[position]
+        assert vessel is not None
+        self.vessels[position] = None
+        self.num_vessels -= 1
+        self._update(position, math.inf)
+
+        while self.start < len(self.vessels) and self.vessels[self.start] is None:
+            self.start += 1
+        return vessel
+
+    def _update(self, position: int, surface_area: float):
+        node = self.size + position
+        self.tree[node] = surface_area
+        node //= 2
+        while node >= 1:
+            self.tree[node] = min(self.tree[2 * node], self.tree[2 * node + 1])
+            node //= 2
+
+    def first_fit(self, surface_area: float, position: int = 0) -> int | None:
+        # The first slot >= position with a vessel that fits in surface_area, or None if there is no such slot
+        position = max(position, self.start)
+        if position >= len(self.vessels):
+            return None
+        node = self.size + position
+        if self.tree[node] <= surface_area:
+            return position
+
+        # Go up, until we can go right into a subtree with a vessel that fits
+        while node > 1:
+            if node % 2 == 0 and self.tree[node + 1] <= surface_area:
+                node += 1
+                break
+            node //= 2
+        else:
+            return None
+
+        # Go down, to the leftmost vessel that fits in this subtree
+        while node < self.size:
+            node = 2 * node if self.tree[2 * node] <= surface_area else 2 * node + 1
+        return node - self.size
@@ -0,0 +1,86 @@
+import glob
+import os
+import numpy as np
+
+from models.vessels import Vessel, ALL_VESSELS
+
+# The index of each vessel type in ALL_VESSELS
+# By name, so that it also works for StoredVessel's
+VESSEL_TYPE_INDICES_BY_NAME = {vessel_ctor.vessel_type: index for index, vessel_ctor in enumerate(ALL_VESSELS)}
+
+# One record per departed vessel
+# Missing values are -1 for the integer fields and NaN for the float fields
+VESSEL_RECORD_DTYPE = np.dtype([
+    ("uid", np.int64),
+    ("type_index", np.int8),  # index into ALL_VESSELS
+    ("served_dock", np.int16),  # integer dock name (see Vessel.served_dock)
+    ("creation_time", np.float64),
+    ("time_in_system", np.float64),
+    ("waiting_time_in_anchor_point", np.float64),
+])
+
+
+class VesselSink:
+    """
+    Writes the records of the departed vessels to disk (see Sea)
+
+    The records are buffered in a NumPy record array of chunk_size rows
+    A full chunk is written to path/chunk_<index>.npy, so at most one chunk is held in memory
+    Call close() after the simulation to write the last (partial) chunk
+
+    The chunks can be memory-mapped afterwards with load_chunks
+    """
+    def __init__(self, path: str, chunk_size: int = 65536):
+        self.path = path
+        self.chunk_size = chunk_size
+        os.makedirs(self.path, exist_ok=True)
+
+        self.chunk = np.empty(chunk_size, dtype=VESSEL_RECORD_DTYPE)
+        # The number of records in chunk
+        self.num_records = 0
+        # The number of chunks written
+        self.num_chunks = 0
+
+    def add(self, vessel: Vessel):
+        # Assigning a tuple to a record is much faster than assigning the fields one by one
+        self.chunk[self.num_records] = (
+            vessel.uid,
+            VESSEL_TYPE_INDICES_BY_NAME[vessel.vessel_type],
+            -1 if vessel.served_dock is None else int(vessel.served_dock),
+            vessel.creation_time,
+            np.nan if vessel.time_in_system is None else vessel.time_in_system,
+            np.nan if vessel.waiting_time_in_anchor_point is None else vessel.waiting_time_in_anchor_point,
+        )
+
+        self.num_records += 1
+        if self.num_records == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.num_records == 0:
+            return
+        np.save(os.path.join(self.path, f"chunk_{self.num_chunks:06d}.npy"), self.chunk[:self.num_records])
+        self.num_chunks += 1
+        self.num_records = 0
+
+    def close(self):
+        self.flush()
+
+
+def load_chunks(path: str, mmap_mode: str | None = "r") -> list[np.ndarray]:
+    """
+    Loads the chunks written by a VesselSink, in order
+    By default, the chunks are memory-mapped (read-only)
+    """
+    chunk_paths = sorted(glob.glob(os.path.join(path, "chunk_*.npy")))
+    return [np.load(chunk_path, mmap_mode=mmap_mode) for chunk_path in chunk_paths]
+
+
+def load_records(path: str) -> np.ndarray:
+    """
+    Loads all the records written by a VesselSink into one record array
+    """
+    chunks = load_chunks(path)
+    if len(chunks) == 0:
+        return np.empty(0, dtype=VESSEL_RECORD_DTYPE)
+    return np.concatenate(chunks)
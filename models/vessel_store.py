@@ -0,0 +1,171 @@
+import math
+import numpy as np
+
+from models.vessels import Vessel, ALL_VESSELS
+
+# The index of each vessel class in ALL_VESSELS
+VESSEL_TYPE_INDICES = {vessel_ctor: index for index, vessel_ctor in enumerate(ALL_VESSELS)}
+
+
+class VesselStore:
+    """
+    Stores the data of all vessels as columns (struct-of-arrays), instead of one object per vessel
+
+    Each column is a NumPy array that grows by doubling (amortized O(1) per vessel)
+    A vessel is identified by its handle: its row in the columns
+    Missing values are -1 for the integer columns and NaN for the float columns
+
+    The vessels that travel through the ports are StoredVessel's, which only hold a handle
+    The statistics are computed with vectorized reductions over the columns
+    """
+    def __init__(self, initial_capacity: int = 1024):
+        self.num_vessels = 0
+        self.uid = np.empty(initial_capacity, dtype=np.int64)
+        self.type_index = np.empty(initial_capacity, dtype=np.int8)
+        self.creation_time = np.empty(initial_capacity, dtype=np.float64)
+        # An index into docks
+        self.destination_dock = np.empty(initial_capacity, dtype=np.int16)
+        # An index into docks (see Vessel.served_dock)
+        self.served_dock = np.empty(initial_capacity, dtype=np.int16)
+        self.waiting_time_in_anchor_point = np.empty(initial_capacity, dtype=np.float64)
+        # The time the vessel left the system (exit_time = creation_time + time_in_system)
+        self.exit_time = np.empty(initial_capacity, dtype=np.float64)
+
+        # The names of the destination (and served) docks, and their indices
+        self.docks: list[str] = []
+        self.dock_indices: dict[str, int] = {}
+
+    def __len__(self):
+        return self.num_vessels
+
+    def add(self, vessel_ctor, uid: int, creation_time: float) -> "StoredVessel":
+        if self.num_vessels == len(self.uid):
+            self.grow()
+
+        handle = self.num_vessels
+        self.uid[handle] = uid
+        self.type_index[handle] = VESSEL_TYPE_INDICES[vessel_ctor]
+        self.creation_time[handle] = creation_time
+        self.destination_dock[handle] = -1
+        self.served_dock[handle] = -1
+        self.waiting_time_in_anchor_point[handle] = np.nan
+        self.exit_time[handle] = np.nan
+        self.num_vessels += 1
+
+        return StoredVessel(self, handle)
+
+    def grow(self):
+        capacity = max(2 * len(self.uid), 1)
+        for name in ["uid", "type_index", "creation_time", "destination_dock", "served_dock",
+                     "waiting_time_in_anchor_point", "exit_time"]:
+            old_column = getattr(self, name)
+            column = np.empty(capacity, dtype=old_column.dtype)
+            column[:self.num_vessels] = old_column[:self.num_vessels]
+            setattr(self, name, column)
+
+    def get_dock_index(self, dock: str) -> int:
+        if dock not in self.dock_indices:
+            self.dock_indices[dock] = len(self.docks)
+            self.docks.append(dock)
+        return self.dock_indices[dock]
+
+    def column(self, name: str) -> np.ndarray:
+        # A view of the rows in use
+        return getattr(self, name)[:self.num_vessels]
+
+    def exited(self) -> np.ndarray:
+        # A mask of the vessels that left the system
+        return ~np.isnan(self.column("exit_time"))
+
+    def time_in_system(self) -> np.ndarray:
+        # Of the vessels that left the system, in the order they were generated
+        exited = self.exited()
+        return self.column("exit_time")[exited] - self.column("creation_time")[exited]
+
+    def avg_time_in_system(self) -> float:
+        return float(np.mean(self.time_in_system()))
+
+    def avg_waiting_time_in_anchor_point(self) -> float:
+        # Of the vessels that left the system
+        return float(np.mean(self.column("waiting_time_in_anchor_point")[self.exited()]))
+
+
+class StoredVessel(Vessel):
+    """
+    A Vessel whose data is stored in a VesselStore
+
+    It only holds the store and its handle (Vessel itself has no storage), so it is smaller than a VesselRecord
+    The attributes are read from and written to the columns, so the models handle it like any other Vessel
+    The columns are read with ndarray.item, which returns a Python scalar (much faster than indexing)
+    """
+    __slots__ = ("store", "handle")
+
+    def __init__(self, store: VesselStore, handle: int):
+        self.store = store
+        self.handle = handle
+
+    @property
+    def spec(self):
+        return ALL_VESSELS[self.store.type_index.item(self.handle)].spec
+
+    @property
+    def vessel_type(self) -> str:
+        return ALL_VESSELS[self.store.type_index.item(self.handle)].vessel_type
+
+    @property
+    def surface_area(self) -> int:
+        return ALL_VESSELS[self.store.type_index.item(self.handle)].surface_area
+
+    @property
+    def avg_velocity(self) -> float:
+        return ALL_VESSELS[self.store.type_index.item(self.handle)].avg_velocity
+
+    @property
+    def max_velocity(self) -> float:
+        return ALL_VESSELS[self.store.type_index.item(self.handle)].max_velocity
+
+    @property
+    def uid(self) -> int:
+        return self.store.uid.item(self.handle)
+
+    @property
+    def creation_time(self) -> float:
+        return self.store.creation_time.item(self.handle)
+
+    @property
+    def destination_dock(self) -> str | None:
+        dock_index = self.store.destination_dock.item(self.handle)
+        return None if dock_index == -1 else self.store.docks[dock_index]
+
+    @destination_dock.setter
+    def destination_dock(self, dock: str | None):
+        self.store.destination_dock[self.handle] = -1 if dock is None else self.store.get_dock_index(dock)
+
+    @property
+    def served_dock(self) -> str | None:
+        dock_index = self.store.served_dock.item(self.handle)
+        return None if dock_index == -1 else self.store.docks[dock_index]
+
+    @served_dock.setter
+    def served_dock(self, dock: str | None):
+        self.store.served_dock[self.handle] = -1 if dock is None else self.store.get_dock_index(dock)
+
+    @property
+    def waiting_time_in_anchor_point(self) -> float | None:
+        waiting_time = self.store.waiting_time_in_anchor_point.item(self.handle)
+        return None if math.isnan(waiting_time) else waiting_time
+
+    @waiting_time_in_anchor_point.setter
+    def waiting_time_in_anchor_point(self, waiting_time: float | None):
+        self.store.waiting_time_in_anchor_point[self.handle] = math.nan if waiting_time is None else waiting_time
+
+    @property
+    def time_in_system(self) -> float | None:
+        exit_time = self.store.exit_time.item(self.handle)
+        return None if math.isnan(exit_time) else exit_time - self.store.creation_time.item(self.handle)
+
+    @time_in_system.setter
+    def time_in_system(self, time_in_system: float | None):
+        self.store.exit_time[self.handle] = (
+            math.nan if time_in_system is None else self.store.creation_time.item(self.handle) + time_in_system
+        )
@@ -1,70 +1,121 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import ClassVar
+
+
+@dataclass(frozen=True, slots=True)
+class VesselSpec:
+    """
+    The constants of a vessel type
+    One VesselSpec is shared by all the vessels of a type (a flyweight)
+    """
+    vessel_type: str
+    surface_area: int  # in square metre
+    avg_velocity: float  # in knots
+    max_velocity: float  # in knots
 
 
-@dataclass
 class Vessel:
+    """
+    The base of all vessels, without any storage of its own (__slots__ is empty)
+    All models handle vessels through this class
+
+    A vessel has the (mutable) attributes
+        uid, creation_time, time_in_system, destination_dock, waiting_time_in_anchor_point, served_dock
+    These are stored by the subclasses:
+        VesselRecord: in slots of the vessel itself (the vessel types, e.g. CrudeOilTanker)
+        StoredVessel: in the columns of a VesselStore (see models.vessel_store)
+
+    The constants of its type are in the VesselSpec of its class (spec)
+    These are also available as read-only class attributes (vessel_type, surface_area, avg_velocity, max_velocity)
+
+    Trade-off: on CPython 3.11, reading a class attribute of a slotted instance is not specialized,
+    so reading the constants is slower (about 35%) than from the __dict__ of a regular instance
+    """
+    __slots__ = ()
+
+    # Set by each vessel type
+    spec: ClassVar[VesselSpec]
+
+    # Copied from spec (class attributes are looked up faster than properties)
+    vessel_type: ClassVar[str]
+    surface_area: ClassVar[int]  # in square metre
+    avg_velocity: ClassVar[float]  # in knots
+    max_velocity: ClassVar[float]  # in knots
+
+    def __init_subclass__(cls, **kwargs):
+        super(Vessel, cls).__init_subclass__(**kwargs)
+        spec = cls.__dict__.get("spec")
+        if isinstance(spec, VesselSpec):
+            cls.vessel_type = spec.vessel_type
+            cls.surface_area = spec.surface_area
+            cls.avg_velocity = spec.avg_velocity
+            cls.max_velocity = spec.max_velocity
+
+
+@dataclass(slots=True)
+class VesselRecord(Vessel):
+    """
+    A Vessel that stores its own data, and has no __dict__ (slots)
+    """
     # The unique identifier for a vessel
     # Set by Generator's
     uid: int
 
     creation_time: float
-    time_in_system: float | None
+    time_in_system: float | None = None
 
     # time_of_arrival = time_in_system + creation_time
 
     # The destination of the vessel
     # Set at AnchorPoint and used at Confluence's
-    destination_dock: str | None
+    destination_dock: str | None = None
 
-    vessel_type: str
-    surface_area: int  # in square metre
-    avg_velocity: float  # in knots
-    max_velocity: float  # in knots
-    waiting_time_in_anchor_point: float | None
+    waiting_time_in_anchor_point: float | None = None
 
+    # The dock that served the vessel
+    # Set at AnchorPoint, together with destination_dock
+    # Unlike destination_dock, it is not overwritten when the Dock routes the vessel to the Sea
+    served_dock: str | None = None
 
-@dataclass
-class CrudeOilTanker(Vessel):
-    time_in_system: float | None = None
-    destination_dock: str | None = None
-    vessel_type: str = "Crude Oil Tanker"
-    surface_area: int = 11007
-    avg_velocity: float = 10.7
-    max_velocity: float = 15.4
-    waiting_time_in_anchor_point: float | None = None
 
+@dataclass(slots=True)
+class CrudeOilTanker(VesselRecord):
+    spec: ClassVar[VesselSpec] = VesselSpec(
+        vessel_type="Crude Oil Tanker",
+        surface_area=11007,
+        avg_velocity=10.7,
+        max_velocity=15.4
+    )
 
-@dataclass
-class BulkCarrier(Vessel):
-    time_in_system: float | None = None
-    destination_dock: str | None = None
-    vessel_type: str = "Bulk Carrier"
-    surface_area: int = 5399
-    avg_velocity: float = 12
-    max_velocity: float = 15.6
-    waiting_time_in_anchor_point: float | None = None
 
+@dataclass(slots=True)
+class BulkCarrier(VesselRecord):
+    spec: ClassVar[VesselSpec] = VesselSpec(
+        vessel_type="Bulk Carrier",
+        surface_area=5399,
+        avg_velocity=12,
+        max_velocity=15.6
+    )
 
-@dataclass
-class TugBoat(Vessel):
-    time_in_system: float | None = None
-    destination_dock: str | None = None
-    vessel_type: str = "Tug Boat"
-    surface_area: int = 348
-    avg_velocity: float = 7.8
-    max_velocity: float = 10.6
-    waiting_time_in_anchor_point: float | None = None
 
+@dataclass(slots=True)
+class TugBoat(VesselRecord):
+    spec: ClassVar[VesselSpec] = VesselSpec(
+        vessel_type="Tug Boat",
+        surface_area=348,
+        avg_velocity=7.8,
+        max_velocity=10.6
+    )
 
-@dataclass
-class SmallCargoFreighter(Vessel):
-    time_in_system: float | None = None
-    destination_dock: str | None = None
-    vessel_type: str = "Small Cargo Freighter"
-    surface_area: int = 1265
-    avg_velocity: float = 6.4
-    max_velocity: float = 9.8
-    waiting_time_in_anchor_point: float | None = None
+
+@dataclass(slots=True)
+class SmallCargoFreighter(VesselRecord):
+    spec: ClassVar[VesselSpec] = VesselSpec(
+        vessel_type="Small Cargo Freighter",
+        surface_area=1265,
+        avg_velocity=6.4,
+        max_velocity=9.8
+    )
 
 
 ALL_VESSELS = [
@@ -80,3 +131,13 @@ VESSEL_WEIGHTS = [
     0.33,
     0.17
 ]
+
+
+def unpack_vessels(payload) -> list[Vessel]:
+    """
+    A Confluence in batch mode sends a list of Vessel's, instead of a single Vessel
+    Models that receive Vessel's from a Confluence use this to accept both
+    """
+    if isinstance(payload, list):
+        return payload
+    return [payload]
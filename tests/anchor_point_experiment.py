@@ -32,9 +32,10 @@ class SimpleGenerator(AtomicDEVS):
     Note that it generates more ships than the port can handle (see DOCKS_CAPACITY)
     """
 
-    def __init__(self, name):
+    def __init__(self, name, uid_offset=0):
         AtomicDEVS.__init__(self, name)
         self.out_item = self.addOutPort("out_item")
+        self.uid_offset = uid_offset
         self.state = 0
 
     def intTransition(self):
@@ -50,7 +51,7 @@ class SimpleGenerator(AtomicDEVS):
             return INFINITY
 
     def outputFnc(self):
-        return {self.out_item: CrudeOilTanker(uid=self.state, creation_time=self.state)}
+        return {self.out_item: CrudeOilTanker(uid=self.uid_offset + self.state, creation_time=self.state)}
 
 
 @dataclass
@@ -75,7 +76,28 @@ class CoupledAnchorPoint(CoupledDEVS):
         self.connectPorts(self.anchor_point.out_vessel, self.vessel_collector.in_vessel)
 
 
-def test():
+class CoupledAnchorPointSimultaneous(CoupledDEVS):
+    """
+    Two generators send a vessel to the anchor point at the same time
+    """
+    def __init__(self, name):
+        super(CoupledAnchorPointSimultaneous, self).__init__(name)
+
+        self.simple_generator_1 = self.addSubModel(SimpleGenerator("simple_generator_1"))
+        self.simple_generator_2 = self.addSubModel(SimpleGenerator("simple_generator_2", uid_offset=100))
+        self.anchor_point = self.addSubModel(AnchorPoint("anchor_point"))
+        self.control_tower = self.addSubModel(ControlTower("control_tower", docks_capacities={"1": 100}))
+        self.vessel_collector = self.addSubModel(VesselCollector("vessel_collector"))
+
+        self.connectPorts(self.simple_generator_1.out_item, self.anchor_point.in_vessel)
+        self.connectPorts(self.simple_generator_2.out_item, self.anchor_point.in_vessel)
+        self.connectPorts(self.anchor_point.out_port_entry_request, self.control_tower.in_port_entry_request)
+        self.connectPorts(self.control_tower.out_port_entry_permission,
+                          self.anchor_point.in_port_entry_permission)
+        self.connectPorts(self.anchor_point.out_vessel, self.vessel_collector.in_vessel)
+
+
+def test1():
     system = CoupledAnchorPoint(name="system")
     sim = Simulator(system)
     sim.setTerminationTime(30)  # Simulate more than long enough
@@ -96,6 +118,27 @@ def test():
         (5, 5, 0, '3'),
     ]
 
+    # Only the vessels that did not get a permission are still waiting
+    assert sorted(system.anchor_point.state.vessels) == [6, 7]
+
+
+def test2():
+    system = CoupledAnchorPointSimultaneous(name="system")
+    sim = Simulator(system)
+    sim.setTerminationTime(30)  # Simulate more than long enough
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+    sim.simulate()
+
+    vessels = system.vessel_collector.state.vessels
+
+    # No request or permission is lost, although the vessels arrive at the same time
+    assert sorted((v.uid, v.creation_time, v.time_in_system, v.destination_dock) for v in vessels) == [
+        (uid_offset + i, i, 0, '1') for uid_offset in (0, 100) for i in range(8)
+    ]
+    assert len(system.anchor_point.state.vessels) == 0
+
 
 if __name__ == "__main__":
-    test()
+    test1()
+    test2()
@@ -0,0 +1,91 @@
+from pypdevs.simulator import Simulator
+from pypdevs.DEVS import CoupledDEVS
+
+import numpy as np
+
+from models.arrival_process import PiecewiseConstantPoissonProcess
+from models.generator import Generator, NUM_VESSELS_ARRIVING_PER_HOUR
+from models.utils.constants import SECONDS_PER_HOUR
+
+from utils.vessel_collector import VesselCollector
+
+
+class CoupledGenerator(CoupledDEVS):
+    def __init__(self, name, arrival_process):
+        CoupledDEVS.__init__(self, name)
+
+        self.generator = self.addSubModel(Generator("generator", 10000, arrival_process=arrival_process))
+        self.vessel_collector = self.addSubModel(VesselCollector("vessel_collector"))
+
+        self.connectPorts(self.generator.out, self.vessel_collector.in_vessel)
+
+
+def test1():
+    # The arrival times of each day are sorted and lie within that day
+    process = PiecewiseConstantPoissonProcess(NUM_VESSELS_ARRIVING_PER_HOUR, seed=0)
+    for day in range(3):
+        times = process.sample_day()
+        assert np.all(np.diff(times) >= 0)
+        assert np.all(times >= day * 24 * SECONDS_PER_HOUR)
+        assert np.all(times < (day + 1) * 24 * SECONDS_PER_HOUR)
+
+
+def test2():
+    # On average, the amount of vessels arriving in each hour matches the bar chart
+    process = PiecewiseConstantPoissonProcess(NUM_VESSELS_ARRIVING_PER_HOUR, seed=0)
+    num_days = 100
+    times = np.concatenate([process.sample_day() for _ in range(num_days)])
+    hours = (times // SECONDS_PER_HOUR).astype(int) % 24
+    num_vessels_per_hour = np.bincount(hours, minlength=24) / num_days
+
+    assert np.allclose(num_vessels_per_hour, NUM_VESSELS_ARRIVING_PER_HOUR, rtol=0.1)
+
+
+def test3():
+    # Hours with a rate of 0 have no arrivals
+    num_vessels_per_hour = [0] * 24
+    num_vessels_per_hour[5] = 100
+    process = PiecewiseConstantPoissonProcess(num_vessels_per_hour, seed=0)
+    times = process.sample_day()
+
+    assert len(times) != 0
+    assert np.all(times // SECONDS_PER_HOUR == 5)
+
+
+def test4():
+    # The Generator sends the vessels at the arrival times, reproducible for a given seed
+    system = CoupledGenerator(
+        name="system",
+        arrival_process=PiecewiseConstantPoissonProcess(NUM_VESSELS_ARRIVING_PER_HOUR, seed=0)
+    )
+    sim = Simulator(system)
+    sim.setTerminationTime(2 * SECONDS_PER_HOUR)
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+    sim.simulate()
+
+    creation_times = [v.creation_time for v in system.vessel_collector.state.vessels]
+
+    process = PiecewiseConstantPoissonProcess(NUM_VESSELS_ARRIVING_PER_HOUR, seed=0)
+    times = process.sample_day()
+    times = times[times <= 2 * SECONDS_PER_HOUR]
+
+    assert np.allclose(creation_times, times)
+
+
+def test5():
+    # A profile without arrivals (or with a negative rate) is rejected, instead of sampling empty days forever
+    for num_vessels_per_hour in [[0] * 24, [-1] + [1] * 23]:
+        try:
+            PiecewiseConstantPoissonProcess(num_vessels_per_hour, seed=0)
+            assert False
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
+    test3()
+    test4()
+    test5()
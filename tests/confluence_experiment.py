@@ -55,14 +55,14 @@ class SimpleGenerator(AtomicDEVS):
 
 
 class CoupledConfluence(CoupledDEVS):
-    def __init__(self, name):
+    def __init__(self, name, vessels=(VESSEL_1, VESSEL_2, VESSEL_3), batch=False):
         super(CoupledConfluence, self).__init__(name)
 
-        self.simple_generator_1 = self.addSubModel(SimpleGenerator("simple_generator_1", vessel=VESSEL_1))
-        self.simple_generator_2 = self.addSubModel(SimpleGenerator("simple_generator_2", vessel=VESSEL_2))
-        self.simple_generator_3 = self.addSubModel(SimpleGenerator("simple_generator_3", vessel=VESSEL_3))
+        self.simple_generator_1 = self.addSubModel(SimpleGenerator("simple_generator_1", vessel=vessels[0]))
+        self.simple_generator_2 = self.addSubModel(SimpleGenerator("simple_generator_2", vessel=vessels[1]))
+        self.simple_generator_3 = self.addSubModel(SimpleGenerator("simple_generator_3", vessel=vessels[2]))
 
-        self.confluence = self.addSubModel(Confluence("confluence", confluence_info=CONFLUENCE_INFO))
+        self.confluence = self.addSubModel(Confluence("confluence", confluence_info=CONFLUENCE_INFO, batch=batch))
 
         self.vessel_collector_1 = self.addSubModel(VesselCollector("vessel_collector_1"))
         self.vessel_collector_2 = self.addSubModel(VesselCollector("vessel_collector_2"))
@@ -77,7 +77,7 @@ class CoupledConfluence(CoupledDEVS):
         self.connectPorts(self.confluence.out_vessel_ports["port3"], self.vessel_collector_3.in_vessel)
 
 
-def test():
+def test1():
     system = CoupledConfluence(name="system")
     sim = Simulator(system)
     sim.setTerminationTime(0.01)  # Simulate just long enough
@@ -102,5 +102,38 @@ def test():
     ]
 
 
+def test2():
+    # In batch mode, the vessels arriving at t=0 are forwarded together, grouped per output port
+    vessels = (
+        CrudeOilTanker(uid=0, creation_time=0, destination_dock="3"),
+        CrudeOilTanker(uid=1, creation_time=0, destination_dock="2"),
+        CrudeOilTanker(uid=2, creation_time=0, destination_dock="4"),
+    )
+    system = CoupledConfluence(name="system", vessels=vessels, batch=True)
+    sim = Simulator(system)
+    sim.setTerminationTime(0.01)  # Simulate just long enough
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+    sim.simulate()
+
+    vessels_1 = system.vessel_collector_1.state.vessels
+    vessels_2 = system.vessel_collector_2.state.vessels
+    vessels_3 = system.vessel_collector_3.state.vessels
+
+    assert [(v.uid, v.creation_time, v.time_in_system) for v in vessels_1] == [
+        (1, 0, 0)
+    ]
+
+    # Dock "4" is reachable through port2 and port3, the first port wins
+    assert [(v.uid, v.creation_time, v.time_in_system) for v in vessels_2] == [
+        (0, 0, 0),
+        (2, 0, 0)
+    ]
+
+    assert vessels_3 == []
+    assert len(system.confluence.state.vessels) == 0
+
+
 if __name__ == "__main__":
-    test()
+    test1()
+    test2()
@@ -2,7 +2,7 @@ from pypdevs.simulator import Simulator
 from pypdevs.infinity import INFINITY
 from pypdevs.DEVS import AtomicDEVS, CoupledDEVS
 
-from models.messages import PortEntryRequest, PortEntryPermission, PortDepartureRequest
+from models.messages import PortEntryRequest, PortEntryPermission, PortDepartureRequest, unpack_messages
 from models.control_tower import ControlTower
 
 from dataclasses import dataclass, field
@@ -37,13 +37,13 @@ class PermissionCollector(AtomicDEVS):
         self.state.current_time += self.elapsed
 
         assert self.in_port_entry_permission in inputs
-        port_entry_permission = inputs[self.in_port_entry_permission]
-        assert isinstance(port_entry_permission, PortEntryPermission)
+        for port_entry_permission in unpack_messages(inputs[self.in_port_entry_permission]):
+            assert isinstance(port_entry_permission, PortEntryPermission)
 
-        # Decorate with arrival-time
-        port_entry_permission.arrival_time = self.state.current_time
+            # Decorate with arrival-time
+            port_entry_permission.arrival_time = self.state.current_time
 
-        self.state.permissions.append(port_entry_permission)
+            self.state.permissions.append(port_entry_permission)
 
         return self.state
 
@@ -141,6 +141,32 @@ class DepartRequestGeneratorDock2(AtomicDEVS):
             assert False
 
 
+class DepartRequestGenerator(AtomicDEVS):
+    """
+    Generates a single PortDepartureRequest for the given dock at the given time
+    """
+
+    def __init__(self, name, dock, time):
+        AtomicDEVS.__init__(self, name)
+        self.out_item = self.addOutPort("out_item")
+        self.dock = dock
+        self.time = time
+        self.state = 0
+
+    def intTransition(self):
+        self.state += 1
+        return self.state
+
+    def timeAdvance(self):
+        if self.state == 0:
+            return self.time
+        else:
+            return INFINITY
+
+    def outputFnc(self):
+        return {self.out_item: PortDepartureRequest(dock=self.dock)}
+
+
 class CoupledControlTower(CoupledDEVS):
     def __init__(self, name):
         super(CoupledControlTower, self).__init__(name)
@@ -157,7 +183,26 @@ class CoupledControlTower(CoupledDEVS):
         self.connectPorts(self.control_tower.out_port_entry_permission, self.permission_collector.in_port_entry_permission)
 
 
-def test():
+class CoupledControlTowerSimultaneous(CoupledDEVS):
+    """
+    Docks "1" and "2" are both released at t=10, while vessels 6,7,8,9 are waiting
+    """
+    def __init__(self, name):
+        super(CoupledControlTowerSimultaneous, self).__init__(name)
+
+        self.entry_request_generator = self.addSubModel(EntryRequestGenerator("entry_request_generator"))
+        self.depart_request_generator_1 = self.addSubModel(DepartRequestGenerator("depart_request_generator_1", "1", 10))
+        self.depart_request_generator_2 = self.addSubModel(DepartRequestGenerator("depart_request_generator_2", "2", 10))
+        self.control_tower = self.addSubModel(ControlTower("control_tower", docks_capacities=DOCKS_CAPACITIES))
+        self.permission_collector = self.addSubModel(PermissionCollector("permission_collector"))
+
+        self.connectPorts(self.entry_request_generator.out_item, self.control_tower.in_port_entry_request)
+        self.connectPorts(self.depart_request_generator_1.out_item, self.control_tower.in_port_depart_request)
+        self.connectPorts(self.depart_request_generator_2.out_item, self.control_tower.in_port_depart_request)
+        self.connectPorts(self.control_tower.out_port_entry_permission, self.permission_collector.in_port_entry_permission)
+
+
+def test1():
     system = CoupledControlTower(name="system")
     sim = Simulator(system)
     sim.setTerminationTime(20)  # Simulate more than long enough
@@ -183,5 +228,46 @@ def test():
     ]
 
 
+def test2():
+    system = CoupledControlTowerSimultaneous(name="system")
+    sim = Simulator(system)
+    sim.setTerminationTime(20)  # Simulate more than long enough
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+    sim.simulate()
+
+    permissions = system.permission_collector.state.permissions
+
+    # No permission is lost, although both docks are released at the same time
+    assert [(p.vessel_uid, p.avl_dock, p.arrival_time) for p in permissions] == [
+        (0, '1', 0),
+        (1, '1', 1),
+        (2, '1', 2),
+        (3, '2', 3),
+        (4, '2', 4),
+        (5, '3', 5),
+
+        (6, '1', 10),
+        (7, '2', 10)
+    ]
+
+
+def test3():
+    # A requested destination dock is used if it has a free spot, else the policy decides
+    control_tower = ControlTower("control_tower", docks_capacities=DOCKS_CAPACITIES)
+    for uid, destination_dock in enumerate(["3", "3", "2", None]):
+        control_tower.handle_port_entry_request(PortEntryRequest(vessel_uid=uid, destination_dock=destination_dock))
+
+    permissions = control_tower.state.port_entry_permissions_to_send
+    assert [(p.vessel_uid, p.avl_dock) for p in permissions] == [
+        (0, '3'),
+        (1, '1'),
+        (2, '2'),
+        (3, '1')
+    ]
+
+
 if __name__ == "__main__":
-    test()
+    test1()
+    test2()
+    test3()
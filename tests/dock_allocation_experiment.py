@@ -0,0 +1,114 @@
+from models.messages import PortEntryRequest
+from models.dock_allocation import (
+    FreePositions,
+    FirstAvailablePolicy,
+    LeastLoadedPolicy,
+    RoundRobinPolicy,
+    ShortestRoutePolicy,
+    VesselTypeAwarePolicy,
+)
+from models.port_network import PortNetwork, DOCK_ROUTE_LENGTHS
+
+
+# Dock named "1" has a capacity of 3 vessels
+# Dock named "2" has a capacity of 2 vessels
+# ...
+DOCKS_CAPACITIES = {
+    "1": 3,
+    "2": 2,
+    "3": 1
+}
+
+
+def allocate(policy, num_requests, vessel_type=None):
+    # Reserve a spot for each request, as the ControlTower does
+    docks = []
+    for uid in range(num_requests):
+        request = PortEntryRequest(vessel_uid=uid, vessel_type=vessel_type)
+        if not policy.has_free_spot():
+            docks.append(None)
+            continue
+        dock = policy.select_dock(request)
+        policy.reserve(dock)
+        docks.append(dock)
+    return docks
+
+
+def test1():
+    free_positions = FreePositions(10, [2, 5, 9])
+    assert len(free_positions) == 3
+    assert free_positions.next(0) == 2
+    assert free_positions.next(3) == 5
+    assert free_positions.next(6) == 9
+    assert free_positions.next(10) is None
+
+    free_positions.remove(5)
+    assert free_positions.next(3) == 9
+    free_positions.remove(9)
+    assert free_positions.next(3) is None
+    free_positions.add(4)
+    assert free_positions.next(3) == 4
+    assert 4 in free_positions
+    assert 5 not in free_positions
+
+
+def test2():
+    policy = FirstAvailablePolicy(DOCKS_CAPACITIES)
+    assert allocate(policy, 7) == ["1", "1", "1", "2", "2", "3", None]
+
+    # A released spot is used again first
+    policy.release("2")
+    assert allocate(policy, 1) == ["2"]
+
+
+def test3():
+    policy = RoundRobinPolicy(DOCKS_CAPACITIES)
+    assert allocate(policy, 7) == ["1", "2", "3", "1", "2", "1", None]
+
+
+def test4():
+    policy = LeastLoadedPolicy(DOCKS_CAPACITIES)
+    # Load after each step (1, 2, 3):
+    #   0/3, 0/2, 0/1 -> 1
+    #   1/3, 0/2, 0/1 -> 2
+    #   1/3, 1/2, 0/1 -> 3
+    #   1/3, 1/2, 1/1 -> 1
+    #   2/3, 1/2, 1/1 -> 2
+    #   2/3, 2/2, 1/1 -> 1
+    assert allocate(policy, 7) == ["1", "2", "3", "1", "2", "1", None]
+
+    policy.release("3")
+    policy.release("1")
+    # Load: 2/3, 2/2, 0/1 -> 3, then 2/3, 2/2, 1/1 -> 1
+    assert allocate(policy, 2) == ["3", "1"]
+
+
+def test5():
+    policy = ShortestRoutePolicy(DOCKS_CAPACITIES, route_lengths={"1": 3.0, "2": 1.0, "3": 2.0})
+    assert allocate(policy, 7) == ["2", "2", "3", "1", "1", "1", None]
+
+
+def test6():
+    policy = VesselTypeAwarePolicy(DOCKS_CAPACITIES, preferred_docks={"Tug Boat": ["3", "2"]})
+    assert allocate(policy, 2, vessel_type="Tug Boat") == ["3", "2"]
+    assert allocate(policy, 3, vessel_type="Crude Oil Tanker") == ["1", "1", "1"]
+    assert allocate(policy, 2, vessel_type="Tug Boat") == ["2", None]
+
+
+def test7():
+    # The PortNetwork builds a ShortestRoutePolicy from its own route lengths
+    system = PortNetwork(name="system", dock_allocation_policy="shortest_route")
+    policy = system.control_tower.state.dock_allocation_policy
+    assert isinstance(policy, ShortestRoutePolicy)
+    assert policy.order == sorted(DOCK_ROUTE_LENGTHS, key=DOCK_ROUTE_LENGTHS.get)
+    assert policy.order[0] == "1"
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
+    test3()
+    test4()
+    test5()
+    test6()
+    test7()
@@ -1,8 +1,21 @@
 from pypdevs.simulator import Simulator
+from pypdevs.DEVS import CoupledDEVS
 from models.generator import Generator
 
 import numpy as np
 
+from utils.vessel_collector import VesselCollector
+
+
+class CoupledGenerator(CoupledDEVS):
+    def __init__(self, name, num_vessels_to_generate, batch_size=None):
+        CoupledDEVS.__init__(self, name)
+
+        self.generator = self.addSubModel(Generator("generator", num_vessels_to_generate, batch_size=batch_size))
+        self.vessel_collector = self.addSubModel(VesselCollector("vessel_collector"))
+
+        self.connectPorts(self.generator.out, self.vessel_collector.in_vessel)
+
 
 def test1():
     system = Generator(name="system", num_vessels_to_generate=10000)  # Large enough
@@ -35,6 +48,51 @@ def test2():
     assert vessel_count == 100
 
 
+def test3():
+    # In batched mode, the output is reproducible for a given seed (and batch size)
+    runs = []
+    for _ in range(2):
+        # Make the random numbers reproducible
+        # Seeded before the Generator is created, since it samples the first batch of vessel types
+        np.random.seed(0)
+
+        system = CoupledGenerator(name="system", num_vessels_to_generate=10000, batch_size=64)  # Large enough
+        sim = Simulator(system)
+        sim.setTerminationTime(3600.0)
+        # sim.setVerbose(None)
+        sim.setClassicDEVS()
+        sim.simulate()
+
+        vessels = system.vessel_collector.state.vessels
+        runs.append([(v.uid, v.vessel_type, v.creation_time) for v in vessels])
+
+        # should be AROUND 100
+        # that is, the first index of the bar chart
+        assert system.generator.state.num_vessels_generated == 102
+
+    assert runs[0] == runs[1]
+
+    # The batches are refilled (102 vessels > 64)
+    assert len({vessel_type for _, vessel_type, _ in runs[0]}) == 4
+
+
+def test4():
+    system = Generator(name="system", num_vessels_to_generate=100, batch_size=64)
+    sim = Simulator(system)
+    sim.setTerminationTime(10000.0)  # Large enough
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+
+    # Make the random numbers reproducible
+    np.random.seed(0)
+    sim.simulate()
+    vessel_count = system.state.num_vessels_generated
+    # should be EXACTLY 100
+    assert vessel_count == 100
+
+
 if __name__ == "__main__":
     test1()
     test2()
+    test3()
+    test4()
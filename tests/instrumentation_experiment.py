@@ -0,0 +1,74 @@
+from pypdevs.simulator import Simulator
+from pypdevs.DEVS import CoupledDEVS
+
+import io
+
+from models.confluence import Confluence
+from models.generator import Generator
+from models.utils.instrumentation import Instrumentation
+
+from utils.vessel_collector import VesselCollector
+
+
+class CoupledGenerator(CoupledDEVS):
+    def __init__(self, name):
+        CoupledDEVS.__init__(self, name)
+
+        self.generator = self.addSubModel(Generator("generator", 100))
+        self.confluence = self.addSubModel(Confluence("confluence", {"out": [None]}))
+        self.vessel_collector = self.addSubModel(VesselCollector("vessel_collector"))
+
+        self.connectPorts(self.generator.out, self.confluence.in_vessel_ports["out"])
+        self.connectPorts(self.confluence.out_vessel_ports["out"], self.vessel_collector.in_vessel)
+
+
+def simulate(system, instrumentation=None):
+    sim = Simulator(system)
+    sim.setTerminationTime(1000000)
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+    if instrumentation is not None:
+        instrumentation.attach(sim)
+    sim.simulate()
+
+
+def test1():
+    # The calls and zero-time transitions are counted per model, and the output is the same
+    system = CoupledGenerator(name="system")
+    instrumentation = Instrumentation(system)
+    instrumentation.report = lambda file=None: None
+    simulate(system, instrumentation)
+
+    assert len(system.vessel_collector.state.vessels) == 100
+
+    stats = {model_stats.name: model_stats for model_stats in instrumentation.stats.values()}
+    assert set(stats) == {"system.generator", "system.confluence", "system.vessel_collector"}
+    assert stats["system.generator"].methods["intTransition"].calls == 100
+    assert stats["system.generator"].methods["outputFnc"].calls == 100
+    assert stats["system.confluence"].methods["extTransition"].calls == 100
+    # The confluence forwards each vessel IMMEDIATELY (100), and the first vessel arrives at t=0 (1)
+    assert stats["system.confluence"].methods["intTransition"].calls == 100
+    assert stats["system.confluence"].zero_time_transitions == 101
+    assert stats["system.vessel_collector"].methods["extTransition"].calls == 100
+
+    total_times = [model_stats.total_time for model_stats in instrumentation.sorted_stats()]
+    assert total_times == sorted(total_times, reverse=True)
+
+
+def test2():
+    # The report has one line per model, and remove() restores the methods
+    system = CoupledGenerator(name="system")
+    instrumentation = Instrumentation(system)
+    report = io.StringIO()
+    instrumentation.report(report)
+    assert len(report.getvalue().splitlines()) == 1 + 3
+
+    instrumentation.remove()
+    assert "intTransition" not in system.generator.__dict__
+    simulate(system)
+    assert instrumentation.stats[system.generator].methods["intTransition"].calls == 0
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
@@ -137,12 +137,43 @@ class GenerateLow(AtomicDEVS):
             assert False
 
 
+class GenerateSparse(AtomicDEVS):
+    """
+    Generate a vessel at each of the given times, with long idle periods in between
+    """
+
+    def __init__(self, name, times):
+        AtomicDEVS.__init__(self, name)
+        self.out_item = self.addOutPort("out_item")
+        self.times = times
+        self.state = 0
+
+    def intTransition(self):
+        self.state += 1
+        return self.state
+
+    def timeAdvance(self):
+        if self.state == len(self.times):
+            return INFINITY
+        elif self.state == 0:
+            return self.times[0]
+        else:
+            return self.times[self.state] - self.times[self.state - 1]
+
+    def outputFnc(self):
+        return {self.out_item: CrudeOilTanker(uid=self.state, creation_time=self.times[self.state])}
+
+
 class CoupledLock(CoupledDEVS):
-    def __init__(self, name):
+    def __init__(self, name, fast_forward=False, sparse=False):
         CoupledDEVS.__init__(self, name)
 
-        self.generate_high = self.addSubModel(GenerateHigh("generate_high"))
-        self.generate_low = self.addSubModel(GenerateLow("generate_low"))
+        if sparse:
+            self.generate_high = self.addSubModel(GenerateSparse("generate_high", [0.5, 1003.5, 1010.25, 5555.5]))
+            self.generate_low = self.addSubModel(GenerateSparse("generate_low", [2222.75, 9876.5]))
+        else:
+            self.generate_high = self.addSubModel(GenerateHigh("generate_high"))
+            self.generate_low = self.addSubModel(GenerateLow("generate_low"))
 
         self.lock = self.addSubModel(
             Lock("lock",
@@ -150,7 +181,8 @@ class CoupledLock(CoupledDEVS):
                  lock_shift_interval=20,
                  gate_duration=4,
                  surface_area=30000,
-                 time_between_departures=10
+                 time_between_departures=10,
+                 fast_forward=fast_forward
                  )
         )
 
@@ -193,5 +225,33 @@ def test():
     ]
 
 
+def simulate(fast_forward, sparse, termination_time):
+    system = CoupledLock(name="system", fast_forward=fast_forward, sparse=sparse)
+    sim = Simulator(system)
+    sim.setTerminationTime(termination_time)
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+    sim.simulate()
+    system.lock.settle(termination_time)
+
+    lock_state = system.lock.state
+    return (
+        [(v.uid, v.creation_time, v.time_in_system) for v in system.collect_low.state.vessels],
+        [(v.uid, v.creation_time, v.time_in_system) for v in system.collect_high.state.vessels],
+        lock_state.idle_time,
+        lock_state.number_lock_state_changes_with_no_vessels,
+        lock_state.number_of_washings,
+        lock_state.current_water_level,
+        lock_state.interval_state
+    )
+
+
+def test2():
+    # Fast-forwarding the idle interval states does not change the output or the statistics
+    for sparse, termination_time in [(False, 150), (False, 1000), (True, 20000), (True, 20010)]:
+        assert simulate(False, sparse, termination_time) == simulate(True, sparse, termination_time)
+
+
 if __name__ == "__main__":
     test()
+    test2()
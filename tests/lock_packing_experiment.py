@@ -0,0 +1,65 @@
+from models.lock_packing import (
+    BestFitStrategy,
+    FirstFitDecreasingStrategy,
+    FirstFitStrategy,
+    KnapsackStrategy,
+)
+from models.utils.waiting_queue import WaitingQueue
+from models.vessels import BulkCarrier, CrudeOilTanker, SmallCargoFreighter, TugBoat
+
+# Surface areas: CrudeOilTanker 11007, BulkCarrier 5399, SmallCargoFreighter 1265, TugBoat 348
+VESSEL_CTORS = [BulkCarrier, CrudeOilTanker, CrudeOilTanker, SmallCargoFreighter, TugBoat, BulkCarrier]
+
+
+def make_queue():
+    queue = WaitingQueue()
+    for uid, vessel_ctor in enumerate(VESSEL_CTORS):
+        queue.append(vessel_ctor(uid=uid, creation_time=uid))
+    return queue
+
+
+def select_uids(strategy, surface_area):
+    queue = make_queue()
+    positions = strategy.select(queue, surface_area)
+    assert positions == sorted(positions)
+    assert sum(queue.vessels[position].surface_area for position in positions) <= surface_area
+    return [queue.vessels[position].uid for position in positions]
+
+
+def test1():
+    # FCFS, skipping the vessels that do not fit
+    assert select_uids(FirstFitStrategy(), 17000) == [0, 1, 4]
+
+
+def test2():
+    # The largest vessels first (within the window)
+    assert select_uids(FirstFitDecreasingStrategy(), 17000) == [0, 1, 4]
+    assert select_uids(FirstFitDecreasingStrategy(), 23000) == [1, 2, 4]
+    # Only the first 2 vessels are considered
+    assert select_uids(FirstFitDecreasingStrategy(window=2), 23000) == [0, 1]
+
+
+def test3():
+    # The vessel that leaves the least surface area first
+    assert select_uids(BestFitStrategy(), 12000) == [1, 4]
+    assert select_uids(BestFitStrategy(), 17000) == [0, 1, 4]
+
+
+def test4():
+    # The largest total surface area that fits
+    assert select_uids(KnapsackStrategy(), 17000) == [0, 1, 4]
+    # 11007 + 11007 + 348 = 22362 beats 11007 + 5399 + 5399 + 348 = 22153
+    assert select_uids(KnapsackStrategy(), 22500) == [1, 2, 4]
+    # 5399 + 1265 + 348 + 5399 = 12411 beats first-fit-decreasing (11007 + 1265 = 12272)
+    assert select_uids(KnapsackStrategy(), 12500) == [0, 3, 4, 5]
+    assert select_uids(FirstFitDecreasingStrategy(), 12500) == [1, 3]
+
+    # If the time limit is exceeded, it falls back to first-fit-decreasing
+    assert select_uids(KnapsackStrategy(time_limit=-1), 12500) == [1, 3]
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
+    test3()
+    test4()
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import time
+
+from models.utils import my_log
+
+
+def read_lines(path):
+    with open(path) as fh:
+        return fh.read().splitlines()
+
+
+def test1():
+    # Logging is off by default, and then no events are written
+    assert not my_log.ENABLED
+    my_log.log(0.0, "lock", "washing")
+
+    # When on, the events are JSON lines, written when the buffer is full
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "log.txt")
+        my_log.configure(path, level=my_log.INFO, buffer_size=3, flush_interval=3600)
+
+        my_log.log(1.5, "lock", "washing", vessels=0)
+        my_log.log(2.0, "lock", "details", level=my_log.DEBUG)
+        my_log.my_log("hello")
+        assert read_lines(path) == []
+
+        my_log.log(3.0, "sea", "vessel_departed", uid=7)
+        assert len(read_lines(path)) == 3
+
+        my_log.disable()
+        lines = read_lines(path)
+        assert json.loads(lines[0]) == {
+            "sim_time": 1.5, "level": "INFO", "model": "lock", "event": "washing", "vessels": 0
+        }
+        assert lines[1] == "hello"
+        assert json.loads(lines[2])["uid"] == 7
+        assert not my_log.ENABLED
+
+
+def test2():
+    # In the background, the lines are written by a thread, all of them are written on disable
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "log.txt")
+        my_log.configure(path, buffer_size=10, background=True)
+        for i in range(1005):
+            my_log.log(float(i), "generator", "vessel_generated", uid=i)
+        my_log.disable()
+
+        assert [json.loads(line)["uid"] for line in read_lines(path)] == list(range(1005))
+
+
+def test3():
+    # In the background, the buffered lines are also written after flush_interval, without further log calls
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "log.txt")
+        my_log.configure(path, buffer_size=1000, flush_interval=0.05, background=True)
+        my_log.log(1.0, "sea", "vessel_departed", uid=0)
+
+        deadline = time.monotonic() + 5.0
+        while len(read_lines(path)) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [json.loads(line)["uid"] for line in read_lines(path)] == [0]
+        my_log.disable()
+
+
+def test4():
+    # When logging is off, free-form lines are still appended to log.txt right away
+    assert not my_log.ENABLED
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            my_log.log(0.0, "lock", "washing")
+            my_log.my_log("hello")
+            my_log.my_log("world")
+            assert read_lines("log.txt") == ["hello", "world"]
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
+    test3()
+    test4()
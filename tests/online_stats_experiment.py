@@ -0,0 +1,81 @@
+from pypdevs.simulator import Simulator
+from pypdevs.DEVS import CoupledDEVS
+
+import numpy as np
+
+from models.generator import Generator
+from models.sea import Sea
+from models.utils.online_stats import OnlineStatistics, P2Quantile, VesselStatistics
+
+from utils.vessel_collector import VesselCollector
+
+
+class CoupledGenerator(CoupledDEVS):
+    def __init__(self, name):
+        CoupledDEVS.__init__(self, name)
+
+        self.generator = self.addSubModel(Generator("generator", 1000))
+        self.vessel_collector = self.addSubModel(VesselCollector("vessel_collector", keep_vessels=False))
+
+        self.connectPorts(self.generator.out, self.vessel_collector.in_vessel)
+
+
+def test1():
+    # Count, mean, variance, min and max are exact
+    data = np.random.default_rng(0).exponential(10, 10000)
+    statistics = OnlineStatistics()
+    for x in data.tolist():
+        statistics.add(x)
+
+    assert statistics.count == len(data)
+    assert np.isclose(statistics.mean, np.mean(data))
+    assert np.isclose(statistics.variance, np.var(data, ddof=1))
+    assert (statistics.min, statistics.max) == (data.min(), data.max())
+
+
+def test2():
+    # The P² estimates are close to the exact quantiles
+    data = np.random.default_rng(1).normal(100, 15, 10000)
+    for p in [0.05, 0.5, 0.95]:
+        quantile = P2Quantile(p)
+        for x in data.tolist():
+            quantile.add(x)
+        assert abs(quantile.value - np.quantile(data, p)) < 1.0
+
+    # With less than 5 observations, the quantile is exact
+    quantile = P2Quantile(0.5)
+    for x in [3.0, 1.0, 2.0]:
+        quantile.add(x)
+    assert quantile.value == 2.0
+
+
+def test3():
+    # The collector accumulates the statistics per vessel type, without keeping the vessels
+    system = CoupledGenerator(name="system")
+    sim = Simulator(system)
+    sim.setTerminationTime(1000000)
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+    sim.simulate()
+
+    statistics = system.vessel_collector.state.statistics
+    assert system.vessel_collector.state.vessels == []
+    assert statistics.overall["time_in_system"].count == 1000
+    assert sum(s["time_in_system"].count for s in statistics.per_vessel_type.values()) == 1000
+    # The vessels did not pass an AnchorPoint
+    assert statistics.overall["waiting_time_in_anchor_point"].count == 0
+
+
+def test4():
+    # When the vessels are kept, no statistics are accumulated, unless an accumulator is given
+    assert Sea("sea").state.statistics is None
+    assert isinstance(Sea("sea", keep_vessels=False).state.statistics, VesselStatistics)
+    statistics = VesselStatistics()
+    assert Sea("sea", statistics=statistics).state.statistics is statistics
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
+    test3()
+    test4()
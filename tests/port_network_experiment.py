@@ -7,12 +7,9 @@ import numpy as np
 from dataclasses import dataclass
 
 
-def get_avg(lst):
-    return sum(lst)/len(lst)
-
-
 def test1():
-    system = PortNetwork(name="system")
+    # The statistics are accumulated online, so the vessels do not have to be kept
+    system = PortNetwork(name="system", keep_vessels=False)
     sim = Simulator(system)
     sim.setTerminationTime(1000000.0)
     # sim.setVerbose(None)
@@ -22,17 +19,15 @@ def test1():
     np.random.seed(0)
     sim.simulate()
 
-    vessels = system.sea_collector.state.vessels
+    statistics = system.sea_collector.state.statistics
 
     # Statistic #1
-    time_in_system_data = [vessel.time_in_system for vessel in vessels]
-    avg_travel_time = get_avg(time_in_system_data)
+    avg_travel_time = statistics.overall["time_in_system"].mean
 
     print(f"avg_travel_time: {avg_travel_time}")
 
     # Statistic #2
-    waiting_time_in_anchor_point_data = [vessel.waiting_time_in_anchor_point for vessel in vessels]
-    avg_waiting_time_in_anchor_point = get_avg(waiting_time_in_anchor_point_data)
+    avg_waiting_time_in_anchor_point = statistics.overall["waiting_time_in_anchor_point"].mean
 
     print(f"avg_waiting_time_in_anchor_point: {avg_waiting_time_in_anchor_point}")
 
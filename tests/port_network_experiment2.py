@@ -10,17 +10,21 @@ from models.waterway import Waterway
 from models.uni_waterway import UniWaterway
 from models.confluence import Confluence
 from models.control_tower import ControlTower
+from models.vessel_sink import VesselSink, load_chunks
 from pypdevs.simulator import Simulator
 from models import vessels
 
 import matplotlib.pyplot as plt
 import numpy as np
+import tempfile
 
 class PortNetworkExperiment2(CoupledDEVS):
     """
     This is a CoupledDEVS of the full port network
+
+    The Sea does not keep the vessels (see Sea), if sink is given, their records are written to it
     """
-    def __init__(self, name: str):
+    def __init__(self, name: str, sink: VesselSink | None = None):
         CoupledDEVS.__init__(self, name)
 
         # CREATE ALL SUBMODELS
@@ -32,7 +36,7 @@ class PortNetworkExperiment2(CoupledDEVS):
         self.anchor_point = self.addSubModel(AnchorPoint('K'))
 
         # The sea S (which is a collector)
-        self.sea_collector = self.addSubModel(Sea('S'))
+        self.sea_collector = self.addSubModel(Sea('S', keep_vessels=False, sink=sink))
 
         hundred_vessels = []
         for i in range(100):
@@ -277,27 +281,31 @@ class PortNetworkExperiment2(CoupledDEVS):
 
 
 def test1():
-    system = PortNetworkExperiment2(name="system")
-    sim = Simulator(system)
-    sim.setTerminationTime(8000000.0)
-    # sim.setVerbose(None)
-    sim.setClassicDEVS()
-
-    # Make the random numbers reproducible
-    np.random.seed(0)
-    sim.simulate()
-
-    vessels = system.sea_collector.state.vessels
-    stats = [vessel.time_in_system for vessel in vessels]
-    print([vessel.time_in_system for vessel in vessels])
-    print(len(vessels))
-
-    plt.plot(stats)
-    plt.show()
+    with tempfile.TemporaryDirectory() as path:
+        # The records of the vessels are written to disk, instead of kept in memory
+        sink = VesselSink(path)
+        system = PortNetworkExperiment2(name="system", sink=sink)
+        sim = Simulator(system)
+        sim.setTerminationTime(8000000.0)
+        # sim.setVerbose(None)
+        sim.setClassicDEVS()
+
+        # Make the random numbers reproducible
+        np.random.seed(0)
+        sim.simulate()
+        sink.close()
+
+        statistics = system.sea_collector.state.statistics
+        print(f"avg_time_in_system: {statistics.overall['time_in_system'].mean}")
+        print(statistics.overall["time_in_system"].count)
+
+        # The chunks are memory-mapped, and plotted one after the other
+        num_plotted = 0
+        for chunk in load_chunks(path):
+            plt.plot(np.arange(num_plotted, num_plotted + len(chunk)), chunk["time_in_system"], color="C0")
+            num_plotted += len(chunk)
+        plt.show()
 
 
 if __name__ == "__main__":
     test1()
-
-
-
@@ -0,0 +1,56 @@
+import math
+
+from models.replications import (
+    get_seeds,
+    run_replications,
+    student_t_quantile,
+    summarize,
+)
+
+
+def without_wall_time(results):
+    return [{metric: value for metric, value in result.items() if metric != "wall_time"} for result in results]
+
+
+def test1():
+    # The replications have distinct seeds, and the results do not depend on the number of workers
+    seeds = get_seeds(4, base_seed=0)
+    assert len(set(seeds)) == 4
+    assert get_seeds(4, base_seed=0) == seeds
+
+    results = run_replications(3, base_seed=0, max_workers=3, termination_time=200000.0)
+    assert [result["seed"] for result in results] == seeds[:3]
+    assert all(result["num_vessels_left"] > 0 for result in results)
+    assert len({result["avg_time_in_system"] for result in results}) == 3
+
+    sequential = run_replications(3, base_seed=0, max_workers=1, termination_time=200000.0)
+    assert without_wall_time(sequential) == without_wall_time(results)
+
+    summary = summarize(results)["avg_time_in_system"]
+    assert summary.count == 3
+    assert summary.low < summary.mean < summary.high
+    assert "seed" not in summarize(results)
+
+
+def test2():
+    # The confidence intervals use the quantiles of Student's t-distribution
+    assert math.isclose(student_t_quantile(0.975, 1), 12.706, abs_tol=1e-3)
+    assert math.isclose(student_t_quantile(0.975, 4), 2.776, abs_tol=1e-3)
+    assert math.isclose(student_t_quantile(0.975, 30), 2.042, abs_tol=1e-3)
+    assert math.isclose(student_t_quantile(0.95, 9), 1.833, abs_tol=1e-3)
+
+    results = [{"x": 1.0, "y": math.nan}, {"x": 2.0, "y": 5.0}, {"x": 3.0, "y": math.nan}]
+    summaries = summarize(results)
+    # mean 2, std 1, half width t(0.975, 2) * 1 / sqrt(3)
+    assert summaries["x"].mean == 2.0
+    assert summaries["x"].std == 1.0
+    assert math.isclose(summaries["x"].half_width, 4.303 / math.sqrt(3), abs_tol=1e-3)
+    # The NaN values are skipped
+    assert summaries["y"].count == 1
+    assert summaries["y"].mean == 5.0
+    assert math.isnan(summaries["y"].half_width)
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
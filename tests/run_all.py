@@ -3,12 +3,24 @@ import os
 
 if __name__ == "__main__":
     os.system('python anchor_point_experiment.py')
+    os.system('python arrival_process_experiment.py')
     os.system('python canal_experiment.py')
     os.system('python confluence_experiment.py')
     os.system('python control_tower_experiment.py')
     os.system('python dock_experiment.py')
+    os.system('python dock_allocation_experiment.py')
     os.system('python generator_experiment.py')
+    os.system('python instrumentation_experiment.py')
     os.system('python lock_experiment.py')
+    os.system('python lock_packing_experiment.py')
+    os.system('python my_log_experiment.py')
+    os.system('python online_stats_experiment.py')
+    os.system('python replications_experiment.py')
+    os.system('python timer_queue_experiment.py')
+    os.system('python trace_generator_experiment.py')
     os.system('python uni_canal_experiment.py')
     os.system('python uni_waterway_experiment.py')
+    os.system('python vessel_sink_experiment.py')
+    os.system('python vessel_store_experiment.py')
+    os.system('python waiting_queue_experiment.py')
     os.system('python waterway_experiment.py')
@@ -0,0 +1,73 @@
+from pypdevs.infinity import INFINITY
+
+from models.utils.timer_queue import TimerQueue
+
+
+def test1():
+    # An empty queue waits INDEFINITELY
+    queue = TimerQueue()
+    assert len(queue) == 0
+    assert queue.remaining_time() == INFINITY
+
+
+def test2():
+    # Items are popped in deadline order, not in insertion order
+    queue = TimerQueue()
+    queue.push(30, 0, "a")
+    queue.push(10, 1, "b")
+    queue.push(20, 2, "c")
+
+    assert len(queue) == 3
+    assert list(queue) == ["b", "c", "a"]
+    assert queue.peek() == "b"
+    assert queue.remaining_time() == 10
+
+    assert queue.pop() == "b"
+    assert queue.pop() == "c"
+    assert queue.pop() == "a"
+    assert len(queue) == 0
+
+
+def test3():
+    # The timers are relative to the clock of the queue
+    queue = TimerQueue()
+    queue.push(100, 0, "a")
+
+    # t=40: push an item that expires at t=90
+    queue.advance(40)
+    assert queue.remaining_time() == 60
+    queue.push(50, 1, "b")
+    assert queue.peek() == "b"
+    assert queue.remaining_time() == 50
+
+    # t=90: "b" expires
+    queue.advance(queue.remaining_time())
+    assert queue.pop() == "b"
+    assert queue.remaining_time() == 10
+
+
+def test4():
+    # Ties on the deadline are broken by the uid, then by insertion order
+    queue = TimerQueue()
+    queue.push(10, 2, "a")
+    queue.push(10, 1, "b")
+    queue.push(10, 1, "c")
+
+    assert [queue.pop(), queue.pop(), queue.pop()] == ["b", "c", "a"]
+
+
+def test5():
+    # The initial entries are heapified in one step
+    queue = TimerQueue([(30, 0, "a"), (10, 1, "b"), (20, 2, "c")])
+
+    assert len(queue) == 3
+    assert queue.remaining_time() == 10
+    assert list(queue) == ["b", "c", "a"]
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
+    test3()
+    test4()
+    test5()
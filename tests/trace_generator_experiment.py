@@ -0,0 +1,78 @@
+from pypdevs.simulator import Simulator
+from pypdevs.DEVS import CoupledDEVS
+
+import tempfile
+
+from models.trace_generator import TraceGenerator, write_trace
+from models.vessels import ALL_VESSELS
+
+from utils.vessel_collector import VesselCollector
+
+
+class CoupledTraceGenerator(CoupledDEVS):
+    def __init__(self, name, path, chunk_size, num_vessels_to_generate=None):
+        CoupledDEVS.__init__(self, name)
+
+        self.generator = self.addSubModel(
+            TraceGenerator("generator", path, chunk_size=chunk_size, num_vessels_to_generate=num_vessels_to_generate)
+        )
+        self.vessel_collector = self.addSubModel(VesselCollector("vessel_collector"))
+
+        self.connectPorts(self.generator.out, self.vessel_collector.in_vessel)
+
+
+def simulate(path, chunk_size, num_vessels_to_generate=None):
+    system = CoupledTraceGenerator(
+        name="system",
+        path=path,
+        chunk_size=chunk_size,
+        num_vessels_to_generate=num_vessels_to_generate
+    )
+    sim = Simulator(system)
+    sim.setTerminationTime(1000)
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+    sim.simulate()
+    return system.vessel_collector.state.vessels
+
+
+ARRIVAL_TIMES = [0.0, 1.5, 1.5, 10.0, 42.0, 99.0, 100.0]
+VESSEL_TYPES = [0, 1, 2, 3, 3, 0, 1]
+
+
+def test1():
+    # The vessels are replayed at the arrival times, with the vessel types of the trace
+    # The result does not depend on the chunk size
+    with tempfile.TemporaryDirectory() as path:
+        write_trace(path, ARRIVAL_TIMES, VESSEL_TYPES)
+        for chunk_size in [1, 2, 3, 100]:
+            vessels = simulate(path, chunk_size)
+
+            assert [v.uid for v in vessels] == list(range(len(ARRIVAL_TIMES)))
+            assert [v.creation_time for v in vessels] == ARRIVAL_TIMES
+            assert [type(v) for v in vessels] == [ALL_VESSELS[t] for t in VESSEL_TYPES]
+            assert all(v.destination_dock is None for v in vessels)
+
+
+def test2():
+    # The destination docks of the trace are set on the vessels (-1 means not fixed)
+    # Only the first num_vessels_to_generate rows are replayed
+    with tempfile.TemporaryDirectory() as path:
+        write_trace(path, ARRIVAL_TIMES, VESSEL_TYPES, [1, -1, 8, 2, -1, 3, 4])
+        vessels = simulate(path, chunk_size=2, num_vessels_to_generate=5)
+
+        assert [v.creation_time for v in vessels] == ARRIVAL_TIMES[:5]
+        assert [v.destination_dock for v in vessels] == ["1", None, "8", "2", None]
+
+
+def test3():
+    # An empty trace generates no vessels
+    with tempfile.TemporaryDirectory() as path:
+        write_trace(path, [], [])
+        assert simulate(path, chunk_size=2) == []
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
+    test3()
@@ -2,7 +2,8 @@ from pypdevs.DEVS import AtomicDEVS
 
 from dataclasses import dataclass, field
 
-from models.vessels import Vessel
+from models.vessels import Vessel, unpack_vessels
+from models.utils.online_stats import VesselStatistics
 
 
 @dataclass
@@ -10,26 +11,37 @@ class CollectorState:
     vessels: list[Vessel] = field(default_factory=list)
     current_time: float = 0.0
 
+    # Accumulates the statistics of the vessels, see VesselStatistics
+    statistics: VesselStatistics | None = None
+
 
 class VesselCollector(AtomicDEVS):
     """
     A simple collector the collects Vessel's
+
+    The statistics and keep_vessels parameters are the same as for the Sea
     """
 
-    def __init__(self, name):
+    def __init__(self, name, statistics=None, keep_vessels: bool = True):
         super(VesselCollector, self).__init__(name)
+        self.keep_vessels = keep_vessels
         self.in_vessel = self.addInPort("in_vessel")
-        self.state = CollectorState()
+        if statistics is None and not keep_vessels:
+            statistics = VesselStatistics()
+        self.state = CollectorState(statistics=statistics)
 
     def extTransition(self, inputs):
         self.state.current_time += self.elapsed
 
         assert self.in_vessel in inputs
-        vessel = inputs[self.in_vessel]
+        for vessel in unpack_vessels(inputs[self.in_vessel]):
+            assert isinstance(vessel, Vessel)
+            vessel.time_in_system = self.state.current_time - vessel.creation_time
 
-        assert isinstance(vessel, Vessel)
-        vessel.time_in_system = self.state.current_time - vessel.creation_time
+            if self.state.statistics is not None:
+                self.state.statistics.add(vessel)
 
-        self.state.vessels.append(vessel)
+            if self.keep_vessels:
+                self.state.vessels.append(vessel)
 
         return self.state
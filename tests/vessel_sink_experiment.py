@@ -0,0 +1,93 @@
+from pypdevs.simulator import Simulator
+from pypdevs.DEVS import CoupledDEVS
+
+import random
+import tempfile
+import numpy as np
+
+from models.generator import Generator
+from models.port_network import PortNetwork
+from models.sea import Sea
+from models.vessels import ALL_VESSELS, BulkCarrier, CrudeOilTanker
+from models.vessel_sink import VesselSink, load_chunks, load_records
+
+
+class CoupledGenerator(CoupledDEVS):
+    def __init__(self, name, sink):
+        CoupledDEVS.__init__(self, name)
+
+        self.generator = self.addSubModel(Generator("generator", 100))
+        self.sea = self.addSubModel(Sea("sea", keep_vessels=False, sink=sink))
+
+        self.connectPorts(self.generator.out, self.sea.in_vessel)
+
+
+def test1():
+    # The records are written in chunks of chunk_size, and the last partial chunk on close
+    with tempfile.TemporaryDirectory() as path:
+        sink = VesselSink(path, chunk_size=3)
+        for uid in range(7):
+            vessel_ctor = CrudeOilTanker if uid % 2 == 0 else BulkCarrier
+            vessel = vessel_ctor(uid=uid, creation_time=uid)
+            vessel.time_in_system = 10.0 * uid
+            if uid == 4:
+                vessel.served_dock = "8"
+                vessel.waiting_time_in_anchor_point = 1.5
+            sink.add(vessel)
+        assert [len(chunk) for chunk in load_chunks(path)] == [3, 3]
+
+        sink.close()
+        assert [len(chunk) for chunk in load_chunks(path)] == [3, 3, 1]
+        assert all(isinstance(chunk, np.memmap) for chunk in load_chunks(path))
+
+        records = load_records(path)
+        assert records["uid"].tolist() == list(range(7))
+        assert records["type_index"].tolist() == [0, 1, 0, 1, 0, 1, 0]
+        assert records["time_in_system"].tolist() == [10.0 * uid for uid in range(7)]
+        assert records["served_dock"].tolist() == [-1, -1, -1, -1, 8, -1, -1]
+        assert records["waiting_time_in_anchor_point"][4] == 1.5
+        assert np.isnan(records["waiting_time_in_anchor_point"][0])
+
+
+def test2():
+    # The Sea writes the record of each vessel to its sink
+    with tempfile.TemporaryDirectory() as path:
+        sink = VesselSink(path, chunk_size=16)
+        system = CoupledGenerator(name="system", sink=sink)
+        sim = Simulator(system)
+        sim.setTerminationTime(1000000)
+        # sim.setVerbose(None)
+        sim.setClassicDEVS()
+        sim.simulate()
+        sink.close()
+
+        records = load_records(path)
+        assert records["uid"].tolist() == list(range(100))
+        assert np.all(records["time_in_system"] == 0)
+        assert set(records["type_index"].tolist()) <= set(range(len(ALL_VESSELS)))
+        assert system.sea.state.vessels == []
+
+
+def test3():
+    # In the PortNetwork, the records have the dock that served the vessel (not the Sea, where it was routed after)
+    random.seed(0)
+    np.random.seed(0)
+    with tempfile.TemporaryDirectory() as path:
+        sink = VesselSink(path)
+        system = PortNetwork(name="system", keep_vessels=False, sea_sink=sink)
+        sim = Simulator(system)
+        sim.setTerminationTime(7 * 24 * 60 * 60)
+        # sim.setVerbose(None)
+        sim.setClassicDEVS()
+        sim.simulate()
+        sink.close()
+
+        served_docks = set(load_records(path)["served_dock"].tolist())
+        assert len(served_docks) > 1
+        assert served_docks <= set(range(1, 9))
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
+    test3()
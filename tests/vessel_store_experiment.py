@@ -0,0 +1,78 @@
+from pypdevs.simulator import Simulator
+
+import random
+import sys
+import numpy as np
+
+from models.vessel_store import VesselStore
+from models.vessels import CrudeOilTanker, TugBoat, Vessel
+from models.port_network import PortNetwork
+
+
+def test1():
+    # A StoredVessel behaves like a Vessel, its data is in the columns of the store
+    # The columns grow when the store is full
+    store = VesselStore(initial_capacity=1)
+    tanker = store.add(CrudeOilTanker, uid=0, creation_time=1.5)
+    tug_boat = store.add(TugBoat, uid=1, creation_time=2.0)
+
+    assert len(store) == 2
+    assert isinstance(tanker, Vessel)
+    # A StoredVessel only holds the store and its handle
+    assert not hasattr(tanker, "__dict__")
+    assert sys.getsizeof(tanker) < sys.getsizeof(CrudeOilTanker(uid=0, creation_time=1.5))
+    assert (tanker.uid, tanker.creation_time, tanker.vessel_type, tanker.surface_area) == \
+           (0, 1.5, "Crude Oil Tanker", 11007)
+    assert (tug_boat.uid, tug_boat.avg_velocity) == (1, 7.8)
+    assert (tanker.destination_dock, tanker.waiting_time_in_anchor_point, tanker.time_in_system) == (None, None, None)
+
+    tanker.destination_dock = "3"
+    tanker.served_dock = "3"
+    tanker.waiting_time_in_anchor_point = 4.0
+    tanker.time_in_system = 10.0
+    assert (tanker.destination_dock, tanker.waiting_time_in_anchor_point, tanker.time_in_system) == ("3", 4.0, 10.0)
+    assert store.column("exit_time")[0] == 11.5
+    assert tanker.served_dock == "3" and tug_boat.served_dock is None
+
+    # Only the vessels that left the system are in the statistics
+    assert store.time_in_system().tolist() == [10.0]
+    assert store.avg_waiting_time_in_anchor_point() == 4.0
+
+
+def simulate(vessel_store):
+    random.seed(0)
+    np.random.seed(0)
+    system = PortNetwork(name="system", vessel_store=vessel_store)
+    sim = Simulator(system)
+    sim.setTerminationTime(7 * 24 * 60 * 60)
+    # sim.setVerbose(None)
+    sim.setClassicDEVS()
+    sim.simulate()
+    return system
+
+
+def test2():
+    # With a VesselStore, the PortNetwork has the same statistics (computed over the columns)
+    vessels = simulate(None).sea_collector.state.vessels
+    store = VesselStore()
+    system = simulate(store)
+
+    assert len(vessels) != 0
+    assert system.sea_collector.state.vessels == []
+    assert len(store.time_in_system()) == len(vessels)
+    assert np.isclose(store.avg_time_in_system(), np.mean([v.time_in_system for v in vessels]))
+    assert np.isclose(
+        store.avg_waiting_time_in_anchor_point(),
+        np.mean([v.waiting_time_in_anchor_point for v in vessels])
+    )
+
+    # The vessels that left were routed to the Sea, but the store still has the docks that served them
+    served_docks = {store.docks[index] for index in store.column("served_dock")[store.exited()]}
+    assert len(served_docks) > 1
+    assert served_docks == {v.served_dock for v in vessels}
+    assert {store.docks[index] for index in store.column("destination_dock")[store.exited()]} == {"9"}
+
+
+if __name__ == "__main__":
+    test1()
+    test2()
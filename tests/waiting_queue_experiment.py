@@ -0,0 +1,70 @@
+import random
+
+from models.utils.waiting_queue import WaitingQueue
+from models.vessels import ALL_VESSELS, BulkCarrier, CrudeOilTanker, TugBoat
+
+
+def test1():
+    # The first vessel (in arrival order) that fits is found, starting from a position
+    queue = WaitingQueue()
+    queue.append(CrudeOilTanker(uid=0, creation_time=0))  # 11007
+    queue.append(BulkCarrier(uid=1, creation_time=1))  # 5399
+    queue.append(TugBoat(uid=2, creation_time=2))  # 348
+
+    assert len(queue) == 3
+    assert queue.first_fit(20000) == 0
+    assert queue.first_fit(10000) == 1
+    assert queue.first_fit(10000, 2) == 2
+    assert queue.first_fit(100) is None
+
+    assert queue.remove(1).uid == 1
+    assert [v.uid for v in queue] == [0, 2]
+    assert queue.first_fit(10000) == 2
+
+
+def first_fit_transfer(vessels, surface_area):
+    # The list-based transfer of the Lock, as a reference
+    transferred = []
+    still_waiting = []
+    for vessel in vessels:
+        if surface_area - vessel.surface_area >= 0:
+            transferred.append(vessel)
+            surface_area -= vessel.surface_area
+        else:
+            still_waiting.append(vessel)
+    return transferred, still_waiting
+
+
+def test2():
+    # Repeated first-fit transfers give the same result as the list-based transfer
+    # Many appends force the slots to be compacted
+    rng = random.Random(0)
+    queue = WaitingQueue()
+    reference = []
+    uid = 0
+    for _ in range(200):
+        for _ in range(rng.randrange(10)):
+            vessel = rng.choice(ALL_VESSELS)(uid=uid, creation_time=uid)
+            uid += 1
+            queue.append(vessel)
+            reference.append(vessel)
+
+        surface_area = rng.choice([25650, 34000, 62500])
+        transferred, reference = first_fit_transfer(reference, surface_area)
+
+        transferred_from_queue = []
+        position = queue.first_fit(surface_area)
+        while position is not None:
+            vessel = queue.remove(position)
+            transferred_from_queue.append(vessel)
+            surface_area -= vessel.surface_area
+            position = queue.first_fit(surface_area, position + 1)
+
+        assert transferred_from_queue == transferred
+        assert list(queue) == reference
+        assert len(queue) == len(reference)
+
+
+if __name__ == "__main__":
+    test1()
+    test2()